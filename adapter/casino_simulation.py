@@ -1,28 +1,58 @@
 import random
+from typing import Any, Callable
 
 import questionary
 import typer
 
-from domain.casino_entities import HonkGoose, Player, WarGoose
+from adapter.console_sink import ConsoleSink
+from domain.casino_entities import Goose, HonkGoose, Player, WarGoose
 from repository.casino_collections import (
     ChipCollection,
-    GooseCollection,
     IndexDictChip,
     IndexDictGoose,
     IndexDictPlayer,
-    PlayerCollection,
+    IndexedGooseCollection,
+    IndexedPlayerCollection,
 )
 from usecases.casino import Casino
-
-global casino
-casino = Casino(
-    ChipCollection(),
-    PlayerCollection(),
-    GooseCollection(),
-    IndexDictChip(),
-    IndexDictPlayer(),
-    IndexDictGoose(),
-)
+from usecases.events import EventSink, NullSink, SimulationEvent, TeeSink
+from usecases.instrumentation import Instrumentation
+from usecases.loader import LoadReport, load_population
+from usecases.online_stats import BalanceAggregator
+from usecases.simulation import BET_TYPES
+from usecases.snapshot import load_snapshot, save_snapshot
+from usecases.tape import TapeReplayer, TapeSink
+from usecases.watchers import ThresholdWatcher
+
+casino: Casino
+rng: random.Random
+watcher: ThresholdWatcher
+sink: EventSink
+aggregator: BalanceAggregator | None = None
+step = 0
+interactive = True
+goose_counter = 0
+
+
+def init_casino() -> None:
+    """Создание казино, генератора и наблюдателя порогов для запуска"""
+    global casino, rng, watcher, sink, aggregator, interactive, goose_counter
+    rng = random.Random()
+    casino = Casino(
+        ChipCollection(),
+        IndexedPlayerCollection(stable=True),
+        IndexedGooseCollection(stable=True),
+        IndexDictChip(),
+        IndexDictPlayer(),
+        IndexDictGoose(),
+        rng,
+    )
+    watcher = ThresholdWatcher(0, 5000)
+    casino.add_balance_listener(watcher.on_balance_change)
+    sink = ConsoleSink()
+    aggregator = None
+    interactive = True
+    goose_counter = 0
 
 
 def setup_casino() -> None:
@@ -90,14 +120,14 @@ def setup_casino() -> None:
         honk_volume = int(honk_input) if honk_input else 5
 
         if 'Боевой' in goose_type:
-            goose = WarGoose(name, honk_volume)
+            goose = WarGoose(name, honk_volume, rng)
         else:
-            goose = HonkGoose(name, honk_volume)
+            goose = HonkGoose(name, honk_volume, rng)
 
         casino.add_goose(goose)
         typer.secho(
             f"\nГусь с именем '{name}' создан\nТип: {goose.__class__.__name__}\n"
-            f"Громкость: {honk_volume}\n",
+            f'Громкость: {honk_volume}\n',
             fg=typer.colors.BRIGHT_BLUE,
         )
         typer.echo()
@@ -109,13 +139,43 @@ def setup_casino() -> None:
     )
 
 
+def load_casino(
+    players: str | None = None,
+    geese: str | None = None,
+    synthetic: int | None = None,
+    seed: int | None = None,
+) -> LoadReport:
+    """
+    Массовая загрузка игроков и гусей вместо ручной настройки
+
+    Args:
+        players: Файл игроков в CSV или JSON Lines
+        geese: Файл гусей в CSV или JSON Lines
+        synthetic: Количество случайных игроков и гусей, если файл не задан
+        seed: Сид случайных игроков и гусей
+
+    Returns:
+        Итог загрузки
+    """
+    report = load_population(casino, players, geese, synthetic or 0, seed or 0)
+    typer.secho(report.summary(), fg=typer.colors.CYAN)
+    return report
+
+
 def check_game_over() -> bool:
     """Проверка условий окончания игры"""
-    for player in casino.iter_player():
-        if player.balance <= 0:
-            index = casino.player_collection.items.index(player)
-            casino.pop_player(index + 1)
-            typer.secho(f"Игрок '{player.name}' стал банкротом", fg=typer.colors.YELLOW)
+    for player in watcher.drain_bankrupt():
+        casino.remove_player(player)
+        if sink.enabled:
+            sink.emit(
+                SimulationEvent(
+                    step,
+                    'bankrupt',
+                    player=player.name,
+                    player_before=player.balance,
+                    player_after=player.balance,
+                )
+            )
 
     if len(casino.player_collection) == 0:
         typer.secho(
@@ -125,14 +185,13 @@ def check_game_over() -> bool:
         )
         return True
 
-    for player in casino.iter_player():
-        if player.balance >= 5000:
-            typer.secho(
-                f"ИГРОКИ ПОБЕДИЛИ! '{player.name}' достиг баланса {player.balance}!",
-                fg=typer.colors.BRIGHT_GREEN,
-                bold=True,
-            )
-            return True
+    for player in watcher.winners.values():
+        typer.secho(
+            f"ИГРОКИ ПОБЕДИЛИ! '{player.name}' достиг баланса {player.balance}!",
+            fg=typer.colors.BRIGHT_GREEN,
+            bold=True,
+        )
+        return True
 
     return False
 
@@ -140,6 +199,9 @@ def check_game_over() -> bool:
 def show_status() -> None:
     """Показывает текущий статус игры"""
     typer.secho('\nСТАТУС ИГРЫ:\n', fg=typer.colors.CYAN)
+    if aggregator is not None:
+        typer.echo(aggregator.summary())
+        return
     typer.secho('Игроки:', fg=typer.colors.BRIGHT_GREEN)
     for i, player in enumerate(casino.iter_player(), 1):
         typer.echo(f'{i}. {player.name}\nБаланс: {player.balance}\n')
@@ -156,6 +218,9 @@ def show_status() -> None:
 
 def player_bet() -> None:
     """Действие: игрок делает ставку"""
+    if not interactive:
+        random_player_bet()
+        return
     typer.secho('\nСТАВКА ИГРОКА', fg=typer.colors.YELLOW, bold=True)
 
     player_choices = []
@@ -203,109 +268,136 @@ def player_bet() -> None:
     else:
         bet_type = str(bet_type_choice).lower()
 
+    place_bet(player, bet_value, bet_type)
+
+
+def random_player_bet() -> None:
+    """Ставка случайного игрока случайного размера и типа без вопросов"""
+    if not casino.player_collection.items:
+        return
+    player = rng.choice(casino.player_collection)
+    bet_type: int | str = rng.choice(BET_TYPES)
+    if bet_type == 'число':
+        bet_type = rng.randint(0, 36)
+    place_bet(player, rng.randint(1, max(player.balance, 1)), bet_type)
+
+
+def place_bet(player: Player, bet_value: int, bet_type: int | str) -> None:
+    """
+    Ставка игрока с отправкой события в приёмник
+
+    Args:
+        player: Игрок
+        bet_value: Размер ставки
+        bet_type: Число от 0 до 36 или тип ставки
+    """
+    player_name = player.name
+    old_balance = player.balance
     try:
-        old_balance = player.balance
-        result = casino.player_bet(player_name, bet_value, bet_type)
-
-        if result:
-            typer.secho(
-                f'ВЫИГРЫШ! {player_name}: {old_balance} -> {player.balance}',
-                fg=typer.colors.GREEN,
-                bold=True,
+        casino.player_bet(player_name, bet_value, bet_type)
+    except Exception as e:
+        if sink.enabled:
+            sink.emit(
+                SimulationEvent(
+                    step,
+                    'player_bet',
+                    player=player_name,
+                    player_before=old_balance,
+                    player_after=player.balance,
+                    ok=False,
+                    message=str(e),
+                )
             )
-        else:
-            typer.secho(
-                f'ПРОИГРЫШ! {player_name}: {old_balance} -> {player.balance}',
-                fg=typer.colors.RED,
+        return
+    if sink.enabled:
+        sink.emit(
+            SimulationEvent(
+                step,
+                'player_bet',
+                player=player_name,
+                amount=player.balance - old_balance,
+                player_before=old_balance,
+                player_after=player.balance,
             )
-    except Exception as e:
-        typer.secho(f'{e}', fg=typer.colors.RED)
+        )
 
 
-def war_goose_attack() -> None:
-    """Действие: боевой гусь атакует игрока"""
-    typer.secho('\nАТАКА БОЕВОГО ГУСЯ', fg=typer.colors.YELLOW, bold=True)
-
-    war_geese = [goose for goose in casino.iter_goose() if isinstance(goose, WarGoose)]
+def goose_attack(
+    action: str, pick_goose: Callable[[], Any], steal: Callable[[str, str], Any]
+) -> None:
+    """
+    Случайный гусь нужного типа нападает на случайного игрока.
 
-    if not war_geese:
-        typer.secho('Нет боевых гусей!', fg=typer.colors.YELLOW)
+    Args:
+        action: Название действия для события
+        pick_goose: Выбор случайного гуся нужного типа
+        steal: Метод казино, выполняющий нападение
+    """
+    try:
+        goose = pick_goose()
+    except ValueError as e:
+        if sink.enabled:
+            sink.emit(SimulationEvent(step, action, ok=False, message=str(e)))
         return
 
-    goose = random.choice(war_geese)
-    goose_name = goose.name
-    typer.secho(f'Случайно выбран гусь: {goose_name}', fg=typer.colors.YELLOW)
-
-    player = random.choice(casino.iter_player())
-    player_name = player.name
-    typer.secho(f'Случайно выбран игрок: {player_name}', fg=typer.colors.YELLOW)
+    player = rng.choice(casino.player_collection)
+    old_player_balance = player.balance
+    old_goose_balance = goose.balance
 
     try:
-        old_player_balance = player.balance
-        old_goose_balance = goose.balance
-
-        stolen_chip = casino.war_goose_steal_chip(goose_name, player_name)
-
-        typer.secho(
-            f"Гусь '{goose_name}' украл фишку номиналом {stolen_chip.value}",
-            fg=typer.colors.YELLOW,
-        )
-        typer.secho(
-            f'  {player_name}: {old_player_balance} -> {player.balance}',
-            fg=typer.colors.YELLOW,
-        )
-        typer.secho(
-            f'  {goose_name}: {old_goose_balance} -> {goose.balance}',
-            fg=typer.colors.YELLOW,
-        )
+        steal(goose.name, player.name)
     except ValueError as e:
-        typer.secho(f'{e}', fg=typer.colors.YELLOW)
-
-
-def honk_goose_do_honk() -> None:
-    """Действие: гогочущий гусь кричит на игрока"""
-    typer.secho('\nГОГОТАНИЕ ГУСЯ', fg=typer.colors.YELLOW, bold=True)
-
-    honk_geese = [
-        goose for goose in casino.iter_goose() if isinstance(goose, HonkGoose)
-    ]
-
-    if not honk_geese:
-        typer.secho('Нет гогочущих гусей!', fg=typer.colors.YELLOW)
+        if sink.enabled:
+            sink.emit(
+                SimulationEvent(
+                    step,
+                    action,
+                    goose.name,
+                    player.name,
+                    0,
+                    old_player_balance,
+                    old_player_balance,
+                    old_goose_balance,
+                    old_goose_balance,
+                    ok=False,
+                    message=str(e),
+                )
+            )
         return
 
-    goose = random.choice(honk_geese)
-    goose_name = goose.name
-    typer.secho(f'Случайно выбран гусь: {goose_name}', fg=typer.colors.YELLOW)
+    if sink.enabled:
+        sink.emit(
+            SimulationEvent(
+                step,
+                action,
+                goose.name,
+                player.name,
+                goose.balance - old_goose_balance,
+                old_player_balance,
+                player.balance,
+                old_goose_balance,
+                goose.balance,
+            )
+        )
 
-    player = random.choice(casino.iter_player())
-    player_name = player.name
-    typer.secho(f'Случайно выбран игрок: {player_name}', fg=typer.colors.YELLOW)
 
-    try:
-        old_player_balance = player.balance
-        old_goose_balance = goose.balance
+def war_goose_attack() -> None:
+    """Действие: боевой гусь атакует игрока"""
+    goose_attack(
+        'war_goose_attack', casino.random_war_goose, casino.war_goose_steal_chip
+    )
 
-        stolen_value = casino.honk_goose_honk(goose_name, player_name)
 
-        typer.secho(
-            f'Гусь {goose_name} напугал {player_name} и украл {stolen_value}!',
-            fg=typer.colors.YELLOW,
-        )
-        typer.secho(
-            f"Баланс игрока '{player_name}': {old_player_balance} -> {player.balance}",
-            fg=typer.colors.YELLOW,
-        )
-        typer.secho(
-            f"Баланс гуся '{goose_name}': {old_goose_balance} -> {goose.balance}",
-            fg=typer.colors.YELLOW,
-        )
-    except ValueError as e:
-        typer.secho(f'{e}', fg=typer.colors.YELLOW)
+def honk_goose_do_honk() -> None:
+    """Действие: гогочущий гусь кричит на игрока"""
+    goose_attack('honk_goose_do_honk', casino.random_honk_goose, casino.honk_goose_honk)
 
 
 def recreate_goose() -> None:
     """Действие: пересоздание гуся"""
+    if not interactive:
+        random_recreate_goose()
+        return
     typer.secho('\nПЕРЕСОЗДАНИЕ ГУСЯ', fg=typer.colors.YELLOW, bold=True)
 
     goose_choices = []
@@ -329,7 +421,7 @@ def recreate_goose() -> None:
 
     name = questionary.text('Имя нового гуся:').ask()
     if not name:
-        name = f'Goose{random.randint(100, 10000)}'
+        name = f'Goose{rng.randint(100, 10000)}'
 
     goose_type = questionary.select(
         'Тип гуся:', choices=['Боевой (WarGoose)', 'Гогочущий (HonkGoose)']
@@ -343,21 +435,100 @@ def recreate_goose() -> None:
     honk_volume = int(honk_input) if honk_input else 5
 
     if 'Боевой' in goose_type:
-        new_goose = WarGoose(name, honk_volume)
+        new_goose = WarGoose(name, honk_volume, rng)
     else:
-        new_goose = HonkGoose(name, honk_volume)
+        new_goose = HonkGoose(name, honk_volume, rng)
 
-    casino.recreate_goose(old_goose, new_goose)
+    replace_goose(old_goose, new_goose)
 
-    typer.secho(f"Гусь '{old_goose_name}' заменен на '{name}'", fg=typer.colors.YELLOW)
 
+def random_recreate_goose() -> None:
+    """Замена случайного гуся новым гусем случайного типа без вопросов"""
+    global goose_counter
+    if not casino.goose_collection.items:
+        return
+    old_goose = rng.choice(casino.goose_collection)
+    goose_counter += 1
+    kind = WarGoose if rng.random() < 0.5 else HonkGoose
+    replace_goose(old_goose, kind(f'Goose#{goose_counter}', rng.randint(1, 10), rng))
+
+
+def replace_goose(old_goose: Goose, new_goose: Goose) -> None:
+    """
+    Замена гуся с отправкой события в приёмник
+
+    Args:
+        old_goose: Заменяемый гусь
+        new_goose: Новый гусь
+    """
+    old_goose_name = old_goose.name
+    balance = old_goose.balance
+    casino.recreate_goose(old_goose, new_goose)
 
-def run_simulation_casino(steps: int, seed: int) -> None:
-    """Запускает симуляцию казино"""
-    if seed is not None:
-        random.seed(seed)
+    if sink.enabled:
+        sink.emit(
+            SimulationEvent(
+                step,
+                'recreate_goose',
+                goose=old_goose_name,
+                goose_before=balance,
+                goose_after=balance,
+                new_goose=new_goose.name,
+            )
+        )
 
-    setup_casino()
+
+def run_simulation_casino(
+    steps: int,
+    seed: int,
+    quiet: bool = False,
+    instrumentation: Instrumentation | None = None,
+    resume: str | None = None,
+    snapshot: str | None = None,
+    tape: str | None = None,
+    summary: bool = False,
+    players: str | None = None,
+    geese: str | None = None,
+    synthetic: int | None = None,
+) -> None:
+    """
+    Запускает симуляцию казино
+
+    Args:
+        steps: Количество шагов
+        seed: Сид генератора
+        quiet: Не выводить события и статус, не ждать Enter между шагами,
+            ставки и замену гусей выбирать случайно без вопросов, а в конце
+            вместо состава выводить только сводку, если она включена
+        instrumentation: Счётчики для команд и методов казино
+        resume: Снимок, с которого продолжить вместо создания казино
+        snapshot: Файл для снимка казино после симуляции
+        tape: Файл ленты для повтора симуляции
+        summary: Показывать в статусе сводку вместо списка игроков и гусей
+        players: Файл игроков для массовой загрузки
+        geese: Файл гусей для массовой загрузки
+        synthetic: Количество случайных игроков и гусей для массовой загрузки
+    """
+    global sink, step, aggregator, interactive
+    init_casino()
+    if quiet:
+        sink = NullSink()
+        interactive = False
+
+    if resume is not None:
+        load_snapshot(resume, casino)
+        watcher.scan(casino.player_collection)
+    else:
+        rng.seed(seed)
+        if players or geese or synthetic:
+            load_casino(players, geese, synthetic, seed)
+        else:
+            setup_casino()
+    if tape is not None:
+        sink = TeeSink(sink, TapeSink(tape, casino))
+    if summary:
+        aggregator = BalanceAggregator()
+        casino.add_aggregator(aggregator)
 
     commands = {
         1: war_goose_attack,
@@ -365,34 +536,64 @@ def run_simulation_casino(steps: int, seed: int) -> None:
         3: recreate_goose,
         4: player_bet,
     }
+    if instrumentation is not None:
+        instrumentation.instrument_casino(casino)
+        commands = instrumentation.instrument_commands(commands)
 
-    typer.secho('НАЧАЛО СИМУЛЯЦИИ', fg=typer.colors.CYAN, bold=True)
-
-    show_status()
+    if not quiet:
+        typer.secho('НАЧАЛО СИМУЛЯЦИИ', fg=typer.colors.CYAN, bold=True)
+        show_status()
 
     for i in range(steps):
-        number = random.randint(1, 4)
+        step = i + 1
+        number = rng.randint(1, 4)
 
         command = commands[number]
-        command_name = command.__name__
-        typer.secho(f'Действие: {command_name}', fg=typer.colors.YELLOW)
+        if not quiet:
+            typer.secho(f'Действие: {command.__name__}', fg=typer.colors.YELLOW)
 
         try:
             command()
-        except ValueError as e:
-            print(f'{e}')
-        except IndexError as e:
-            print(f'{e}')
+        except (ValueError, IndexError) as e:
+            if not quiet:
+                print(f'{e}')
 
         if check_game_over():
             break
 
-        show_status()
-
-        if i < steps - 1:
-            input('\nНажмите Enter для следующего шага...')
+        if not quiet:
+            show_status()
+            if i < steps - 1:
+                input('\nНажмите Enter для следующего шага...')
 
+    sink.close()
+    if snapshot is not None:
+        save_snapshot(snapshot, casino)
     typer.secho('СИМУЛЯЦИЯ ЗАВЕРШЕНА', fg=typer.colors.CYAN, bold=True)
+    if quiet:
+        # Весь состав может занимать сотни тысяч строк, поэтому тихий
+        # запуск выводит только сводку, если она подключена.
+        if aggregator is not None:
+            typer.echo(aggregator.summary())
+        return
 
     typer.secho('ФИНАЛЬНЫЕ РЕЗУЛЬТАТЫ:', fg=typer.colors.CYAN, bold=True)
     show_status()
+
+
+def replay_tape(path: str, seek: int | None = None) -> None:
+    """
+    Повтор записанной симуляции без генератора и вопросов
+
+    Args:
+        path: Файл ленты
+        seek: Шаг, до которого повторить ленту; по умолчанию до конца
+    """
+    init_casino()
+    replayer = TapeReplayer(path, casino)
+    if seek is None:
+        replayer.run()
+    else:
+        replayer.seek(seek)
+    typer.secho(f'ПОВТОР ДО ШАГА {replayer.step}', fg=typer.colors.CYAN, bold=True)
+    show_status()
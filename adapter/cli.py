@@ -1,8 +1,10 @@
-from adapter import casino_simulation
-import questionary
+from adapter import live_status
+from usecases.instrumentation import Instrumentation
 
 
 def input_args() -> tuple[int, int | None]:
+    import questionary
+
     steps = questionary.text(
         'Введите количество шагов симуляции: ',
         validate=lambda text: text.isdigit(),
@@ -10,7 +12,7 @@ def input_args() -> tuple[int, int | None]:
     seed = questionary.text(
         'Если хотите, можете ввести сид для генерации команд\n'
         'в ином случае нажмите enter: ',
-        validate=lambda text: text.isdigit() or text == "",
+        validate=lambda text: text.isdigit() or text == '',
     ).ask()
 
     if seed == '':
@@ -20,6 +22,62 @@ def input_args() -> tuple[int, int | None]:
     return int(steps), seed
 
 
-def cli():
-    steps, seed = input_args()
-    casino_simulation.run_simulation_casino(steps, seed)
+def cli(
+    quiet: bool = False,
+    stats: bool = False,
+    stats_json: str | None = None,
+    resume: str | None = None,
+    snapshot: str | None = None,
+    tape: str | None = None,
+    replay: str | None = None,
+    seek: int | None = None,
+    summary: bool = False,
+    players: str | None = None,
+    geese: str | None = None,
+    synthetic: int | None = None,
+    live: bool = False,
+    fps: float = live_status.DEFAULT_FPS,
+    steps: int | None = None,
+    seed: int | None = None,
+    next_event: bool = False,
+):
+    # Флаги одного режима не должны молча теряться в другом
+    if next_event and not live:
+        raise ValueError('--next-event работает только вместе с --live')
+    if live and (stats or stats_json):
+        raise ValueError('--stats и --stats-json несовместимы с --live')
+    # Интерактивные модули тянут typer и questionary, поэтому
+    # импортируются только там, где нужны
+    if replay is not None:
+        from adapter import casino_simulation
+
+        casino_simulation.replay_tape(replay, seek)
+        return
+    if steps is None:
+        steps, seed = input_args()
+    if live:
+        live_status.run_live(
+            steps, seed, players, geese, synthetic, fps, next_event=next_event
+        )
+        return
+    from adapter import casino_simulation
+
+    instrumentation = Instrumentation() if stats or stats_json else None
+    casino_simulation.run_simulation_casino(
+        steps,
+        seed,
+        quiet,
+        instrumentation,
+        resume,
+        snapshot,
+        tape,
+        summary,
+        players,
+        geese,
+        synthetic,
+    )
+    if instrumentation is not None:
+        if stats:
+            print(instrumentation.summary())
+        if stats_json:
+            instrumentation.export_json(stats_json)
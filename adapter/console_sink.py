@@ -0,0 +1,95 @@
+import typer
+
+from usecases.events import EventSink, SimulationEvent
+
+
+class ConsoleSink(EventSink):
+    """Цветной вывод событий симуляции в терминал."""
+
+    def emit(self, event: SimulationEvent) -> None:
+        """
+        Вывод события.
+
+        Args:
+            event: Событие симуляции
+        """
+        render = getattr(self, f'render_{event.action}')
+        render(event)
+
+    def render_war_goose_attack(self, event: SimulationEvent) -> None:
+        """Вывод атаки боевого гуся"""
+        typer.secho('\nАТАКА БОЕВОГО ГУСЯ', fg=typer.colors.YELLOW, bold=True)
+        if event.goose is None:
+            typer.secho(event.message, fg=typer.colors.YELLOW)
+            return
+        typer.secho(f'Случайно выбран гусь: {event.goose}', fg=typer.colors.YELLOW)
+        typer.secho(f'Случайно выбран игрок: {event.player}', fg=typer.colors.YELLOW)
+        if not event.ok:
+            typer.secho(event.message, fg=typer.colors.YELLOW)
+            return
+        typer.secho(
+            f"Гусь '{event.goose}' украл фишку номиналом {event.amount}",
+            fg=typer.colors.YELLOW,
+        )
+        typer.secho(
+            f'  {event.player}: {event.player_before} -> {event.player_after}',
+            fg=typer.colors.YELLOW,
+        )
+        typer.secho(
+            f'  {event.goose}: {event.goose_before} -> {event.goose_after}',
+            fg=typer.colors.YELLOW,
+        )
+
+    def render_honk_goose_do_honk(self, event: SimulationEvent) -> None:
+        """Вывод гоготания гуся"""
+        typer.secho('\nГОГОТАНИЕ ГУСЯ', fg=typer.colors.YELLOW, bold=True)
+        if event.goose is None:
+            typer.secho(event.message, fg=typer.colors.YELLOW)
+            return
+        typer.secho(f'Случайно выбран гусь: {event.goose}', fg=typer.colors.YELLOW)
+        typer.secho(f'Случайно выбран игрок: {event.player}', fg=typer.colors.YELLOW)
+        if not event.ok:
+            typer.secho(event.message, fg=typer.colors.YELLOW)
+            return
+        typer.secho(
+            f'Гусь {event.goose} напугал {event.player} и украл {event.amount}!',
+            fg=typer.colors.YELLOW,
+        )
+        typer.secho(
+            f"Баланс игрока '{event.player}': "
+            f'{event.player_before} -> {event.player_after}',
+            fg=typer.colors.YELLOW,
+        )
+        typer.secho(
+            f"Баланс гуся '{event.goose}': {event.goose_before} -> {event.goose_after}",
+            fg=typer.colors.YELLOW,
+        )
+
+    def render_recreate_goose(self, event: SimulationEvent) -> None:
+        """Вывод пересоздания гуся"""
+        typer.secho(
+            f"Гусь '{event.goose}' заменен на '{event.new_goose}'",
+            fg=typer.colors.YELLOW,
+        )
+
+    def render_player_bet(self, event: SimulationEvent) -> None:
+        """Вывод ставки игрока"""
+        if not event.ok:
+            typer.secho(f'{event.message}', fg=typer.colors.RED)
+        elif event.amount > 0:
+            typer.secho(
+                f'ВЫИГРЫШ! {event.player}: {event.player_before} -> '
+                f'{event.player_after}',
+                fg=typer.colors.GREEN,
+                bold=True,
+            )
+        else:
+            typer.secho(
+                f'ПРОИГРЫШ! {event.player}: {event.player_before} -> '
+                f'{event.player_after}',
+                fg=typer.colors.RED,
+            )
+
+    def render_bankrupt(self, event: SimulationEvent) -> None:
+        """Вывод банкротства игрока"""
+        typer.secho(f"Игрок '{event.player}' стал банкротом", fg=typer.colors.YELLOW)
@@ -0,0 +1,253 @@
+import os
+import sys
+import time
+from itertools import islice
+from typing import Callable, TextIO
+
+from domain.casino_entities import Player
+from usecases.casino import Casino
+from usecases.loader import load_population
+from usecases.simulation import SimulationConfig, SimulationEngine, SimulationResult
+
+CSI = '\x1b['
+DEFAULT_FPS = 10.0
+DEFAULT_SUMMARY_INTERVAL = 1.0
+DEFAULT_LIVE_POPULATION = 1000
+LIVE_BATCH_STEPS = 256
+DEFAULT_MAX_ROWS = 20
+NAME_WIDTH = 24
+BALANCE_WIDTH = 12
+
+
+class LiveStatus:
+    """
+    Инкрементальный вывод статуса казино с ограничением частоты кадров.
+
+    Подписывается на изменения балансов и копит имена изменившихся
+    игроков, поэтому шаг симуляции стоит одного добавления в множество.
+    Кадр выводится не чаще fps раз в секунду: изменения между кадрами
+    сливаются. В терминале таблица рисуется один раз, а затем на месте
+    перерисовываются только изменившиеся строки и итоговая строка.
+    Если вывод не терминал, раз в summary_interval секунд печатается
+    одна строка сводки.
+
+    Attributes:
+        casino: Казино
+        stream: Поток вывода
+        tty: Рисовать ли таблицу на месте с помощью ANSI-последовательностей
+        frame_interval: Минимальный интервал между кадрами в терминале
+        summary_interval: Интервал между сводками вне терминала
+        max_rows: Количество игроков в таблице
+        dirty: Имена игроков, изменившихся с прошлого кадра
+        rows: Номер строки таблицы по имени видимого игрока
+        frames: Количество выведенных кадров
+    """
+
+    def __init__(
+        self,
+        casino: Casino,
+        stream: TextIO | None = None,
+        tty: bool | None = None,
+        fps: float = DEFAULT_FPS,
+        summary_interval: float = DEFAULT_SUMMARY_INTERVAL,
+        max_rows: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Инициализация вывода.
+
+        Args:
+            casino: Казино
+            stream: Поток вывода; по умолчанию sys.stdout
+            tty: Режим таблицы; по умолчанию определяется по потоку
+            fps: Максимальная частота кадров в терминале
+            summary_interval: Интервал между сводками вне терминала в секундах
+            max_rows: Количество игроков в таблице; по умолчанию по высоте
+                терминала или DEFAULT_MAX_ROWS
+            clock: Источник времени в секундах
+        """
+        self.casino = casino
+        self.stream = stream if stream is not None else sys.stdout
+        self.tty = self.stream.isatty() if tty is None else tty
+        self.frame_interval = 1 / fps
+        self.summary_interval = summary_interval
+        if max_rows is None:
+            try:
+                max_rows = max(1, os.get_terminal_size(self.stream.fileno()).lines - 3)
+            except (AttributeError, OSError, ValueError):
+                max_rows = DEFAULT_MAX_ROWS
+        self.max_rows = max_rows
+        self.clock = clock
+        self.dirty: set[str] = set()
+        self.rows: dict[str, int] = {}
+        self.drawn = 0
+        self.frames = 0
+        self.last_frame = -float('inf')
+
+    def attach(self) -> None:
+        """Подписка на изменения балансов казино."""
+        self.casino.add_balance_listener(self.on_balance_change)
+
+    def detach(self) -> None:
+        """Отписка от изменений балансов казино."""
+        self.casino.remove_balance_listener(self.on_balance_change)
+
+    def on_balance_change(self, player: Player) -> None:
+        """
+        Учёт изменившегося игрока до следующего кадра.
+
+        Args:
+            player: Игрок, баланс которого изменился
+        """
+        self.dirty.add(player.name)
+
+    def update(self, step: int, force: bool = False) -> bool:
+        """
+        Вывод кадра, если с прошлого прошло достаточно времени.
+
+        Args:
+            step: Текущий шаг симуляции
+            force: Вывести кадр независимо от времени
+
+        Returns:
+            True, если кадр выведен
+        """
+        now = self.clock()
+        interval = self.frame_interval if self.tty else self.summary_interval
+        if not force and now - self.last_frame < interval:
+            return False
+        self.last_frame = now
+        if self.tty:
+            self._draw_table(step)
+        else:
+            self.stream.write(self._footer(step) + '\n')
+        self.dirty.clear()
+        self.frames += 1
+        self.stream.flush()
+        return True
+
+    def close(self, step: int) -> None:
+        """
+        Вывод последнего кадра и отписка от казино.
+
+        Args:
+            step: Последний шаг симуляции
+        """
+        self.update(step, force=True)
+        self.detach()
+
+    def _row(self, name: str) -> str:
+        """
+        Строка таблицы игрока.
+
+        Args:
+            name: Имя игрока
+
+        Returns:
+            Имя и баланс или отметка, что игрок выбыл
+        """
+        try:
+            balance: int | str = self.casino.search_player_balance(name)
+        except ValueError:
+            balance = 'выбыл'
+        return f'{name[:NAME_WIDTH]:<{NAME_WIDTH}} {balance:>{BALANCE_WIDTH}}'
+
+    def _footer(self, step: int) -> str:
+        """
+        Итоговая строка кадра.
+
+        Args:
+            step: Текущий шаг симуляции
+
+        Returns:
+            Шаг, количество игроков и изменений с прошлого кадра
+        """
+        return (
+            f'шаг {step} | игроков {len(self.casino.player_collection)} | '
+            f'изменилось {len(self.dirty)} | кадр {self.frames + 1}'
+        )
+
+    def _draw_table(self, step: int) -> None:
+        """
+        Первый вывод таблицы или перерисовка изменившихся строк.
+
+        Курсор после кадра стоит под итоговой строкой, поэтому до строки
+        игрока с номером i нужно подняться на drawn + 1 - i строк.
+
+        Args:
+            step: Текущий шаг симуляции
+        """
+        write = self.stream.write
+        if not self.frames:
+            write(f'{"Игрок":<{NAME_WIDTH}} {"Баланс":>{BALANCE_WIDTH}}\n')
+            for i, player in enumerate(
+                islice(self.casino.iter_player(), self.max_rows)
+            ):
+                self.rows[player.name] = i
+                write(self._row(player.name) + '\n')
+            self.drawn = len(self.rows)
+            write(self._footer(step) + '\n')
+            return
+        parts = []
+        for name in self.dirty & self.rows.keys():
+            up = self.drawn + 1 - self.rows[name]
+            parts.append(f'{CSI}{up}A\r{CSI}2K{self._row(name)}{CSI}{up}B\r')
+        parts.append(f'{CSI}1A\r{CSI}2K{self._footer(step)}\n')
+        write(''.join(parts))
+
+
+def run_live(
+    steps: int,
+    seed: int | None = None,
+    players: str | None = None,
+    geese: str | None = None,
+    synthetic: int | None = None,
+    fps: float = DEFAULT_FPS,
+    stream: TextIO | None = None,
+    next_event: bool = False,
+) -> SimulationResult:
+    """
+    Автоматическая симуляция с живым статусом вместо пошагового вывода.
+
+    Казино заполняется массовой загрузкой, шаги выполняет
+    SimulationEngine пакетами по LIVE_BATCH_STEPS, а между пакетами
+    LiveStatus решает, пора ли выводить кадр.
+
+    Args:
+        steps: Максимальное количество шагов
+        seed: Сид генератора
+        players: Файл игроков в CSV или JSON Lines
+        geese: Файл гусей в CSV или JSON Lines
+        synthetic: Количество случайных игроков и гусей, если файл не задан;
+            по умолчанию DEFAULT_LIVE_POPULATION
+        fps: Максимальная частота кадров в терминале
+        stream: Поток вывода; по умолчанию sys.stdout
+        next_event: Выполнять шаги планировщиком следующего события
+
+    Returns:
+        Результат симуляции
+    """
+    stream = stream if stream is not None else sys.stdout
+    engine = SimulationEngine(SimulationConfig([], [], next_event=next_event))
+    engine.reset(seed)
+    report = load_population(
+        engine.casino,
+        players,
+        geese,
+        synthetic if synthetic is not None else DEFAULT_LIVE_POPULATION,
+        seed or 0,
+    )
+    stream.write(report.summary() + '\n')
+    status = LiveStatus(engine.casino, stream, fps=fps)
+    status.attach()
+    status.update(engine.step, force=True)
+    remaining = steps
+    while remaining > 0 and engine.winner is None:
+        batch = min(remaining, LIVE_BATCH_STEPS)
+        engine.step_many(batch)
+        remaining -= batch
+        status.update(engine.step)
+    status.close(engine.step)
+    result = engine.result()
+    stream.write(f'Победитель: {result.winner or "нет"}\n')
+    return result
@@ -0,0 +1,226 @@
+import argparse
+import asyncio
+import json
+from typing import Any
+
+from usecases.simulation import SimulationConfig
+from usecases.tables import CasinoTable
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_BALANCE = 10**6
+
+
+class CasinoServer:
+    """
+    Сервер с несколькими столами казино по протоколу JSON Lines.
+
+    Каждая строка запроса — объект JSON с полями table (номер стола),
+    op ('bet', 'attack', 'status'), параметрами операции и
+    необязательным id, который возвращается в ответе. Ответы приходят
+    строками JSON; порядок ответов соблюдается в пределах одного стола.
+
+    Запросы не выполняются сразу: они копятся в очереди стола до
+    следующей итерации цикла событий и затем обрабатываются одним
+    пакетом (CasinoTable.process). Так все ставки, пришедшие от разных
+    клиентов за итерацию, разыгрываются одним вращением колеса.
+
+    Attributes:
+        tables: Столы казино
+        pending: Очередь (запрос, получатель ответа) каждого стола
+        scheduled: Запланирована ли обработка очереди стола
+        batches: Количество обработанных пакетов
+        requests: Количество обработанных запросов
+    """
+
+    def __init__(self, tables: list[CasinoTable]) -> None:
+        """
+        Инициализация сервера.
+
+        Args:
+            tables: Столы казино
+        """
+        self.tables = tables
+        self.pending: list[list[tuple[dict[str, Any], asyncio.StreamWriter]]] = [
+            [] for _ in tables
+        ]
+        self.scheduled = [False] * len(tables)
+        self.batches = 0
+        self.requests = 0
+
+    def submit(self, request: dict[str, Any], writer: asyncio.StreamWriter) -> None:
+        """
+        Постановка запроса в очередь стола.
+
+        Args:
+            request: Разобранный запрос
+            writer: Поток, в который нужно записать ответ
+        """
+        table = request.get('table', 0)
+        if not isinstance(table, int) or not 0 <= table < len(self.tables):
+            self._reply(writer, request, {'ok': False, 'error': 'Нет такого стола'})
+            return
+        self.pending[table].append((request, writer))
+        if not self.scheduled[table]:
+            self.scheduled[table] = True
+            asyncio.get_running_loop().call_soon(self._flush, table)
+
+    def _flush(self, table: int) -> None:
+        """
+        Обработка накопившейся очереди стола одним пакетом.
+
+        Args:
+            table: Номер стола
+        """
+        batch = self.pending[table]
+        self.pending[table] = []
+        self.scheduled[table] = False
+        responses = self.tables[table].process([request for request, _ in batch])
+        for (request, writer), response in zip(batch, responses, strict=True):
+            self._reply(writer, request, response)
+        self.batches += 1
+        self.requests += len(batch)
+
+    @staticmethod
+    def _reply(
+        writer: asyncio.StreamWriter, request: dict[str, Any], response: dict[str, Any]
+    ) -> None:
+        """
+        Запись ответа строкой JSON.
+
+        Args:
+            writer: Поток клиента
+            request: Запрос, на который дан ответ
+            response: Ответ
+        """
+        if writer.is_closing():
+            return
+        if 'id' in request:
+            response['id'] = request['id']
+        writer.write(json.dumps(response, ensure_ascii=False).encode() + b'\n')
+
+    async def handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Обслуживание одного соединения.
+
+        Клиент может отправлять запросы, не дожидаясь ответов; после
+        каждой прочитанной строки сервер ждёт освобождения буфера
+        записи, чтобы медленный клиент не копил ответы в памяти.
+
+        Args:
+            reader: Поток запросов
+            writer: Поток ответов
+        """
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError('Запрос должен быть объектом JSON')
+                except ValueError as error:
+                    self._reply(writer, {}, {'ok': False, 'error': str(error)})
+                else:
+                    self.submit(request, writer)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        path: str | None = None,
+    ) -> asyncio.Server:
+        """
+        Запуск сервера на TCP-порту или Unix-сокете.
+
+        Args:
+            host: Адрес TCP
+            port: Порт TCP; 0 выбирает свободный порт
+            path: Путь к Unix-сокету; если задан, TCP не используется
+
+        Returns:
+            Запущенный сервер asyncio
+        """
+        if path is not None:
+            return await asyncio.start_unix_server(self.handle_client, path)
+        return await asyncio.start_server(self.handle_client, host, port)
+
+
+def make_tables(
+    count: int,
+    players: int,
+    geese: int,
+    balance: int = DEFAULT_BALANCE,
+    seed: int | None = None,
+) -> list[CasinoTable]:
+    """
+    Создание одинаковых столов.
+
+    Игроки называются Игрок0, Игрок1, ..., гуси чередуют типы.
+
+    Args:
+        count: Количество столов
+        players: Количество игроков за столом
+        geese: Количество гусей за столом
+        balance: Начальный баланс игроков
+        seed: Сид; стол i получает сид seed + i
+
+    Returns:
+        Столы казино
+    """
+    config = SimulationConfig(
+        [(f'Игрок{i}', balance) for i in range(players)],
+        [(f'Гусь{i}', 'war' if i % 2 == 0 else 'honk', 5) for i in range(geese)],
+        win_balance=balance * 1000,
+    )
+    return [
+        CasinoTable(config, None if seed is None else seed + i) for i in range(count)
+    ]
+
+
+async def serve(args: argparse.Namespace) -> None:
+    """
+    Запуск сервера до прерывания.
+
+    Args:
+        args: Разобранные аргументы командной строки
+    """
+    server = CasinoServer(
+        make_tables(args.tables, args.players, args.geese, seed=args.seed)
+    )
+    listener = await server.start(args.host, args.port, args.unix)
+    where = args.unix or f'{args.host}:{args.port}'
+    print(f'Сервер казино слушает {where}, столов: {args.tables}')
+    async with listener:
+        await listener.serve_forever()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    Запуск сервера из командной строки.
+
+    Args:
+        argv: Аргументы командной строки
+    """
+    parser = argparse.ArgumentParser(description='Сервер столов казино')
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--unix', metavar='PATH', help='слушать Unix-сокет')
+    parser.add_argument('--tables', type=int, default=8)
+    parser.add_argument('--players', type=int, default=100)
+    parser.add_argument('--geese', type=int, default=20)
+    parser.add_argument('--seed', type=int)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
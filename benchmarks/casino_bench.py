@@ -0,0 +1,399 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from functools import partial
+from typing import Any, Callable
+
+from domain.casino_entities import HonkGoose, Player, WarGoose
+from repository.casino_collections import (
+    ChipCollection,
+    IndexDictChip,
+    IndexDictGoose,
+    IndexDictPlayer,
+    IndexedGooseCollection,
+    IndexedPlayerCollection,
+)
+from usecases.casino import Casino
+from usecases.simulation import SimulationConfig, SimulationEngine
+
+DEFAULT_SIZES = (10, 100, 1000, 10**4, 10**5, 10**6)
+DEFAULT_OPS = 20000
+DEFAULT_THRESHOLD = 0.2
+BALANCE = 10**12
+
+
+class BenchResult:
+    """
+    Результат замера одной операции на одном размере состава.
+
+    Attributes:
+        operation: Название операции
+        size: Количество игроков и гусей в казино
+        ops: Количество выполненных операций
+        ops_per_sec: Пропускная способность
+        p50_ns: Медианная задержка в наносекундах
+        p99_ns: 99-й перцентиль задержки в наносекундах
+    """
+
+    def __init__(
+        self,
+        operation: str,
+        size: int,
+        ops: int,
+        ops_per_sec: float,
+        p50_ns: int,
+        p99_ns: int,
+    ) -> None:
+        """
+        Инициализация результата.
+
+        Args:
+            operation: Название операции
+            size: Размер состава
+            ops: Количество операций
+            ops_per_sec: Операций в секунду
+            p50_ns: Медианная задержка
+            p99_ns: 99-й перцентиль задержки
+        """
+        self.operation = operation
+        self.size = size
+        self.ops = ops
+        self.ops_per_sec = ops_per_sec
+        self.p50_ns = p50_ns
+        self.p99_ns = p99_ns
+
+    @property
+    def key(self) -> str:
+        """
+        Ключ для сравнения с базовой линией.
+
+        Returns:
+            Строка вида 'operation@size'
+        """
+        return f'{self.operation}@{self.size}'
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Преобразование результата в словарь для JSON.
+
+        Returns:
+            Словарь полей результата
+        """
+        return {
+            'operation': self.operation,
+            'size': self.size,
+            'ops': self.ops,
+            'ops_per_sec': round(self.ops_per_sec, 1),
+            'p50_ns': self.p50_ns,
+            'p99_ns': self.p99_ns,
+        }
+
+
+def measure(operation: str, size: int, calls: list[Callable[[], Any]]) -> BenchResult:
+    """
+    Замер задержки каждого вызова и общей пропускной способности.
+
+    Ошибки ValueError считаются обычным исходом операции
+    (неудачная кража, проигрыш гусем равновесия).
+
+    Args:
+        operation: Название операции
+        size: Размер состава
+        calls: Вызовы для замера
+
+    Returns:
+        Результат замера
+    """
+    clock = time.perf_counter_ns
+    latencies = [0] * len(calls)
+    start = clock()
+    for i, call in enumerate(calls):
+        before = clock()
+        try:
+            call()
+        except ValueError:
+            pass
+        latencies[i] = clock() - before
+    total = clock() - start
+    latencies.sort()
+    count = len(latencies)
+    return BenchResult(
+        operation,
+        size,
+        count,
+        count / (total / 1e9) if total else 0.0,
+        latencies[count // 2],
+        latencies[min(count - 1, count * 99 // 100)],
+    )
+
+
+def build_casino(size: int, rng: random.Random) -> Casino:
+    """
+    Создание казино с size игроками и size гусями.
+
+    Args:
+        size: Размер состава
+        rng: Генератор случайных чисел
+
+    Returns:
+        Заполненное казино
+    """
+    casino = Casino(
+        ChipCollection(),
+        IndexedPlayerCollection(),
+        IndexedGooseCollection(),
+        IndexDictChip(),
+        IndexDictPlayer(),
+        IndexDictGoose(),
+        rng,
+    )
+    for i in range(size):
+        casino.add_player(Player(f'Игрок{i}', BALANCE))
+    for i in range(size):
+        kind = WarGoose if i % 2 == 0 else HonkGoose
+        casino.add_goose(kind(f'Гусь{i}', 5, rng))
+    return casino
+
+
+def bench_size(size: int, ops: int, seed: int) -> list[BenchResult]:
+    """
+    Замер всех операций казино на одном размере состава.
+
+    Args:
+        size: Размер состава
+        ops: Количество операций для каждого замера
+        seed: Сид генератора
+
+    Returns:
+        Результаты замеров
+    """
+    rng = random.Random(seed)
+    results = []
+
+    empty = Casino(
+        ChipCollection(),
+        IndexedPlayerCollection(),
+        IndexedGooseCollection(),
+        IndexDictChip(),
+        IndexDictPlayer(),
+        IndexDictGoose(),
+        rng,
+    )
+    players = [Player(f'Игрок{i}', BALANCE) for i in range(size)]
+    results.append(
+        measure(
+            'add_player',
+            size,
+            [partial(empty.add_player, player) for player in players],
+        )
+    )
+
+    casino = build_casino(size, rng)
+    names = [f'Игрок{rng.randrange(size)}' for _ in range(ops)]
+    war = [f'Гусь{2 * rng.randrange((size + 1) // 2)}' for _ in range(ops)]
+    honk = [f'Гусь{2 * rng.randrange(size // 2) + 1}' for _ in range(ops * (size > 1))]
+
+    results.append(
+        measure(
+            'search_player',
+            size,
+            [partial(casino.search_player, name) for name in names],
+        )
+    )
+    results.append(
+        measure(
+            'player_bet',
+            size,
+            [partial(casino.player_bet, name, 1, 'красное') for name in names],
+        )
+    )
+    results.append(
+        measure(
+            'war_goose_steal_chip',
+            size,
+            [
+                partial(casino.war_goose_steal_chip, goose, name)
+                for goose, name in zip(war, names, strict=True)
+            ],
+        )
+    )
+    if honk:
+        results.append(
+            measure(
+                'honk_goose_honk',
+                size,
+                [
+                    partial(casino.honk_goose_honk, goose, name)
+                    for goose, name in zip(honk, names, strict=True)
+                ],
+            )
+        )
+
+    geese = list(casino.goose_collection)
+    replacements = []
+    for i in range(ops):
+        old = geese[i % len(geese)]
+        new = HonkGoose(f'Новый{i}', 5, rng)
+        geese[i % len(geese)] = new
+        replacements.append((old, new))
+    results.append(
+        measure(
+            'recreate_goose',
+            size,
+            [partial(casino.recreate_goose, old, new) for old, new in replacements],
+        )
+    )
+
+    results.append(bench_engine(size, ops, seed))
+    return results
+
+
+def bench_engine(size: int, ops: int, seed: int) -> BenchResult:
+    """
+    Замер шага безголовой симуляции.
+
+    Повторяет тело цикла SimulationEngine.advance, но замеряет каждый
+    шаг отдельно и не строит итоговый результат.
+
+    Args:
+        size: Количество игроков и гусей
+        ops: Количество шагов
+        seed: Сид генератора
+
+    Returns:
+        Результат замера
+    """
+    config = SimulationConfig(
+        [(f'Игрок{i}', BALANCE) for i in range(size)],
+        [(f'Гусь{i}', 'war' if i % 2 == 0 else 'honk', 5) for i in range(size)],
+        win_balance=BALANCE * 2,
+    )
+    engine = SimulationEngine(config)
+    engine.reset(seed)
+    commands = list(engine.commands.values())
+    uniform = engine.rng.random
+    watcher = engine.watcher
+
+    def step() -> None:
+        try:
+            commands[int(uniform() * 4)]()
+        finally:
+            if watcher:
+                engine.settle()
+
+    return measure('engine_step', size, [step] * ops)
+
+
+def compare(
+    results: list[dict[str, Any]],
+    baseline: list[dict[str, Any]],
+    threshold: float,
+) -> list[str]:
+    """
+    Поиск регрессий относительно базовой линии.
+
+    Регрессией считается падение пропускной способности больше чем
+    на долю threshold. Операции, которых нет в базовой линии,
+    пропускаются.
+
+    Args:
+        results: Текущие результаты
+        baseline: Результаты базовой линии
+        threshold: Допустимое относительное падение (0.2 = 20%)
+
+    Returns:
+        Описания найденных регрессий
+    """
+    expected = {f'{row["operation"]}@{row["size"]}': row for row in baseline}
+    regressions = []
+    for row in results:
+        key = f'{row["operation"]}@{row["size"]}'
+        base = expected.get(key)
+        if base is None or not base['ops_per_sec']:
+            continue
+        ratio = row['ops_per_sec'] / base['ops_per_sec']
+        if ratio < 1 - threshold:
+            regressions.append(
+                f'{key}: {row["ops_per_sec"]:.0f} ops/s против '
+                f'{base["ops_per_sec"]:.0f} ({ratio - 1:+.0%})'
+            )
+    return regressions
+
+
+def format_table(results: list[BenchResult]) -> str:
+    """
+    Форматирование результатов в текстовую таблицу.
+
+    Args:
+        results: Результаты замеров
+
+    Returns:
+        Таблица с заголовком
+    """
+    lines = [
+        f'{"операция":<22}{"размер":>10}{"ops/s":>14}{"p50, нс":>10}{"p99, нс":>10}'
+    ]
+    for result in results:
+        lines.append(
+            f'{result.operation:<22}{result.size:>10}{result.ops_per_sec:>14.0f}'
+            f'{result.p50_ns:>10}{result.p99_ns:>10}'
+        )
+    return '\n'.join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Запуск набора замеров из командной строки.
+
+    Args:
+        argv: Аргументы командной строки
+
+    Returns:
+        Код выхода: 1 при найденных регрессиях
+    """
+    parser = argparse.ArgumentParser(description='Замеры операций казино')
+    parser.add_argument(
+        '--sizes',
+        type=lambda text: [int(size) for size in text.split(',')],
+        default=list(DEFAULT_SIZES),
+        help='размеры состава через запятую',
+    )
+    parser.add_argument('--ops', type=int, default=DEFAULT_OPS)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='файл для результатов в JSON')
+    parser.add_argument('--baseline', help='JSON с результатами для сравнения')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    results = []
+    for size in args.sizes:
+        results.extend(bench_size(size, args.ops, args.seed))
+    print(format_table(results))
+
+    rows = [result.to_dict() for result in results]
+    if args.output:
+        report = {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'ops': args.ops,
+            'results': rows,
+        }
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as file:
+            baseline = json.load(file)['results']
+        regressions = compare(rows, baseline, args.threshold)
+        for regression in regressions:
+            print(f'РЕГРЕССИЯ {regression}', file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
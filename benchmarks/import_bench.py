@@ -0,0 +1,133 @@
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_MODULES = ('main', 'adapter.live_status', 'usecases.simulation')
+DEFAULT_RUNS = 5
+DEFAULT_BUDGET_MS = 150.0
+FORBIDDEN = ('typer', 'questionary', 'numpy')
+
+
+def parse_importtime(output: str) -> dict[str, int]:
+    """
+    Разбор вывода python -X importtime.
+
+    Args:
+        output: Содержимое stderr процесса
+
+    Returns:
+        Время импорта каждого модуля вместе с вложенными в микросекундах
+    """
+    cumulative = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line.split(':', 1)[1].split('|')
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        cumulative[fields[2].strip()] = int(fields[1])
+    return cumulative
+
+
+def measure(module: str, runs: int = DEFAULT_RUNS) -> dict[str, Any]:
+    """
+    Замер холодного импорта модуля в отдельных процессах.
+
+    Args:
+        module: Имя модуля
+        runs: Количество процессов
+
+    Returns:
+        Медиана и минимум времени импорта в миллисекундах и загруженные
+        пакеты из FORBIDDEN
+    """
+    times = []
+    forbidden = set()
+    for _ in range(runs):
+        process = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        cumulative = parse_importtime(process.stderr)
+        times.append(cumulative[module] / 1e3)
+        forbidden.update(
+            name.split('.')[0] for name in cumulative if name.split('.')[0] in FORBIDDEN
+        )
+    return {
+        'module': module,
+        'median_ms': statistics.median(times),
+        'min_ms': min(times),
+        'forbidden': sorted(forbidden),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Замер времени запуска из командной строки.
+
+    Args:
+        argv: Аргументы командной строки
+
+    Returns:
+        Код выхода: 1, если первый модуль превысил бюджет или какой-либо
+        модуль загрузил пакет из FORBIDDEN
+    """
+    parser = argparse.ArgumentParser(description='Замер времени импорта')
+    parser.add_argument(
+        '--modules',
+        type=lambda text: text.split(','),
+        default=list(DEFAULT_MODULES),
+        help='модули через запятую; бюджет проверяется для первого',
+    )
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS)
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument('--output', help='файл для результатов в JSON')
+    args = parser.parse_args(argv)
+
+    results = [measure(module, args.runs) for module in args.modules]
+    print(f'{"модуль":<24} {"медиана, мс":>12} {"минимум, мс":>12}  лишнее')
+    for result in results:
+        print(
+            f'{result["module"]:<24} {result["median_ms"]:>12.1f} '
+            f'{result["min_ms"]:>12.1f}  {", ".join(result["forbidden"]) or "-"}'
+        )
+
+    if args.output:
+        report = {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'runs': args.runs,
+            'results': results,
+        }
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+
+    failed = False
+    if results and results[0]['median_ms'] > args.budget_ms:
+        print(
+            f'ПРЕВЫШЕН БЮДЖЕТ {results[0]["module"]}: '
+            f'{results[0]["median_ms"]:.1f} мс > {args.budget_ms:.1f} мс',
+            file=sys.stderr,
+        )
+        failed = True
+    for result in results:
+        if result['forbidden']:
+            print(
+                f'ЛИШНИЙ ИМПОРТ {result["module"]}: {", ".join(result["forbidden"])}',
+                file=sys.stderr,
+            )
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,284 @@
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from typing import Any, Awaitable, Callable
+
+from adapter.server import DEFAULT_HOST, DEFAULT_PORT, CasinoServer, make_tables
+
+DEFAULT_CONNECTIONS = 16
+DEFAULT_REQUESTS = 20000
+DEFAULT_WINDOW = 32
+DEFAULT_MIX = (0.7, 0.2, 0.1)
+BET_TYPES: tuple[int | str, ...] = ('красное', 'чёрное', 'чётное', 'нечётное', 17)
+
+Connection = Callable[[], Awaitable[tuple[asyncio.StreamReader, asyncio.StreamWriter]]]
+
+
+class RequestFactory:
+    """
+    Случайные запросы к серверу столов.
+
+    Attributes:
+        rng: Генератор случайных чисел
+        tables: Количество столов
+        players: Количество игроков за столом
+        mix: Доли ставок, нападений и запросов статуса
+    """
+
+    def __init__(
+        self,
+        rng: random.Random,
+        tables: int,
+        players: int,
+        mix: tuple[float, float, float] = DEFAULT_MIX,
+    ) -> None:
+        """
+        Инициализация генератора запросов.
+
+        Args:
+            rng: Генератор случайных чисел
+            tables: Количество столов
+            players: Количество игроков за столом
+            mix: Доли ставок, нападений и запросов статуса
+        """
+        self.rng = rng
+        self.tables = tables
+        self.players = players
+        self.mix = mix
+
+    def __call__(self) -> dict[str, Any]:
+        """
+        Создание следующего запроса.
+
+        Returns:
+            Запрос без поля id
+        """
+        rng = self.rng
+        request: dict[str, Any] = {
+            'table': int(rng.random() * self.tables),
+            'player': f'Игрок{int(rng.random() * self.players)}',
+        }
+        roll = rng.random()
+        bet_share, attack_share, _ = self.mix
+        if roll < bet_share:
+            request['op'] = 'bet'
+            request['value'] = 1
+            request['bet'] = BET_TYPES[int(rng.random() * len(BET_TYPES))]
+        elif roll < bet_share + attack_share:
+            request['op'] = 'attack'
+            request['kind'] = 'war' if rng.random() < 0.5 else 'honk'
+        else:
+            request['op'] = 'status'
+        return request
+
+
+async def drive_connection(
+    connect: Connection,
+    count: int,
+    window: int,
+    make_request: Callable[[], dict[str, Any]],
+    latencies: list[int],
+) -> int:
+    """
+    Отправка запросов по одному соединению с ограничением в полёте.
+
+    Args:
+        connect: Открытие соединения с сервером
+        count: Количество запросов
+        window: Максимальное количество запросов без ответа
+        make_request: Генератор запросов
+        latencies: Список, в который добавляются задержки в наносекундах
+
+    Returns:
+        Количество ответов с ok=False
+    """
+    clock = time.perf_counter_ns
+    reader, writer = await connect()
+    sent: dict[int, int] = {}
+    credits = asyncio.Semaphore(window)
+    failures = 0
+
+    async def receive() -> None:
+        nonlocal failures
+        for _ in range(count):
+            response = json.loads(await reader.readline())
+            latencies.append(clock() - sent.pop(response['id']))
+            if not response['ok']:
+                failures += 1
+            credits.release()
+
+    receiver = asyncio.create_task(receive())
+    for i in range(count):
+        await credits.acquire()
+        request = make_request()
+        request['id'] = i
+        sent[i] = clock()
+        writer.write(json.dumps(request, ensure_ascii=False).encode() + b'\n')
+        await writer.drain()
+    await receiver
+    writer.close()
+    await writer.wait_closed()
+    return failures
+
+
+async def run_load(
+    connect: Connection,
+    connections: int,
+    requests: int,
+    window: int,
+    tables: int,
+    players: int,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """
+    Нагрузка сервера несколькими соединениями.
+
+    Args:
+        connect: Открытие соединения с сервером
+        connections: Количество соединений
+        requests: Общее количество запросов
+        window: Запросов в полёте на одно соединение
+        tables: Количество столов на сервере
+        players: Количество игроков за столом
+        seed: Сид генератора запросов
+
+    Returns:
+        Отчёт: количество запросов и неудач, время, пропускная
+        способность и перцентили задержки в микросекундах
+    """
+    latencies: list[int] = []
+    share, rest = divmod(requests, connections)
+    start = time.perf_counter()
+    failures = await asyncio.gather(
+        *(
+            drive_connection(
+                connect,
+                share + (i < rest),
+                window,
+                RequestFactory(random.Random(seed + i), tables, players),
+                latencies,
+            )
+            for i in range(connections)
+        )
+    )
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    count = len(latencies)
+
+    def percentile(fraction: float) -> float:
+        return latencies[min(count - 1, int(count * fraction))] / 1e3 if count else 0.0
+
+    return {
+        'requests': count,
+        'failures': sum(failures),
+        'seconds': elapsed,
+        'requests_per_sec': count / elapsed if elapsed else 0.0,
+        'p50_us': percentile(0.5),
+        'p99_us': percentile(0.99),
+        'p999_us': percentile(0.999),
+        'max_us': latencies[-1] / 1e3 if count else 0.0,
+    }
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """
+    Форматирование отчёта нагрузки.
+
+    Args:
+        report: Отчёт run_load
+
+    Returns:
+        Текст отчёта
+    """
+    lines = [
+        f'запросов: {report["requests"]} (неудачных действий: {report["failures"]})',
+        f'время: {report["seconds"]:.2f} с, {report["requests_per_sec"]:.0f} req/s',
+        f'задержка, мкс: p50 {report["p50_us"]:.0f}, p99 {report["p99_us"]:.0f}, '
+        f'p99.9 {report["p999_us"]:.0f}, max {report["max_us"]:.0f}',
+    ]
+    if 'batch_size' in report:
+        lines.append(f'средний пакет стола: {report["batch_size"]:.1f} запросов')
+    return '\n'.join(lines)
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """
+    Нагрузка внешнего сервера или сервера, запущенного в этом процессе.
+
+    Args:
+        args: Разобранные аргументы командной строки
+
+    Returns:
+        Отчёт нагрузки
+    """
+    server = None
+    host, port, path = args.host, args.port, args.unix
+    if args.spawn:
+        server = CasinoServer(
+            make_tables(args.tables, args.players, args.geese, seed=args.seed)
+        )
+        listener = await server.start(host, 0, path)
+        if path is None:
+            port = listener.sockets[0].getsockname()[1]
+
+    async def connect() -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        if path is not None:
+            return await asyncio.open_unix_connection(path)
+        return await asyncio.open_connection(host, port)
+
+    report = await run_load(
+        connect,
+        args.connections,
+        args.requests,
+        args.window,
+        args.tables,
+        args.players,
+        args.seed,
+    )
+    if server is not None:
+        report['batch_size'] = server.requests / max(server.batches, 1)
+        listener.close()
+        await listener.wait_closed()
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Запуск генератора нагрузки из командной строки.
+
+    Args:
+        argv: Аргументы командной строки
+
+    Returns:
+        Код выхода
+    """
+    parser = argparse.ArgumentParser(description='Нагрузка сервера столов казино')
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--unix', metavar='PATH', help='подключаться к Unix-сокету')
+    parser.add_argument(
+        '--spawn', action='store_true', help='запустить сервер в этом же процессе'
+    )
+    parser.add_argument('--connections', type=int, default=DEFAULT_CONNECTIONS)
+    parser.add_argument('--requests', type=int, default=DEFAULT_REQUESTS)
+    parser.add_argument('--window', type=int, default=DEFAULT_WINDOW)
+    parser.add_argument('--tables', type=int, default=8)
+    parser.add_argument('--players', type=int, default=100)
+    parser.add_argument('--geese', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='файл для отчёта в JSON')
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run(args))
+    print(format_report(report))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
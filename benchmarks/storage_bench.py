@@ -0,0 +1,94 @@
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+from usecases.simulation import SimulationConfig, SimulationEngine
+
+DEFAULT_SIZE = 10**6
+DEFAULT_STEPS = 300_000
+
+
+def measure(columnar: bool, size: int, steps: int) -> dict[str, Any]:
+    """
+    Замер памяти и скорости движка с одним из хранилищ.
+
+    Строки имён создаются до начала замера и общие для обоих хранилищ,
+    поэтому в байты на сущность не входят.
+
+    Args:
+        columnar: Использовать столбцовое хранилище
+        size: Количество игроков и количество гусей
+        steps: Количество шагов step_many
+
+    Returns:
+        Байты на сущность, время построения и время шагов в секундах
+    """
+    players = [(f'Player{i}', 1000) for i in range(size)]
+    geese = [(f'Goose{i}', ('war', 'honk')[i % 2], i % 10 + 1) for i in range(size)]
+    config = SimulationConfig(players, geese, win_balance=10**9, columnar=columnar)
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    engine = SimulationEngine(config)
+    build = time.perf_counter() - started
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    engine.step_many(steps)
+    run = time.perf_counter() - started
+    return {
+        'storage': 'columnar' if columnar else 'objects',
+        'bytes_per_entity': current / (2 * size),
+        'build_s': build,
+        'steps_s': run,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Сравнение объектного и столбцового хранилищ из командной строки.
+
+    Args:
+        argv: Аргументы командной строки
+
+    Returns:
+        Код выхода
+    """
+    parser = argparse.ArgumentParser(description='Замер хранилищ казино')
+    parser.add_argument('--size', type=int, default=DEFAULT_SIZE)
+    parser.add_argument('--steps', type=int, default=DEFAULT_STEPS)
+    parser.add_argument('--output', help='файл для результатов в JSON')
+    args = parser.parse_args(argv)
+
+    results = [measure(columnar, args.size, args.steps) for columnar in (False, True)]
+    print(
+        f'{"хранилище":<10} {"байт/сущность":>14} {"построение, с":>14} {"шаги, с":>9}'
+    )
+    for result in results:
+        print(
+            f'{result["storage"]:<10} {result["bytes_per_entity"]:>14.1f} '
+            f'{result["build_s"]:>14.2f} {result["steps_s"]:>9.2f}'
+        )
+
+    if args.output:
+        report = {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'size': args.size,
+            'steps': args.steps,
+            'results': results,
+        }
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
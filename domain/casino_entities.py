@@ -1,5 +1,7 @@
 import random
 
+from domain.rng import RandomSource
+
 
 class Player:
     """
@@ -10,6 +12,8 @@ class Player:
         balance: Баланс игрока
     """
 
+    __slots__ = ('name', 'balance')
+
     def __init__(self, name: str, balance: int):
         """
         Инициализация игрока.
@@ -30,24 +34,44 @@ class Goose:
         name: Имя гуся
         honk_volume: Громкость гоготания
         balance: Баланс гуся (украденные деньги)
+        rng: Генератор случайных чисел гуся
     """
 
-    def __init__(self, name: str, honk_volume: int):
+    __slots__ = ('name', 'honk_volume', 'balance', 'rng')
+
+    def __init__(self, name: str, honk_volume: int, rng: RandomSource = random):
         """
         Инициализация гуся.
 
         Args:
             name: Имя гуся
             honk_volume: Громкость гоготания
+            rng: Генератор случайных чисел (по умолчанию глобальный random)
         """
         self.name = name
         self.honk_volume = honk_volume
         self.balance = 0
+        self.rng = rng
 
 
 class WarGoose(Goose):
     """Боевой гусь, способный воровать фишки."""
 
+    __slots__ = ()
+
+    @staticmethod
+    def steal_probability(honk_volume: int) -> float:
+        """
+        Вероятность удачной попытки steal_chip.
+
+        Args:
+            honk_volume: Громкость гоготания гуся
+
+        Returns:
+            Доля исходов randint(1, 50), при которых кража удаётся
+        """
+        return min(50, max(0, 20 + honk_volume)) / 50
+
     def steal_chip(self) -> int:
         """
         Попытка украсть фишку.
@@ -55,14 +79,30 @@ class WarGoose(Goose):
         Returns:
             Случайное значение от 1 до 100 при успехе, 0 при неудаче
         """
-        if (random.randint(1, 50) + self.honk_volume) > 30:
-            return random.randint(1, 100)
+        if (self.rng.randint(1, 50) + self.honk_volume) > 30:
+            return self.rng.randint(1, 100)
         return 0
 
 
 class HonkGoose(Goose):
     """Гогочущий гусь, способный пугать игроков громким криком."""
 
+    __slots__ = ()
+
+    @staticmethod
+    def honk_probability(honk_volume: int) -> float:
+        """
+        Вероятность удачной попытки honk.
+
+        Args:
+            honk_volume: Громкость гоготания гуся
+
+        Returns:
+            Доля исходов randint(1, 100), при которых крик удаётся;
+            крик нулевой громкости не засчитывается
+        """
+        return 0.8 if honk_volume else 0.0
+
     def honk(self) -> int:
         """
         Попытка издать громкий крик.
@@ -70,7 +110,7 @@ class HonkGoose(Goose):
         Returns:
             Громкость крика при успехе, 0 при неудаче
         """
-        if random.randint(1, 100) > 20:
+        if self.rng.randint(1, 100) > 20:
             return self.honk_volume
         return 0
 
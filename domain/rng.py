@@ -0,0 +1,159 @@
+import hashlib
+import random
+from typing import Any, Protocol
+
+
+class RandomSource(Protocol):
+    """
+    Минимальный интерфейс генератора случайных чисел.
+
+    Ему удовлетворяют модуль random, экземпляры random.Random
+    и обёртка NumpyRandom над numpy.random.Generator.
+    """
+
+    def random(self) -> float:
+        """Случайное число из [0, 1)."""
+        ...
+
+    def randint(self, a: int, b: int) -> int:
+        """Случайное целое из [a, b]."""
+        ...
+
+
+class NumpyRandom:
+    """
+    Адаптер numpy.random.Generator к интерфейсу RandomSource.
+
+    Attributes:
+        generator: Генератор NumPy
+    """
+
+    def __init__(self, generator: Any) -> None:
+        """
+        Инициализация адаптера.
+
+        Args:
+            generator: Экземпляр numpy.random.Generator
+        """
+        self.generator = generator
+
+    def random(self) -> float:
+        """
+        Случайное число из [0, 1).
+
+        Returns:
+            Случайное число
+        """
+        return float(self.generator.random())
+
+    def randint(self, a: int, b: int) -> int:
+        """
+        Случайное целое из [a, b].
+
+        Args:
+            a: Нижняя граница
+            b: Верхняя граница (включительно)
+
+        Returns:
+            Случайное целое
+        """
+        return int(self.generator.integers(a, b + 1))
+
+
+class SeedSequence:
+    """
+    Иерархия независимых воспроизводимых сидов.
+
+    Каждый потомок получает ключ (путь в дереве порождения), а его
+    состояние вычисляется хешированием энтропии корня вместе с ключом.
+    Поэтому потоки разных потомков статистически независимы и не зависят
+    от порядка, в котором их запрашивают параллельные воркеры.
+
+    Attributes:
+        entropy: Энтропия корня (исходный сид)
+        spawn_key: Путь потомка в дереве порождения
+        n_children_spawned: Количество уже порождённых потомков
+    """
+
+    def __init__(self, entropy: int, spawn_key: tuple[int, ...] = ()) -> None:
+        """
+        Инициализация последовательности сидов.
+
+        Args:
+            entropy: Исходный сид
+            spawn_key: Путь потомка в дереве порождения
+
+        Raises:
+            ValueError: Если энтропия отрицательна
+        """
+        if entropy < 0:
+            raise ValueError('Сид должен быть неотрицательным')
+        self.entropy = entropy
+        self.spawn_key = spawn_key
+        self.n_children_spawned = 0
+
+    def spawn(self, n: int) -> list['SeedSequence']:
+        """
+        Порождение независимых потомков.
+
+        Повторный вызов продолжает нумерацию, а не повторяет потомков.
+
+        Args:
+            n: Количество потомков
+
+        Returns:
+            Список потомков
+        """
+        start = self.n_children_spawned
+        self.n_children_spawned += n
+        return [
+            SeedSequence(self.entropy, self.spawn_key + (i,))
+            for i in range(start, start + n)
+        ]
+
+    def generate_state(self) -> int:
+        """
+        Вычисление 256-битного состояния для инициализации генератора.
+
+        Returns:
+            Состояние в виде целого числа
+        """
+        digest = hashlib.sha256(repr((self.entropy, self.spawn_key)).encode())
+        return int.from_bytes(digest.digest(), 'little')
+
+    def random(self) -> random.Random:
+        """
+        Создание генератора random.Random для этой последовательности.
+
+        Returns:
+            Новый генератор
+        """
+        return random.Random(self.generate_state())
+
+    def numpy(self) -> NumpyRandom:
+        """
+        Создание генератора NumPy для этой последовательности.
+
+        Returns:
+            Адаптер над numpy.random.Generator
+
+        Raises:
+            ImportError: Если NumPy не установлен
+        """
+        import numpy as np
+
+        return NumpyRandom(np.random.default_rng(self.generate_state()))
+
+
+def spawn_rngs(seed: int, n: int) -> list[random.Random]:
+    """
+    Создание n независимых генераторов из одного сида.
+
+    Args:
+        seed: Исходный сид
+        n: Количество генераторов
+
+    Returns:
+        Список генераторов random.Random
+    """
+    return [child.random() for child in SeedSequence(seed).spawn(n)]
@@ -0,0 +1,99 @@
+RED_NUMBERS = frozenset(
+    {1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36}
+)
+
+NUMBER_COLOUR: tuple[str, ...] = tuple(
+    'зелёное' if number == 0 else 'красное' if number in RED_NUMBERS else 'чёрное'
+    for number in range(37)
+)
+NUMBER_PARITY: tuple[str, ...] = tuple(
+    'зеро' if number == 0 else 'чётное' if number % 2 == 0 else 'нечётное'
+    for number in range(37)
+)
+
+BET_EVEN = -1
+BET_ODD = -2
+BET_RED = -3
+BET_BLACK = -4
+BET_INVALID = -5
+BET_INVALID_NUMBER = 37
+
+BET_CODES: dict[str, int] = {
+    'чётное': BET_EVEN,
+    'четное': BET_EVEN,
+    'нечётное': BET_ODD,
+    'нечетное': BET_ODD,
+    'красное': BET_RED,
+    'чёрное': BET_BLACK,
+    'черное': BET_BLACK,
+}
+
+STRAIGHT_PAYOUT = 35
+OUTSIDE_PAYOUT = 2
+
+
+def encode_bet(bet_type: int | str) -> int:
+    """
+    Перевод типа ставки в числовой код.
+
+    Числа 0-36 кодируются сами собой, внешние ставки отрицательными кодами.
+
+    Args:
+        bet_type: Число или строка типа 'чётное', 'красное'
+
+    Returns:
+        Код ставки, BET_INVALID_NUMBER для числа вне 0-36
+        и BET_INVALID для неизвестной строки
+    """
+    if isinstance(bet_type, int):
+        return bet_type if 0 <= bet_type <= 36 else BET_INVALID_NUMBER
+    return BET_CODES.get(bet_type, BET_INVALID)
+
+
+BET_WINS_ON: dict[int, tuple[str, ...]] = {
+    BET_EVEN: NUMBER_PARITY,
+    BET_ODD: NUMBER_PARITY,
+    BET_RED: NUMBER_COLOUR,
+    BET_BLACK: NUMBER_COLOUR,
+}
+BET_OUTCOME: dict[int, str] = {
+    BET_EVEN: 'чётное',
+    BET_ODD: 'нечётное',
+    BET_RED: 'красное',
+    BET_BLACK: 'чёрное',
+}
+
+
+def payout_multiplier(code: int, number: int) -> int:
+    """
+    Во сколько раз ставка возвращается игроку при выпадении числа.
+
+    Args:
+        code: Корректный код ставки
+        number: Выпавшее число
+
+    Returns:
+        Множитель выплаты, 0 при проигрыше
+    """
+    if code >= 0:
+        return STRAIGHT_PAYOUT if code == number else 0
+    if BET_WINS_ON[code][number] == BET_OUTCOME[code]:
+        return OUTSIDE_PAYOUT
+    return 0
+
+
+# Строка code - BET_BLACK, столбец выпавшее число
+PAYOUT_TABLE: tuple[tuple[int, ...], ...] = tuple(
+    tuple(payout_multiplier(code, number) for number in range(37))
+    for code in range(BET_BLACK, 37)
+)
+
+# Для каждого числа: выигравшие коды ставок и их множители
+WINNING_BETS: tuple[tuple[tuple[int, int], ...], ...] = tuple(
+    tuple(
+        (code, payout_multiplier(code, number))
+        for code in range(BET_BLACK, 37)
+        if payout_multiplier(code, number)
+    )
+    for number in range(37)
+)
@@ -0,0 +1,166 @@
+import math
+from typing import Sequence
+
+from domain.rng import RandomSource
+
+
+class AliasTable:
+    """
+    Таблица псевдонимов Воуза для выбора индекса с заданными весами.
+
+    Построение занимает O(n), каждый выбор O(1) и один вызов random():
+    индекс столбца и порог берутся из одного равномерного числа.
+
+    Attributes:
+        probability: Вероятность оставить выбранный столбец
+        alias: Индекс, на который заменяется столбец
+    """
+
+    def __init__(self, weights: Sequence[float]) -> None:
+        """
+        Построение таблицы.
+
+        Args:
+            weights: Неотрицательные веса, хотя бы один положительный
+
+        Raises:
+            ValueError: Если весов нет, есть отрицательный вес
+                или сумма весов равна нулю
+        """
+        size = len(weights)
+        total = float(sum(weights))
+        if not size or total <= 0 or min(weights) < 0:
+            raise ValueError('Веса должны быть неотрицательными и не все нулевыми')
+        scaled = [weight * size / total for weight in weights]
+        self.probability = [1.0] * size
+        self.alias = list(range(size))
+        small = [i for i, value in enumerate(scaled) if value < 1.0]
+        large = [i for i, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self.probability[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] += scaled[less] - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+
+    def __len__(self) -> int:
+        """
+        Получение количества исходов.
+
+        Returns:
+            Количество весов
+        """
+        return len(self.probability)
+
+    def sample(self, rng: RandomSource) -> int:
+        """
+        Выбор индекса пропорционально весам.
+
+        Args:
+            rng: Генератор случайных чисел
+
+        Returns:
+            Индекс от 0 до len - 1
+        """
+        size = len(self.probability)
+        point = rng.random() * size
+        column = int(point)
+        if column == size:
+            column -= 1
+        if point - column < self.probability[column]:
+            return column
+        return self.alias[column]
+
+
+def binomial(rng: RandomSource, n: int, p: float) -> int:
+    """
+    Число успехов в n независимых испытаниях с вероятностью p.
+
+    При n * p < 10 суммируются геометрические промежутки между успехами,
+    иначе используется выборка с отклонением BTRS (Хёрманн, 1993), поэтому
+    время не зависит от n.
+
+    Args:
+        rng: Генератор случайных чисел
+        n: Количество испытаний
+        p: Вероятность успеха
+
+    Returns:
+        Целое от 0 до n
+
+    Raises:
+        ValueError: Если n отрицательно
+    """
+    if n < 0:
+        raise ValueError('Количество испытаний должно быть неотрицательным')
+    if p <= 0.0 or n == 0:
+        return 0
+    if p >= 1.0:
+        return n
+    if p > 0.5:
+        return n - binomial(rng, n, 1.0 - p)
+    if n * p < 10.0:
+        successes = trials = 0
+        scale = math.log1p(-p)
+        while True:
+            trials += int(math.log(1.0 - rng.random()) / scale) + 1
+            if trials > n:
+                return successes
+            successes += 1
+    spread = math.sqrt(n * p * (1.0 - p))
+    b = 1.15 + 2.53 * spread
+    a = -0.0873 + 0.0248 * b + 0.01 * p
+    c = n * p + 0.5
+    v_r = 0.92 - 4.2 / b
+    alpha = (2.83 + 5.1 / b) * spread
+    odds = math.log(p / (1.0 - p))
+    mode = int((n + 1) * p)
+    h = math.lgamma(mode + 1) + math.lgamma(n - mode + 1)
+    while True:
+        u = rng.random() - 0.5
+        v = rng.random()
+        us = 0.5 - abs(u)
+        k = math.floor((2 * a / us + b) * u + c)
+        if k < 0 or k > n:
+            continue
+        if us >= 0.07 and v <= v_r:
+            return k
+        v = math.log(v * alpha / (a / (us * us) + b))
+        if v <= h - math.lgamma(k + 1) - math.lgamma(n - k + 1) + (k - mode) * odds:
+            return k
+
+
+def multinomial(rng: RandomSource, n: int, weights: Sequence[float]) -> list[int]:
+    """
+    Распределение n исходов по корзинам пропорционально весам.
+
+    Корзины заполняются цепочкой биномиальных бросков, поэтому время
+    зависит от количества корзин, а не от n.
+
+    Args:
+        rng: Генератор случайных чисел
+        n: Количество исходов
+        weights: Неотрицательные веса корзин с положительной суммой
+
+    Returns:
+        Количество исходов в каждой корзине; сумма равна n
+    """
+    counts = [0] * len(weights)
+    last = max(i for i, weight in enumerate(weights) if weight > 0)
+    left = float(sum(weights))
+    for i in range(last):
+        if n == 0:
+            return counts
+        weight = weights[i]
+        if weight > 0:
+            counts[i] = binomial(rng, n, weight / left)
+            n -= counts[i]
+            left -= weight
+    # Остаток отдаётся последней корзине с положительным весом,
+    # чтобы ошибка округления left не уводила исходы в пустую корзину.
+    counts[last] = n
+    return counts
@@ -1,9 +1,122 @@
+import argparse
+
 from adapter.cli import cli
+from adapter.live_status import DEFAULT_FPS
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description='Симуляция казино с гусями')
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='не выводить события и статус и не задавать вопросов на каждом шаге',
+    )
+    parser.add_argument(
+        '--stats',
+        action='store_true',
+        help='вывести таблицу счётчиков и времени действий в конце (без --live)',
+    )
+    parser.add_argument(
+        '--stats-json',
+        metavar='PATH',
+        help='сохранить счётчики и время действий в JSON (без --live)',
+    )
+    parser.add_argument(
+        '--resume',
+        metavar='PATH',
+        help='продолжить симуляцию со снимка вместо создания казино',
+    )
+    parser.add_argument(
+        '--snapshot',
+        metavar='PATH',
+        help='сохранить снимок казино после симуляции',
+    )
+    parser.add_argument(
+        '--tape',
+        metavar='PATH',
+        help='записать ленту для повтора симуляции',
+    )
+    parser.add_argument(
+        '--replay',
+        metavar='PATH',
+        help='повторить записанную ленту вместо новой симуляции',
+    )
+    parser.add_argument(
+        '--seek',
+        metavar='N',
+        type=int,
+        help='при повторе остановиться после шага N',
+    )
+    parser.add_argument(
+        '--summary',
+        action='store_true',
+        help='показывать в статусе сводку балансов вместо полного списка',
+    )
+    parser.add_argument(
+        '--players',
+        metavar='PATH',
+        help='загрузить игроков из CSV или JSON Lines вместо ручной настройки',
+    )
+    parser.add_argument(
+        '--geese',
+        metavar='PATH',
+        help='загрузить гусей из CSV или JSON Lines вместо ручной настройки',
+    )
+    parser.add_argument(
+        '--synthetic',
+        metavar='N',
+        type=int,
+        help='создать N случайных игроков и N гусей вместо ручной настройки',
+    )
+    parser.add_argument(
+        '--live',
+        action='store_true',
+        help='автоматическая симуляция с обновлением только изменившихся строк',
+    )
+    parser.add_argument(
+        '--fps',
+        type=float,
+        default=DEFAULT_FPS,
+        help='максимальная частота кадров живого статуса',
+    )
+    parser.add_argument(
+        '--steps',
+        metavar='N',
+        type=int,
+        help='количество шагов; без него оно спрашивается',
+    )
+    parser.add_argument(
+        '--seed',
+        metavar='N',
+        type=int,
+        help='сид генератора; используется вместе с --steps',
+    )
+    parser.add_argument(
+        '--next-event',
+        action='store_true',
+        help='с --live пропускать шаги без изменений одним броском',
+    )
+    args = parser.parse_args()
     try:
-        cli()
+        cli(
+            args.quiet,
+            args.stats,
+            args.stats_json,
+            args.resume,
+            args.snapshot,
+            args.tape,
+            args.replay,
+            args.seek,
+            args.summary,
+            args.players,
+            args.geese,
+            args.synthetic,
+            args.live,
+            args.fps,
+            args.steps,
+            args.seed,
+            args.next_event,
+        )
     except Exception as e:
         print(f'{e}')
 
@@ -1,4 +1,134 @@
-from typing import Any
+import threading
+from typing import Any, Iterable
+
+COMPACT_RATIO = 8
+
+
+class CollectionIterator:
+    """
+    Независимый итератор по коллекции с проверкой изменений.
+
+    Каждый вызов iter() создаёт свой итератор, поэтому вложенные и
+    параллельные обходы одной коллекции не мешают друг другу. Если
+    коллекция структурно изменилась во время обхода, итератор
+    сообщает об этом, а не пропускает элементы молча.
+
+    Attributes:
+        collection: Обходимая коллекция
+        items: Список элементов на момент начала обхода
+        index: Позиция следующего элемента
+        mod_count: Счётчик изменений коллекции на момент начала обхода
+    """
+
+    __slots__ = ('collection', 'items', 'index', 'mod_count')
+
+    def __init__(self, collection: 'BaseCollection') -> None:
+        """
+        Инициализация итератора.
+
+        Args:
+            collection: Обходимая коллекция
+        """
+        self.collection = collection
+        self.items = collection.items
+        self.index = 0
+        self.mod_count = collection.mod_count
+
+    def __iter__(self) -> 'CollectionIterator':
+        """
+        Получение итератора.
+
+        Returns:
+            Сам итератор
+        """
+        return self
+
+    def __next__(self) -> Any:
+        """
+        Получение следующего элемента.
+
+        Returns:
+            Следующий элемент коллекции
+
+        Raises:
+            RuntimeError: Если коллекция изменилась во время обхода
+            StopIteration: Если достигнут конец коллекции
+        """
+        if self.collection.mod_count != self.mod_count:
+            raise RuntimeError('Коллекция изменилась во время итерации')
+        items = self.items
+        index = self.index
+        size = len(items)
+        while index < size:
+            item = items[index]
+            index += 1
+            if item is not None:
+                self.index = index
+                return item
+        self.index = index
+        raise StopIteration
+
+
+class CollectionSnapshot:
+    """
+    Неизменяемый снимок коллекции.
+
+    Снимок создаётся за O(1): он ссылается на текущий список элементов,
+    а коллекция копирует список только при первом изменении после
+    снимка (копирование при записи). Обход снимка безопасен при любых
+    изменениях коллекции, в том числе из другого потока.
+
+    Attributes:
+        items: Список элементов на момент снимка
+        length: Количество элементов на момент снимка
+    """
+
+    __slots__ = ('items', 'length')
+
+    def __init__(self, items: Any, length: int) -> None:
+        """
+        Инициализация снимка.
+
+        Args:
+            items: Список элементов коллекции
+            length: Количество элементов
+        """
+        self.items = items
+        self.length = length
+
+    def __len__(self) -> int:
+        """
+        Получение длины снимка.
+
+        Returns:
+            Количество элементов
+        """
+        return self.length
+
+    def __iter__(self) -> Any:
+        """
+        Обход элементов снимка.
+
+        Returns:
+            Итератор элементов
+        """
+        if self.length == len(self.items):
+            return iter(self.items)
+        return (item for item in self.items if item is not None)
+
+    def __getitem__(self, key: int | slice) -> Any | list[Any]:
+        """
+        Получение элемента по индексу или срезу.
+
+        Args:
+            key: Индекс элемента или срез
+
+        Returns:
+            Элемент или список элементов
+        """
+        if self.length != len(self.items):
+            self.items = [item for item in self.items if item is not None]
+        return self.items[key]
 
 
 class BaseCollection:
@@ -8,12 +138,18 @@ class BaseCollection:
     Attributes:
         items: Список элементов коллекции
         length: Количество элементов в коллекции
+        mod_count: Счётчик структурных изменений коллекции
+        shared: Есть ли снимок, ссылающийся на текущий список
+        lock: Блокировка изменений и создания снимков
     """
 
     def __init__(self) -> None:
         """Инициализация пустой коллекции."""
         self.items: list[Any] = []
         self.length = 0
+        self.mod_count = 0
+        self.shared = False
+        self.lock = threading.RLock()
 
     def __getitem__(self, key: int | slice) -> Any | list[Any]:
         """
@@ -27,31 +163,37 @@ class BaseCollection:
         """
         return self.items[key]
 
-    def __iter__(self) -> Any:
+    def __iter__(self) -> CollectionIterator:
         """
-        Инициализация итератора.
+        Создание независимого итератора.
 
         Returns:
-            Сам объект как итератор
+            Новый итератор по коллекции
         """
-        self.index = -1
-        return self
+        return CollectionIterator(self)
 
-    def __next__(self) -> Any:
+    def snapshot(self) -> CollectionSnapshot:
         """
-        Получение следующего элемента при итерации.
+        Создание снимка коллекции за O(1).
 
         Returns:
-            Следующий элемент коллекции
+            Снимок, не зависящий от последующих изменений
+        """
+        with self.lock:
+            self.shared = True
+            return CollectionSnapshot(self.items, self.length)
 
-        Raises:
-            StopIteration: Если достигнут конец коллекции
+    def _before_write(self) -> None:
+        """
+        Подготовка к структурному изменению.
+
+        Увеличивает счётчик изменений и, если на текущий список
+        ссылается снимок, заменяет его копией. Вызывается под lock.
         """
-        if self.index + 1 < self.length:
-            self.index += 1
-            return self.items[self.index]
-        else:
-            raise StopIteration
+        self.mod_count += 1
+        if self.shared:
+            self.items = self.items.copy()
+            self.shared = False
 
     def __len__(self) -> int:
         """
@@ -69,8 +211,10 @@ class BaseCollection:
         Args:
             item: Элемент для добавления
         """
-        self.length += 1
-        self.items.append(item)
+        with self.lock:
+            self._before_write()
+            self.items.append(item)
+            self.length += 1
 
     def pop(self, index: int | None = None) -> Any:
         """
@@ -85,10 +229,344 @@ class BaseCollection:
         Raises:
             IndexError: Если коллекция пуста
         """
-        if not self.items:
-            raise IndexError('Элементов в коллекции нет')
-        if index is None:
-            index = self.length - 1
-        self.length -= 1
-        deleted_item = self.items.pop(index)
-        return deleted_item
+        with self.lock:
+            if not self.items:
+                raise IndexError('Элементов в коллекции нет')
+            if index is None:
+                index = self.length - 1
+            self._before_write()
+            deleted_item = self.items.pop(index)
+            self.length -= 1
+            return deleted_item
+
+    def remove(self, item: Any) -> Any:
+        """
+        Удаление элемента по значению.
+
+        Args:
+            item: Элемент для удаления
+
+        Returns:
+            Удаленный элемент
+
+        Raises:
+            ValueError: Если элемента нет в коллекции
+        """
+        return self.pop(self.items.index(item))
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """
+        Добавление нескольких элементов в конец одним расширением списка.
+
+        Args:
+            items: Элементы для добавления
+        """
+        with self.lock:
+            self._before_write()
+            size = len(self.items)
+            self.items.extend(items)
+            self.length += len(self.items) - size
+
+    def remove_many(self, items: Iterable[Any]) -> list[Any]:
+        """
+        Удаление нескольких элементов за один проход по списку.
+
+        Элементы сравниваются по тождеству, порядок оставшихся сохраняется.
+        Пакет проверяется целиком до изменения коллекции.
+
+        Args:
+            items: Элементы для удаления
+
+        Returns:
+            Удаленные элементы в порядке пакета
+
+        Raises:
+            ValueError: Если какого-то элемента нет в коллекции или он
+                повторяется в пакете
+        """
+        removed = list(items)
+        doomed = {id(item) for item in removed}
+        with self.lock:
+            kept = [item for item in self.items if id(item) not in doomed]
+            if len(doomed) != len(removed) or (
+                len(self.items) - len(kept) != len(removed)
+            ):
+                raise ValueError('Элемента нет в коллекции')
+            self._before_write()
+            self.items = kept
+            self.length = len(kept)
+            self.shared = False
+        return removed
+
+    def clear(self) -> None:
+        """Удаление всех элементов коллекции."""
+        with self.lock:
+            self._before_write()
+            self.items.clear()
+            self.length = 0
+
+    def rebuild(self, items: list[Any]) -> None:
+        """
+        Замена всего содержимого коллекции за один проход.
+
+        Args:
+            items: Новые элементы в нужном порядке
+        """
+        with self.lock:
+            self._before_write()
+            self.items = list(items)
+            self.length = len(self.items)
+            self.shared = False
+
+
+class IndexedCollection(BaseCollection):
+    """
+    Коллекция именованных элементов с удалением за O(1).
+
+    Хранит соответствие имени элемента и его позиции в items.
+    В обычном режиме удалённый элемент заменяется последним, поэтому
+    порядок элементов не сохраняется. В стабильном режиме на месте
+    удалённого остаётся пропуск, который итераторы и снимки пропускают,
+    а список уплотняется при чтении по позиции или когда пропусков
+    становится больше, чем элементов, так что порядок добавления
+    сохраняется.
+
+    Attributes:
+        items: Список элементов (в стабильном режиме может содержать пропуски)
+        length: Количество элементов в коллекции
+        positions: Соответствие имени элемента и позиции в items
+        stable: Сохранять ли порядок добавления
+        holes: Количество пропусков в items
+    """
+
+    def __init__(self, stable: bool = False) -> None:
+        """
+        Инициализация пустой коллекции.
+
+        Args:
+            stable: Сохранять ли порядок добавления
+        """
+        super().__init__()
+        self.positions: dict[str, int] = {}
+        self.stable = stable
+        self.holes = 0
+
+    def __getitem__(self, key: int | slice) -> Any | list[Any]:
+        """
+        Получение элемента по индексу или срезу.
+
+        Args:
+            key: Индекс элемента или срез
+
+        Returns:
+            Элемент или список элементов
+        """
+        if self.holes:
+            self._compact()
+        return self.items[key]
+
+    def __contains__(self, item: Any) -> bool:
+        """
+        Проверка наличия элемента по имени.
+
+        Args:
+            item: Элемент
+
+        Returns:
+            True если элемент с таким именем есть в коллекции
+        """
+        return item.name in self.positions
+
+    def add(self, item: Any) -> None:
+        """
+        Добавление элемента в коллекцию.
+
+        Args:
+            item: Элемент для добавления
+
+        Raises:
+            ValueError: Если элемент с таким именем уже есть
+        """
+        with self.lock:
+            if item.name in self.positions:
+                raise ValueError('Элемент с таким именем уже есть')
+            self._before_write()
+            self.positions[item.name] = len(self.items)
+            self.items.append(item)
+            self.length += 1
+
+    def pop(self, index: int | None = None) -> Any:
+        """
+        Удаление и возврат элемента по позиции.
+
+        Args:
+            index: Индекс элемента для удаления. Если None, удаляется последний элемент
+
+        Returns:
+            Удаленный элемент
+
+        Raises:
+            IndexError: Если коллекция пуста
+        """
+        with self.lock:
+            if not self.length:
+                raise IndexError('Элементов в коллекции нет')
+            if self.holes:
+                self._compact()
+            if index is None:
+                index = self.length - 1
+            return self.remove_by_name(self.items[index].name)
+
+    def remove(self, item: Any) -> Any:
+        """
+        Удаление элемента за O(1).
+
+        Args:
+            item: Элемент для удаления
+
+        Returns:
+            Удаленный элемент
+
+        Raises:
+            ValueError: Если элемента нет в коллекции
+        """
+        return self.remove_by_name(item.name)
+
+    def remove_by_name(self, name: str) -> Any:
+        """
+        Удаление элемента по имени за O(1).
+
+        Args:
+            name: Имя элемента
+
+        Returns:
+            Удаленный элемент
+
+        Raises:
+            ValueError: Если элемента нет в коллекции
+        """
+        with self.lock:
+            position = self.positions.pop(name, None)
+            if position is None:
+                raise ValueError('Элемента с таким именем нет')
+            self._before_write()
+            items = self.items
+            deleted_item = items[position]
+            self.length -= 1
+            if self.stable:
+                items[position] = None
+                self.holes += 1
+                if self.holes > self.length:
+                    self._compact()
+                return deleted_item
+            last = items.pop()
+            if position < len(items):
+                items[position] = last
+                self.positions[last.name] = position
+            return deleted_item
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """
+        Добавление нескольких элементов с проверкой имён до изменения.
+
+        Args:
+            items: Элементы для добавления
+
+        Raises:
+            ValueError: Если имя повторяется в пакете или уже есть в коллекции
+        """
+        added = list(items)
+        names = [item.name for item in added]
+        unique = set(names)
+        with self.lock:
+            if len(unique) != len(names) or not self.positions.keys().isdisjoint(
+                unique
+            ):
+                raise ValueError('Элемент с таким именем уже есть')
+            self._before_write()
+            start = len(self.items)
+            self.positions.update(
+                zip(names, range(start, start + len(names)), strict=True)
+            )
+            self.items.extend(added)
+            self.length += len(added)
+
+    def remove_many(self, items: Iterable[Any]) -> list[Any]:
+        """
+        Удаление нескольких элементов по именам.
+
+        Пакет проверяется целиком до изменения коллекции. Небольшой пакет
+        удаляется поштучно за O(1) на элемент, а пакет не меньше
+        1/COMPACT_RATIO коллекции — одним проходом уплотнения, который
+        заодно убирает пропуски стабильного режима и сохраняет порядок.
+
+        Args:
+            items: Элементы для удаления
+
+        Returns:
+            Удаленные элементы в порядке пакета
+
+        Raises:
+            ValueError: Если какого-то элемента нет в коллекции или имя
+                повторяется в пакете
+        """
+        names = [item.name for item in items]
+        doomed = set(names)
+        with self.lock:
+            positions = self.positions
+            if len(doomed) != len(names) or not doomed <= positions.keys():
+                raise ValueError('Элемента с таким именем нет')
+            removed = [self.items[positions[name]] for name in names]
+            if len(names) * COMPACT_RATIO < self.length:
+                for name in names:
+                    self.remove_by_name(name)
+                return removed
+            self._before_write()
+            self.items = [
+                item
+                for item in self.items
+                if item is not None and item.name not in doomed
+            ]
+            self.positions = {item.name: i for i, item in enumerate(self.items)}
+            self.length = len(self.items)
+            self.holes = 0
+            self.shared = False
+        return removed
+
+    def clear(self) -> None:
+        """Удаление всех элементов коллекции."""
+        with self.lock:
+            super().clear()
+            self.positions.clear()
+            self.holes = 0
+
+    def rebuild(self, items: list[Any]) -> None:
+        """
+        Замена всего содержимого коллекции и соответствия имён за один проход.
+
+        Args:
+            items: Новые элементы в нужном порядке
+
+        Raises:
+            ValueError: Если имена элементов повторяются
+        """
+        positions = {item.name: i for i, item in enumerate(items)}
+        if len(positions) != len(items):
+            raise ValueError('Элемент с таким именем уже есть')
+        with self.lock:
+            super().rebuild(items)
+            self.positions = positions
+            self.holes = 0
+
+    def _compact(self) -> None:
+        """
+        Удаление пропусков с сохранением порядка элементов.
+
+        Строит новый список, поэтому начатые итераторы и снимки,
+        ссылающиеся на старый, остаются корректными.
+        """
+        with self.lock:
+            self.items = [item for item in self.items if item is not None]
+            self.positions = {item.name: i for i, item in enumerate(self.items)}
+            self.holes = 0
+            self.shared = False
@@ -1,5 +1,22 @@
+from bisect import bisect_left, insort
+from typing import Any, Iterable, Iterator
+
 from domain.casino_entities import Chip, Goose, HonkGoose, Player, WarGoose
-from repository.base_classes import BaseCollection
+from domain.rng import RandomSource
+from repository.base_classes import BaseCollection, IndexedCollection
+
+
+def _chip_value(chip: Chip) -> int:
+    """
+    Ключ сортировки фишек.
+
+    Args:
+        chip: Фишка
+
+    Returns:
+        Номинал фишки
+    """
+    return chip.value
 
 
 class PlayerCollection(BaseCollection):
@@ -14,13 +31,28 @@ class GooseCollection(BaseCollection):
     pass
 
 
+class IndexedPlayerCollection(IndexedCollection, PlayerCollection):
+    """Коллекция игроков с удалением по имени за O(1)."""
+
+    pass
+
+
+class IndexedGooseCollection(IndexedCollection, GooseCollection):
+    """Коллекция гусей с удалением по имени за O(1)."""
+
+    pass
+
+
 class ChipCollection(BaseCollection):
     """
     Коллекция фишек с предустановленными стандартными фишками.
+
+    Фишки хранятся по возрастанию номинала.
     """
 
     def __init__(self) -> None:
         """Инициализация коллекции с 5 стандартными фишками."""
+        super().__init__()
         self.items = [
             Chip('white', 1),
             Chip('green', 5),
@@ -37,21 +69,85 @@ class ChipCollection(BaseCollection):
         Args:
             item: Фишка для добавления
         """
-        self.items.append(item)
+        with self.lock:
+            self._before_write()
+            insort(self.items, item, key=_chip_value)
+            self.length += 1
+
+    def rebuild(self, items: list[Chip]) -> None:
+        """
+        Замена всех фишек с сортировкой по номиналу.
+
+        Args:
+            items: Новые фишки
+        """
+        super().rebuild(sorted(items, key=_chip_value))
+
+
+class BetBook:
+    """
+    Книга ставок одного раунда рулетки.
+
+    Attributes:
+        bets_by_code: Ставки (игрок, размер), сгруппированные по коду ставки
+        total_stake: Сумма всех ставок
+        length: Количество ставок
+    """
+
+    def __init__(self) -> None:
+        """Инициализация пустой книги ставок."""
+        self.bets_by_code: dict[int, list[tuple[Player, int]]] = {}
+        self.total_stake = 0
+        self.length = 0
+
+    def __len__(self) -> int:
+        """
+        Получение количества ставок.
+
+        Returns:
+            Количество ставок в книге
+        """
+        return self.length
+
+    def add(self, player: Player, bet_value: int, code: int) -> None:
+        """
+        Добавление ставки в книгу.
+
+        Args:
+            player: Игрок, сделавший ставку
+            bet_value: Размер ставки
+            code: Код ставки из domain.roulette
+        """
+        bets = self.bets_by_code.get(code)
+        if bets is None:
+            bets = self.bets_by_code[code] = []
+        bets.append((player, bet_value))
+        self.total_stake += bet_value
         self.length += 1
-        sorted(self.items, key=lambda chip: chip.value)
+
+    def clear(self) -> None:
+        """Удаление всех ставок из книги."""
+        self.bets_by_code.clear()
+        self.total_stake = 0
+        self.length = 0
 
 
 class IndexDictChip:
     """
-    Индексный словарь для поиска фишек по цвету.
+    Индекс номиналов фишек, упорядоченный по номиналу.
+
+    Цвет и номинал уникальны, поэтому индекс хранит оба направления
+    поиска за O(1) и отсортированный список номиналов для обхода
+    по возрастанию.
 
     Attributes:
         dict_chip_value: Словарь сопоставления цвета и номинала фишки
+        dict_chip_colour: Словарь сопоставления номинала и цвета фишки
+        values: Номиналы по возрастанию
     """
 
     def __init__(self) -> None:
-        """Инициализация словаря со стандартными фишками."""
+        """Инициализация индекса со стандартными фишками."""
         self.dict_chip_value: dict[str, int] = {
             'white': 1,
             'green': 5,
@@ -59,6 +155,28 @@ class IndexDictChip:
             'red': 25,
             'black': 50,
         }
+        self.dict_chip_colour = {
+            value: colour for colour, value in self.dict_chip_value.items()
+        }
+        self.values = sorted(self.dict_chip_colour)
+
+    def __iter__(self) -> Iterator[tuple[str, int]]:
+        """
+        Обход фишек по возрастанию номинала.
+
+        Returns:
+            Итератор пар (цвет, номинал)
+        """
+        return ((self.dict_chip_colour[value], value) for value in self.values)
+
+    def __len__(self) -> int:
+        """
+        Получение количества номиналов.
+
+        Returns:
+            Количество номиналов
+        """
+        return len(self.values)
 
     def add(self, chip: Chip) -> None:
         """
@@ -70,16 +188,13 @@ class IndexDictChip:
         Raises:
             ValueError: Если фишка с таким цветом или номиналом уже существует
         """
-        for key, value in self.dict_chip_value.items():
-            if chip.colour == key:
-                raise ValueError('Такой цвет фишек уже есть')
-            if chip.value == value:
-                raise ValueError('Такой наминал фишек уже есть')
+        if chip.colour in self.dict_chip_value:
+            raise ValueError('Такой цвет фишек уже есть')
+        if chip.value in self.dict_chip_colour:
+            raise ValueError('Такой наминал фишек уже есть')
         self.dict_chip_value[chip.colour] = chip.value
-        sorted(
-            self.dict_chip_value,
-            key=lambda colour: self.dict_chip_value[colour],
-        )
+        self.dict_chip_colour[chip.value] = chip.colour
+        insort(self.values, chip.value)
 
     def pop(self, chip: Chip) -> None:
         """
@@ -93,8 +208,27 @@ class IndexDictChip:
         """
         if chip.colour not in self.dict_chip_value:
             raise IndexError('Такого цвета фишек нет, увы')
-        else:
-            self.dict_chip_value.pop(chip.colour)
+        value = self.dict_chip_value.pop(chip.colour)
+        del self.dict_chip_colour[value]
+        del self.values[bisect_left(self.values, value)]
+
+    def rebuild(self, chips: list[Chip]) -> None:
+        """
+        Построение индекса заново по списку фишек.
+
+        Args:
+            chips: Фишки
+
+        Raises:
+            ValueError: Если цвета или номиналы повторяются
+        """
+        by_colour = {chip.colour: chip.value for chip in chips}
+        by_value = {value: colour for colour, value in by_colour.items()}
+        if len(by_colour) != len(chips) or len(by_value) != len(chips):
+            raise ValueError('Цвета и номиналы фишек должны быть уникальными')
+        self.dict_chip_value = by_colour
+        self.dict_chip_colour = by_value
+        self.values = sorted(by_value)
 
     def search_chip_value(self, colour: str) -> int:
         """
@@ -113,6 +247,23 @@ class IndexDictChip:
             raise IndexError('Такого вида фишек нет, увы')
         return self.dict_chip_value[colour]
 
+    def search_chip_colour(self, value: int) -> str:
+        """
+        Поиск цвета фишки по номиналу.
+
+        Args:
+            value: Номинал фишки
+
+        Returns:
+            Цвет фишки
+
+        Raises:
+            IndexError: Если фишка не найдена
+        """
+        if value not in self.dict_chip_colour:
+            raise IndexError('Такого номинала фишек нет, увы')
+        return self.dict_chip_colour[value]
+
 
 class IndexDictPlayer:
     """
@@ -140,6 +291,81 @@ class IndexDictPlayer:
             raise ValueError('Игрок с таким именем уже есть')
         self.dict_player[player.name] = player
 
+    def contains_any(self, names: Iterable[str]) -> bool:
+        """
+        Проверка, есть ли в индексе хотя бы одно из имён.
+
+        Args:
+            names: Имена
+
+        Returns:
+            True, если хотя бы одно имя уже есть
+        """
+        return not self.dict_player.keys().isdisjoint(names)
+
+    def contains_all(self, names: set[str]) -> bool:
+        """
+        Проверка, есть ли в индексе все имена.
+
+        Args:
+            names: Имена
+
+        Returns:
+            True, если есть все имена
+        """
+        return self.dict_player.keys() >= names
+
+    def add_many(self, players: list[Player]) -> None:
+        """
+        Добавление нескольких игроков одним обновлением словаря.
+
+        Args:
+            players: Игроки для добавления
+
+        Raises:
+            ValueError: Если имя повторяется в пакете или уже есть в индексе
+        """
+        added = {player.name: player for player in players}
+        if len(added) != len(players) or self.contains_any(added):
+            raise ValueError('Игрок с таким именем уже есть')
+        self.dict_player.update(added)
+
+    def pop_many(self, players: list[Player]) -> None:
+        """
+        Удаление нескольких игроков из индекса.
+
+        Args:
+            players: Игроки для удаления
+
+        Raises:
+            IndexError: Если какого-то игрока нет в индексе
+        """
+        names = {player.name for player in players}
+        if not self.contains_all(names):
+            raise IndexError('Нет игрока с таким именем')
+        dict_player = self.dict_player
+        for name in names:
+            del dict_player[name]
+
+    def clear(self) -> None:
+        """Удаление всех игроков из индекса."""
+        self.dict_player.clear()
+
+    def rebuild(self, players: list[Player]) -> None:
+        """
+        Построение индекса заново по списку игроков.
+
+        Args:
+            players: Игроки
+
+        Raises:
+            ValueError: Если имена игроков повторяются
+        """
+        dict_player = {player.name: player for player in players}
+        if len(dict_player) != len(players):
+            raise ValueError('Игрок с таким именем уже есть')
+        self.dict_player = dict_player
+
     def pop(self, player: Player) -> None:
         """
         Удаление игрока из индекса.
@@ -192,21 +418,60 @@ class IndexDictPlayer:
 
 class IndexDictGoose:
     """
-    Индексный словарь для поиска гусей по имени.
+    Индекс гусей по имени с разбиением по типам.
+
+    Один словарь имя -> гусь даёт поиск за одно обращение к хэш-таблице,
+    а списки боевых и гогочущих гусей поддерживаются при добавлении и
+    удалении (удаление заменой на последнего), поэтому выбрать
+    случайного гуся нужного типа можно за O(1).
 
     Attributes:
-        dict_war_goose: Словарь боевых гусей
-        dict_honk_goose: Словарь гогочущих гусей
+        geese: Словарь сопоставления имени и гуся
+        war_geese: Боевые гуси
+        honk_geese: Гогочущие гуси
+        positions: Позиция гуся в списке его типа по имени
     """
 
     def __init__(self) -> None:
-        """Инициализация пустых словарей гусей."""
-        self.dict_war_goose: dict[str, WarGoose] = {}
-        self.dict_honk_goose: dict[str, HonkGoose] = {}
+        """Инициализация пустого индекса гусей."""
+        self.geese: dict[str, Goose] = {}
+        self.war_geese: list[WarGoose] = []
+        self.honk_geese: list[HonkGoose] = []
+        self.positions: dict[str, int] = {}
+
+    def __contains__(self, goose_name: object) -> bool:
+        """
+        Проверка наличия гуся с таким именем.
+
+        Args:
+            goose_name: Имя гуся
+
+        Returns:
+            True, если гусь есть в индексе
+        """
+        return goose_name in self.geese
+
+    def build_dict_war_goose(self) -> dict[str, WarGoose]:
+        """
+        Словарь боевых гусей (новый словарь при каждом вызове, O(n)).
+
+        Returns:
+            Соответствие имени и боевого гуся
+        """
+        return {goose.name: goose for goose in self.war_geese}
+
+    def build_dict_honk_goose(self) -> dict[str, HonkGoose]:
+        """
+        Словарь гогочущих гусей (новый словарь при каждом вызове, O(n)).
+
+        Returns:
+            Соответствие имени и гогочущего гуся
+        """
+        return {goose.name: goose for goose in self.honk_geese}
 
     def add(self, goose: Goose) -> None:
         """
-        Добавление гуся в соответствующий индекс.
+        Добавление гуся в индекс и в список его типа.
 
         Args:
             goose: Гусь для добавления
@@ -214,18 +479,19 @@ class IndexDictGoose:
         Raises:
             ValueError: Если гусь с таким именем уже существует
         """
+        if goose.name in self.geese:
+            raise ValueError('Гусь с таким именем уже есть')
+        self.geese[goose.name] = goose
         if isinstance(goose, WarGoose):
-            if goose in self.dict_war_goose:
-                ValueError('Гусь с таким именем уже есть')
-            self.dict_war_goose[goose.name] = goose
-        if isinstance(goose, HonkGoose):
-            if goose in self.dict_honk_goose:
-                ValueError('Гусь с таким именем уже есть')
-            self.dict_honk_goose[goose.name] = goose
+            self.positions[goose.name] = len(self.war_geese)
+            self.war_geese.append(goose)
+        elif isinstance(goose, HonkGoose):
+            self.positions[goose.name] = len(self.honk_geese)
+            self.honk_geese.append(goose)
 
     def pop(self, goose: Goose) -> None:
         """
-        Удаление гуся из индекса.
+        Удаление гуся из индекса за O(1).
 
         Args:
             goose: Гусь для удаления
@@ -233,16 +499,140 @@ class IndexDictGoose:
         Raises:
             ValueError: Если гусь не найден
         """
-        goose_name = goose.name
-        if (
-            goose_name not in self.dict_war_goose
-            and goose_name not in self.dict_honk_goose
-        ):
+        indexed = self.geese.pop(goose.name, None)
+        if indexed is None:
             raise ValueError('Гуся с таким именем нет')
-        if goose_name in self.dict_war_goose:
-            self.dict_war_goose.pop(goose_name)
-        if goose_name in self.dict_honk_goose:
-            self.dict_honk_goose.pop(goose_name)
+        position = self.positions.pop(goose.name, None)
+        if position is None:
+            return
+        roster: list[Any] = (
+            self.war_geese if isinstance(indexed, WarGoose) else self.honk_geese
+        )
+        last = roster.pop()
+        if position < len(roster):
+            roster[position] = last
+            self.positions[last.name] = position
+
+    def contains_any(self, names: Iterable[str]) -> bool:
+        """
+        Проверка, есть ли в индексе хотя бы одно из имён.
+
+        Args:
+            names: Имена
+
+        Returns:
+            True, если хотя бы одно имя уже есть
+        """
+        return not self.geese.keys().isdisjoint(names)
+
+    def contains_all(self, names: set[str]) -> bool:
+        """
+        Проверка, есть ли в индексе все имена.
+
+        Args:
+            names: Имена
+
+        Returns:
+            True, если есть все имена
+        """
+        return self.geese.keys() >= names
+
+    def add_many(self, geese: list[Goose]) -> None:
+        """
+        Добавление нескольких гусей одним обновлением словарей и списков.
+
+        Args:
+            geese: Гуси для добавления
+
+        Raises:
+            ValueError: Если имя повторяется в пакете или уже есть в индексе
+        """
+        added = {goose.name: goose for goose in geese}
+        if len(added) != len(geese) or self.contains_any(added):
+            raise ValueError('Гусь с таким именем уже есть')
+        war_geese = [goose for goose in geese if isinstance(goose, WarGoose)]
+        honk_geese = [goose for goose in geese if isinstance(goose, HonkGoose)]
+        batches: list[tuple[list[Any], list[Any]]] = [
+            (self.war_geese, war_geese),
+            (self.honk_geese, honk_geese),
+        ]
+        for roster, batch in batches:
+            start = len(roster)
+            self.positions.update(
+                zip(
+                    [goose.name for goose in batch],
+                    range(start, start + len(batch)),
+                    strict=True,
+                )
+            )
+            roster.extend(batch)
+        self.geese.update(added)
+
+    def clear(self) -> None:
+        """Удаление всех гусей из индекса."""
+        self.geese.clear()
+        self.war_geese.clear()
+        self.honk_geese.clear()
+        self.positions.clear()
+
+    def rebuild(self, war_geese: list[WarGoose], honk_geese: list[HonkGoose]) -> None:
+        """
+        Построение индекса заново по спискам гусей каждого типа.
+
+        Порядок списков сохраняется, поэтому выбор случайного гуся после
+        перестроения совпадает с выбором до него.
+
+        Args:
+            war_geese: Боевые гуси в порядке индекса
+            honk_geese: Гогочущие гуси в порядке индекса
+
+        Raises:
+            ValueError: Если имена гусей повторяются
+        """
+        geese: dict[str, Goose] = {goose.name: goose for goose in war_geese}
+        geese.update((goose.name, goose) for goose in honk_geese)
+        if len(geese) != len(war_geese) + len(honk_geese):
+            raise ValueError('Гусь с таким именем уже есть')
+        positions = {goose.name: i for i, goose in enumerate(war_geese)}
+        positions.update((goose.name, i) for i, goose in enumerate(honk_geese))
+        self.geese = geese
+        self.war_geese = list(war_geese)
+        self.honk_geese = list(honk_geese)
+        self.positions = positions
+
+    def random_war_goose(self, rng: RandomSource) -> WarGoose:
+        """
+        Выбор случайного боевого гуся за O(1).
+
+        Args:
+            rng: Генератор случайных чисел
+
+        Returns:
+            Боевой гусь
+
+        Raises:
+            ValueError: Если боевых гусей нет
+        """
+        if not self.war_geese:
+            raise ValueError('Нет боевых гусей!')
+        return self.war_geese[int(rng.random() * len(self.war_geese))]
+
+    def random_honk_goose(self, rng: RandomSource) -> HonkGoose:
+        """
+        Выбор случайного гогочущего гуся за O(1).
+
+        Args:
+            rng: Генератор случайных чисел
+
+        Returns:
+            Гогочущий гусь
+
+        Raises:
+            ValueError: Если гогочущих гусей нет
+        """
+        if not self.honk_geese:
+            raise ValueError('Нет гогочущих гусей!')
+        return self.honk_geese[int(rng.random() * len(self.honk_geese))]
 
     def search_goose_balance(self, goose_name: str) -> int:
         """
@@ -257,15 +647,7 @@ class IndexDictGoose:
         Raises:
             ValueError: Если гусь не найден
         """
-        if (
-            goose_name not in self.dict_war_goose
-            and goose_name not in self.dict_honk_goose
-        ):
-            raise ValueError('Гуся с таким именем нет')
-        if goose_name in self.dict_war_goose:
-            return self.dict_war_goose[goose_name].balance
-        else:
-            return self.dict_honk_goose[goose_name].balance
+        return self.search_goose(goose_name).balance
 
     def search_goose_honk_volume(self, goose_name: str) -> int:
         """
@@ -280,15 +662,7 @@ class IndexDictGoose:
         Raises:
             ValueError: Если гусь не найден
         """
-        if (
-            goose_name not in self.dict_war_goose
-            and goose_name not in self.dict_honk_goose
-        ):
-            raise ValueError('Гуся с таким именем нет')
-        if goose_name in self.dict_war_goose:
-            return self.dict_war_goose[goose_name].honk_volume
-        else:
-            return self.dict_honk_goose[goose_name].honk_volume
+        return self.search_goose(goose_name).honk_volume
 
     def search_goose(self, goose_name: str) -> Goose:
         """
@@ -303,12 +677,7 @@ class IndexDictGoose:
         Raises:
             ValueError: Если гусь не найден
         """
-        if (
-            goose_name not in self.dict_war_goose
-            and goose_name not in self.dict_honk_goose
-        ):
+        goose = self.geese.get(goose_name)
+        if goose is None:
             raise ValueError('Гуся с таким именем нет')
-        if goose_name in self.dict_war_goose:
-            return self.dict_war_goose[goose_name]
-        else:
-            return self.dict_honk_goose[goose_name]
+        return goose
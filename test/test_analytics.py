@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from usecases.analytics import PlayerChain, analyse_player, bet_outcomes
+from usecases.simulation import SimulationConfig, SimulationEngine
+
+
+def make_config(balance=60, win_balance=120):
+    """Конфигурация с одним игроком и одинаковыми гусями"""
+    return SimulationConfig(
+        [("Игрок1", balance)],
+        [
+            ("Гусь1", "war", 5),
+            ("Гусь2", "honk", 5),
+            ("Гусь3", "war", 5),
+            ("Гусь4", "honk", 5),
+        ],
+        win_balance=win_balance,
+        min_honk_volume=5,
+        max_honk_volume=5,
+    )
+
+
+def test_bet_outcomes_are_a_distribution():
+    """Тест распределения множителя ставки"""
+    outcomes = bet_outcomes()
+    assert sum(outcomes.values()) == pytest.approx(1.0)
+    expected = sum(multiplier * p for multiplier, p in outcomes.items())
+    assert expected == pytest.approx((35 / 37 + 4 * 36 / 37) / 5)
+
+
+def test_chain_matches_dense_solution():
+    """Тест блочной прогонки против плотного решения"""
+    chain = PlayerChain(make_config(win_balance=400))
+    solution = chain.solve()
+    size = 399
+    matrix = np.eye(size)
+    rhs = np.zeros((size, 3))
+    rhs[:, 2] = 1.0
+    for balance in range(1, 400):
+        for delta, p in chain.moves(balance).items():
+            target = balance + delta
+            if target <= 0:
+                rhs[balance - 1, 0] += p
+            elif target >= 400:
+                rhs[balance - 1, 1] += p
+            else:
+                matrix[balance - 1, target - 1] -= p
+        matrix[balance - 1, balance - 1] -= 1 - sum(chain.moves(balance).values())
+    dense = np.linalg.solve(matrix, rhs)
+    assert np.allclose(solution.bankruptcy[1:400], dense[:, 0])
+    assert np.allclose(solution.win[1:400], dense[:, 1])
+    assert np.allclose(solution.expected_steps[1:400], dense[:, 2])
+
+
+def test_chain_probabilities_and_boundaries():
+    """Тест суммы вероятностей и поглощающих состояний"""
+    solution = analyse_player(make_config())
+    assert np.allclose(solution.bankruptcy + solution.win, 1.0)
+    assert solution.bankruptcy_probability(0) == 1.0
+    assert solution.bankruptcy_probability(-5) == 1.0
+    assert solution.win_probability(120) == 1.0
+    assert solution.steps_to_absorption(120) == 0.0
+    assert solution.drift[60] < 0
+
+
+def test_chain_agrees_with_simulation():
+    """Тест совпадения аналитики с серией симуляций"""
+    config = make_config()
+    solution = analyse_player(config, stationary_geese=True)
+    engine = SimulationEngine(config)
+    runs = 2000
+    bankrupt = 0
+    steps = 0
+    for seed in range(runs):
+        result = engine.run(10**6, seed=seed)
+        bankrupt += result.winner == "geese"
+        steps += result.steps
+    assert bankrupt / runs == pytest.approx(solution.bankruptcy_probability(60), abs=0.02)
+    assert steps / runs == pytest.approx(solution.steps_to_absorption(60), rel=0.1)
@@ -0,0 +1,66 @@
+from benchmarks.casino_bench import bench_size, compare
+from benchmarks.import_bench import measure, parse_importtime
+from benchmarks.storage_bench import measure as measure_storage
+
+
+def test_bench_size_covers_operations():
+    """Тест замера всех операций на маленьком составе"""
+    results = bench_size(10, 50, seed=0)
+    operations = {result.operation for result in results}
+    assert operations == {
+        'add_player',
+        'search_player',
+        'player_bet',
+        'war_goose_steal_chip',
+        'honk_goose_honk',
+        'recreate_goose',
+        'engine_step',
+    }
+    for result in results:
+        assert result.ops_per_sec > 0
+        assert result.p50_ns <= result.p99_ns
+
+
+def test_compare_reports_regression():
+    """Тест обнаружения регрессии относительно базовой линии"""
+    baseline = [
+        {'operation': 'search_player', 'size': 10, 'ops_per_sec': 1000.0},
+        {'operation': 'player_bet', 'size': 10, 'ops_per_sec': 1000.0},
+    ]
+    results = [
+        {'operation': 'search_player', 'size': 10, 'ops_per_sec': 850.0},
+        {'operation': 'player_bet', 'size': 10, 'ops_per_sec': 700.0},
+        {'operation': 'engine_step', 'size': 10, 'ops_per_sec': 1.0},
+    ]
+    regressions = compare(results, baseline, threshold=0.2)
+    assert len(regressions) == 1
+    assert regressions[0].startswith('player_bet@10')
+
+
+def test_parse_importtime_reads_cumulative():
+    """Тест разбора вывода python -X importtime"""
+    output = (
+        'import time: self [us] | cumulative | imported package\n'
+        'import time:       120 |        120 |   usecases.rng\n'
+        'import time:       300 |        420 | usecases\n'
+        'warning: not an import line\n'
+    )
+    assert parse_importtime(output) == {'usecases.rng': 120, 'usecases': 420}
+
+
+def test_headless_start_skips_ui_imports():
+    """Тест импорта точки входа без интерактивных и тяжёлых зависимостей"""
+    result = measure('main', runs=1)
+    assert result['forbidden'] == []
+    assert result['median_ms'] > 0
+
+
+def test_storage_bench_measures_both_backends():
+    """Тест замера объектного и столбцового хранилищ на малом размере"""
+    objects = measure_storage(False, size=200, steps=100)
+    columnar = measure_storage(True, size=200, steps=100)
+    assert objects['storage'] == 'objects'
+    assert columnar['storage'] == 'columnar'
+    assert objects['bytes_per_entity'] > 0
+    assert columnar['bytes_per_entity'] > 0
+    assert columnar['steps_s'] >= 0
@@ -1,7 +1,9 @@
 import pytest
 from domain.casino_entities import Chip, Player, WarGoose, HonkGoose
 from usecases.casino import Casino
+from usecases.online_stats import BalanceAggregator
 from repository.casino_collections import (
+    BetBook,
     ChipCollection,
     PlayerCollection,
     GooseCollection,
@@ -324,7 +326,7 @@ def test_war_goose_steal_chip_success(casino, mocker):
     casino.add_player(player)
     casino.add_goose(goose)
     
-    mocker.patch.object(goose, 'steal_chip', return_value=100)
+    mocker.patch.object(WarGoose, 'steal_chip', return_value=100)
     mocker.patch('random.randint', return_value=0)
     
     initial_balance = player.balance
@@ -343,7 +345,7 @@ def test_war_goose_steal_chip_failed(casino, mocker):
     casino.add_player(player)
     casino.add_goose(goose)
     
-    mocker.patch.object(goose, 'steal_chip', return_value=0)
+    mocker.patch.object(WarGoose, 'steal_chip', return_value=0)
     
     with pytest.raises(ValueError, match="Гусь потерял равновесие и не смог украсть фишку"):
         casino.war_goose_steal_chip("Неудачник", "Жертва")
@@ -357,7 +359,7 @@ def test_honk_goose_honk_success(casino, mocker):
     casino.add_player(player)
     casino.add_goose(goose)
     
-    mocker.patch.object(goose, 'honk', return_value=75)
+    mocker.patch.object(HonkGoose, 'honk', return_value=75)
     
     initial_balance = player.balance
     stolen_value = casino.honk_goose_honk("Гоготун", "Жертва")
@@ -375,12 +377,41 @@ def test_honk_goose_honk_failed(casino, mocker):
     casino.add_player(player)
     casino.add_goose(goose)
     
-    mocker.patch.object(goose, 'honk', return_value=0)
+    mocker.patch.object(HonkGoose, 'honk', return_value=0)
     
     with pytest.raises(ValueError, match="Гусь потерял равновесие и крикнул не в ту сторону"):
         casino.honk_goose_honk("Тихоня", "Жертва")
 
 
+def test_goose_roll_false_skips_luck(casino, mocker):
+    """Тест кражи и крика без розыгрыша удачи гуся"""
+    player = Player("Жертва", 1000)
+    war_goose = WarGoose("Вор", 1)
+    honk_goose = HonkGoose("Гоготун", 7)
+    casino.add_player(player)
+    casino.add_goose(war_goose)
+    casino.add_goose(honk_goose)
+    steal = mocker.patch.object(WarGoose, "steal_chip", return_value=0)
+    honk = mocker.patch.object(HonkGoose, "honk", return_value=0)
+
+    casino.war_goose_steal_chip("Вор", "Жертва", roll=False)
+    assert casino.honk_goose_honk("Гоготун", "Жертва", roll=False) == 7
+
+    steal.assert_not_called()
+    honk.assert_not_called()
+    assert war_goose.balance > 0
+    assert player.balance == 1000 - war_goose.balance - 7
+
+
+def test_goose_success_probability_matches_rolls():
+    """Тест вероятностей удачи гусей по всем исходам броска"""
+    for volume in range(-25, 40):
+        wins = sum(roll + volume > 30 for roll in range(1, 51))
+        assert WarGoose.steal_probability(volume) == wins / 50
+        honks = sum(roll > 20 for roll in range(1, 101)) if volume else 0
+        assert HonkGoose.honk_probability(volume) == honks / 100
+
+
 def test_recreate_goose(casino):
     """Тест пересоздания гуся"""
     old_goose = WarGoose("Старый", 30)
@@ -395,3 +426,86 @@ def test_recreate_goose(casino):
     found_goose = casino.search_goose("Новый")
     assert found_goose.name == "Новый"
     assert isinstance(found_goose, HonkGoose)
+
+
+def test_player_bet_red_uses_wheel_colour(casino, mocker):
+    """Тест ставки на красное по реальному цвету числа"""
+    player = Player("Николай Сергеевич", 1000)
+    casino.add_player(player)
+
+    mocker.patch('random.randint', return_value=2)
+
+    assert casino.player_bet("Николай Сергеевич", 100, "красное") is False
+    assert casino.player_bet("Николай Сергеевич", 100, "чёрное") is True
+    assert player.balance == 1000
+
+
+def test_play_round_single_spin(casino, mocker):
+    """Тест раунда с одним вращением для всей книги ставок"""
+    player1 = Player("Игрок1", 1000)
+    player2 = Player("Игрок2", 1000)
+    casino.add_player(player1)
+    casino.add_player(player2)
+    book = BetBook()
+
+    casino.place_bet(book, "Игрок1", 100, 7)
+    casino.place_bet(book, "Игрок1", 100, "нечётное")
+    casino.place_bet(book, "Игрок2", 100, "чётное")
+    casino.place_bet(book, "Игрок2", 100, "красное")
+    assert player1.balance == 800
+
+    randint = mocker.patch('random.randint', return_value=7)
+    result = casino.play_round(book)
+
+    randint.assert_called_once()
+    assert result.number == 7
+    assert result.bets == 4
+    assert result.winning_bets == 3
+    assert result.total_stake == 400
+    assert player1.balance == 800 + 35 * 100 + 2 * 100
+    assert player2.balance == 800 + 2 * 100
+    assert len(book) == 0
+
+
+def test_place_bet_validation(casino):
+    """Тест проверки ставок при размещении в книге"""
+    casino.add_player(Player("Игрок1", 100))
+    book = BetBook()
+
+    with pytest.raises(ValueError, match="Ставка больше чем баланс игрока"):
+        casino.place_bet(book, "Игрок1", 500, 5)
+    with pytest.raises(ValueError, match="Нужно выбрать число от 0 до 36"):
+        casino.place_bet(book, "Игрок1", 10, 37)
+    with pytest.raises(ValueError, match="Сделайте корректную ставку"):
+        casino.place_bet(book, "Игрок1", 10, "синее")
+    assert len(book) == 0
+    assert casino.search_player_balance("Игрок1") == 100
+
+
+def test_bulk_add_and_remove_players(casino):
+    """Тест пакетного добавления и удаления игроков с проверкой пакета"""
+    players = [Player(f"Игрок{i}", 10 * i) for i in range(10)]
+    casino.add_players_many(players)
+    casino.add_geese_many([WarGoose("Гусь1", 5), HonkGoose("Гусь2", 3)])
+    with pytest.raises(ValueError):
+        casino.add_players_many([Player("Новый", 1), Player("Игрок3", 1)])
+    with pytest.raises(ValueError):
+        casino.remove_players_many([players[0], Player("Чужой", 1)])
+    assert len(casino.player_collection) == 10
+    assert casino.remove_players_many(players[::2]) == players[::2]
+    assert [p.name for p in casino.iter_player()] == [p.name for p in players[1::2]]
+    with pytest.raises(ValueError):
+        casino.search_player("Игрок0")
+    assert casino.search_goose("Гусь2").honk_volume == 3
+
+
+def test_remove_missing_player_keeps_aggregator(casino):
+    """Тест удаления отсутствующего игрока без изменения сводки"""
+    aggregator = BalanceAggregator()
+    casino.add_aggregator(aggregator)
+    casino.add_player(Player("Игрок", 100))
+    with pytest.raises(ValueError):
+        casino.remove_player(Player("Чужой", 50))
+    assert aggregator.players.count == 1
+    casino.remove_player(casino.search_player("Игрок"))
+    assert aggregator.players.count == 0
@@ -0,0 +1,251 @@
+import random
+
+import pytest
+from domain.casino_entities import HonkGoose, Player, WarGoose
+from repository.casino_collections import (
+    ChipCollection,
+    IndexDictChip,
+    IndexDictGoose,
+    IndexDictPlayer,
+    IndexedGooseCollection,
+    IndexedPlayerCollection,
+    PlayerCollection,
+)
+from usecases.casino import Casino
+from usecases.online_stats import BalanceAggregator
+
+
+def make_players(count):
+    """Создание списка игроков"""
+    return [Player(f"Игрок{i}", 100) for i in range(count)]
+
+
+def test_base_collection_remove():
+    """Тест удаления по значению из обычной коллекции"""
+    collection = PlayerCollection()
+    players = make_players(3)
+    for player in players:
+        collection.add(player)
+    assert collection.remove(players[1]) is players[1]
+    assert [p.name for p in collection] == ["Игрок0", "Игрок2"]
+
+
+def test_indexed_remove_swaps_with_last():
+    """Тест удаления заменой на последний элемент"""
+    collection = IndexedPlayerCollection()
+    players = make_players(4)
+    for player in players:
+        collection.add(player)
+    collection.remove(players[0])
+    assert [p.name for p in collection] == ["Игрок3", "Игрок1", "Игрок2"]
+    assert collection.remove_by_name("Игрок3") is players[3]
+    assert len(collection) == 2
+    assert players[1] in collection
+    assert players[3] not in collection
+
+
+def test_indexed_stable_mode_keeps_order():
+    """Тест сохранения порядка в стабильном режиме"""
+    collection = IndexedPlayerCollection(stable=True)
+    players = make_players(5)
+    for player in players:
+        collection.add(player)
+    collection.remove(players[1])
+    collection.remove_by_name("Игрок3")
+    assert len(collection) == 3
+    assert [p.name for p in collection] == ["Игрок0", "Игрок2", "Игрок4"]
+    assert collection[1].name == "Игрок2"
+    assert collection.pop(0).name == "Игрок0"
+    assert [p.name for p in collection] == ["Игрок2", "Игрок4"]
+
+
+def test_indexed_rejects_duplicates_and_unknown_names():
+    """Тест ошибок при дубликате и неизвестном имени"""
+    collection = IndexedPlayerCollection()
+    collection.add(Player("Игрок", 100))
+    with pytest.raises(ValueError):
+        collection.add(Player("Игрок", 200))
+    with pytest.raises(ValueError):
+        collection.remove_by_name("Никто")
+
+
+def test_mass_bankruptcy_through_casino():
+    """Тест массового удаления игроков через казино"""
+    casino = Casino(
+        ChipCollection(),
+        IndexedPlayerCollection(),
+        IndexedGooseCollection(),
+        IndexDictChip(),
+        IndexDictPlayer(),
+        IndexDictGoose(),
+    )
+    players = make_players(50000)
+    for player in players:
+        casino.add_player(player)
+    for player in players[::2]:
+        casino.remove_player(player)
+    assert len(casino.player_collection) == 25000
+    with pytest.raises(ValueError):
+        casino.search_player("Игрок0")
+    assert casino.search_player("Игрок1") is players[1]
+
+
+def test_recreate_goose_with_indexed_collection():
+    """Тест пересоздания гуся в индексированной коллекции"""
+    casino = Casino(
+        ChipCollection(),
+        IndexedPlayerCollection(),
+        IndexedGooseCollection(),
+        IndexDictChip(),
+        IndexDictPlayer(),
+        IndexDictGoose(),
+    )
+    old_goose = WarGoose("Старый", 3)
+    casino.add_goose(old_goose)
+    casino.add_goose(WarGoose("Другой", 3))
+    casino.recreate_goose(old_goose, WarGoose("Новый", 4))
+    assert sorted(g.name for g in casino.iter_goose()) == ["Другой", "Новый"]
+
+
+def test_nested_iteration_is_independent():
+    """Тест вложенного обхода одной коллекции"""
+    collection = PlayerCollection()
+    for player in make_players(3):
+        collection.add(player)
+    pairs = [(a.name, b.name) for a in collection for b in collection]
+    assert len(pairs) == 9
+
+
+def test_iteration_fails_on_modification():
+    """Тест ошибки при изменении коллекции во время обхода"""
+    collection = IndexedPlayerCollection(stable=True)
+    players = make_players(3)
+    for player in players:
+        collection.add(player)
+    with pytest.raises(RuntimeError, match="изменилась"):
+        for player in collection:
+            collection.remove(player)
+
+
+def test_iteration_skips_stable_holes():
+    """Тест пропуска удалённых элементов при обходе"""
+    collection = IndexedPlayerCollection(stable=True)
+    players = make_players(4)
+    for player in players:
+        collection.add(player)
+    collection.remove(players[1])
+    assert [p.name for p in collection] == ["Игрок0", "Игрок2", "Игрок3"]
+
+
+def test_snapshot_is_isolated_from_writes():
+    """Тест независимости снимка от последующих изменений"""
+    casino = Casino(
+        ChipCollection(),
+        IndexedPlayerCollection(),
+        IndexedGooseCollection(),
+        IndexDictChip(),
+        IndexDictPlayer(),
+        IndexDictGoose(),
+    )
+    players = make_players(3)
+    for player in players:
+        casino.add_player(player)
+    snapshot = casino.snapshot_player()
+    casino.remove_player(players[0])
+    casino.add_player(Player("Новый", 10))
+    assert [p.name for p in snapshot] == ["Игрок0", "Игрок1", "Игрок2"]
+    assert len(snapshot) == 3
+    assert len(casino.player_collection) == 3
+    assert "Новый" in [p.name for p in casino.iter_player()]
+
+
+def test_goose_index_partitions_by_type():
+    """Тест списков гусей по типам и выбора случайного гуся"""
+    index = IndexDictGoose()
+    geese = [WarGoose(f"Боевой{i}", 5) for i in range(3)]
+    honk = HonkGoose("Гогочущий", 5)
+    for goose in geese + [honk]:
+        index.add(goose)
+    index.pop(geese[0])
+    assert index.war_geese == [geese[2], geese[1]]
+    assert index.honk_geese == [honk]
+    assert index.search_goose("Гогочущий") is honk
+    assert set(index.build_dict_war_goose()) == {"Боевой1", "Боевой2"}
+    assert index.random_honk_goose(random.Random(0)) is honk
+
+
+def test_goose_index_rejects_duplicate_name():
+    """Тест запрета двух гусей с одним именем"""
+    index = IndexDictGoose()
+    index.add(WarGoose("Гусь", 5))
+    with pytest.raises(ValueError, match="уже есть"):
+        index.add(HonkGoose("Гусь", 5))
+
+
+def test_random_goose_without_geese_of_type():
+    """Тест ошибки при выборе гуся отсутствующего типа"""
+    index = IndexDictGoose()
+    index.add(HonkGoose("Гусь", 5))
+    with pytest.raises(ValueError, match="Нет боевых гусей"):
+        index.random_war_goose(random.Random(0))
+
+
+def test_rebuild_replaces_collection_and_goose_index():
+    """Тест перестроения коллекции и индекса гусей за один проход"""
+    collection = IndexedPlayerCollection()
+    collection.add(Player("Старый", 1))
+    players = [Player(f"Игрок{i}", i) for i in range(3)]
+    collection.rebuild(players)
+    assert list(collection) == players
+    assert collection.remove_by_name("Игрок1") is players[1]
+    with pytest.raises(ValueError, match="уже есть"):
+        collection.rebuild([players[0], players[0]])
+
+    index = IndexDictGoose()
+    war = [WarGoose(f"Боевой{i}", 5) for i in range(3)]
+    honk = [HonkGoose("Гогочущий", 5)]
+    index.rebuild(war[::-1], honk)
+    assert index.war_geese == war[::-1]
+    index.pop(war[2])
+    assert index.war_geese == [war[0], war[1]]
+
+
+@pytest.mark.parametrize("stable", [False, True])
+@pytest.mark.parametrize("victims", [slice(0, 1), slice(None, None, 2)])
+def test_indexed_bulk_extend_and_remove(stable, victims):
+    """Тест пакетного расширения и удаления малым и большим пакетом"""
+    collection = IndexedPlayerCollection(stable=stable)
+    players = make_players(20)
+    collection.extend(players[:10])
+    collection.extend(players[10:])
+    with pytest.raises(ValueError):
+        collection.extend([Player("Игрок5", 1)])
+    with pytest.raises(ValueError):
+        collection.remove_many([players[0], players[0]])
+    assert collection.remove_many(players[victims]) == players[victims]
+    rest = [p for p in players if p not in players[victims]]
+    assert len(collection) == len(rest)
+    assert sorted(p.name for p in collection) == sorted(p.name for p in rest)
+    for player in rest:
+        assert collection.remove_by_name(player.name) is player
+    assert len(collection) == 0
+
+
+def test_bulk_casino_updates_aggregator():
+    """Тест оповещения сводки при пакетных операциях"""
+    casino = Casino(
+        ChipCollection(),
+        IndexedPlayerCollection(),
+        IndexedGooseCollection(),
+        IndexDictChip(),
+        IndexDictPlayer(),
+        IndexDictGoose(),
+    )
+    aggregator = BalanceAggregator()
+    casino.add_aggregator(aggregator)
+    players = [Player(f"Игрок{i}", i) for i in range(100)]
+    casino.add_players_many(players)
+    casino.remove_players_many(players[:60])
+    assert aggregator.players.count == 40
+    assert aggregator.players.total == sum(range(60, 100))
+    assert aggregator.departed == 60
@@ -0,0 +1,165 @@
+import pytest
+from domain.casino_entities import HonkGoose, Player, WarGoose
+from repository.casino_collections import ChipCollection, IndexDictChip
+from repository.columnar_storage import (
+    ColumnarGooseCollection,
+    ColumnarIndexDictGoose,
+    ColumnarIndexDictPlayer,
+    ColumnarPlayerCollection,
+    GooseStore,
+    PlayerStore,
+)
+from usecases.casino import Casino
+
+
+class MaxRandom:
+    """Генератор, всегда выдающий верхнюю границу"""
+
+    def random(self):
+        return 0.999
+
+    def randint(self, a, b):
+        return b
+
+
+@pytest.fixture
+def casino():
+    """Фикстура казино со столбцовым хранением"""
+    player_store = PlayerStore()
+    goose_store = GooseStore(MaxRandom())
+    return Casino(
+        ChipCollection(),
+        ColumnarPlayerCollection(player_store),
+        ColumnarGooseCollection(goose_store),
+        IndexDictChip(),
+        ColumnarIndexDictPlayer(player_store),
+        ColumnarIndexDictGoose(goose_store),
+        MaxRandom(),
+    )
+
+
+def test_player_proxy_keeps_attribute_api(casino):
+    """Тест атрибутов прокси игрока"""
+    casino.add_player(Player("Игрок1", 1000))
+    player = casino.search_player("Игрок1")
+    assert isinstance(player, Player)
+    assert player.name == "Игрок1"
+    player.balance -= 100
+    assert casino.search_player_balance("Игрок1") == 900
+    assert casino.get_player_slice(0).balance == 900
+
+
+def test_player_proxy_has_no_dict(casino):
+    """Тест отсутствия __dict__ у прокси игрока"""
+    casino.add_player(Player("Игрок1", 1000))
+    assert not hasattr(casino.search_player("Игрок1"), "__dict__")
+
+
+def test_goose_proxies_have_no_dict(casino):
+    """Тест отсутствия __dict__ у гусей и их прокси"""
+    casino.add_goose(WarGoose("Боевой", 5))
+    casino.add_goose(HonkGoose("Гогочущий", 5))
+    assert not hasattr(casino.search_goose("Боевой"), "__dict__")
+    assert not hasattr(casino.search_goose("Гогочущий"), "__dict__")
+    assert not hasattr(WarGoose("Гусь", 1), "__dict__")
+
+
+def test_duplicate_player_rejected(casino):
+    """Тест запрета двух игроков с одним именем"""
+    casino.add_player(Player("Игрок1", 1000))
+    with pytest.raises(ValueError, match="Игрок с таким именем уже есть"):
+        casino.add_player(Player("Игрок1", 10))
+    assert len(casino.player_collection) == 1
+
+
+def test_goose_actions_through_columns(casino):
+    """Тест действий гусей над столбцами"""
+    casino.add_player(Player("Жертва", 1000))
+    casino.add_goose(WarGoose("Вор", 50))
+    casino.add_goose(HonkGoose("Крикун", 7))
+
+    casino.war_goose_steal_chip("Вор", "Жертва")
+    stolen = casino.honk_goose_honk("Крикун", "Жертва")
+
+    assert stolen == 7
+    assert casino.search_goose_balance("Вор") == 50
+    assert casino.search_goose_honk_volume("Крикун") == 7
+    assert casino.search_player_balance("Жертва") == 1000 - 50 - 7
+    assert isinstance(casino.search_goose("Вор"), WarGoose)
+
+
+def test_pop_and_recreate_reuse_rows(casino):
+    """Тест удаления и переиспользования строк хранилища"""
+    casino.add_player(Player("Игрок1", 10))
+    casino.add_player(Player("Игрок2", 20))
+    deleted = casino.pop_player(1)
+    assert deleted.name == "Игрок1"
+    casino.add_player(Player("Игрок3", 30))
+    assert [p.name for p in casino.iter_player()] == ["Игрок2", "Игрок3"]
+    assert len(casino.player_collection.items.store.balances) == 2
+
+    old_goose = WarGoose("Старый", 3)
+    casino.add_goose(old_goose)
+    casino.recreate_goose(casino.search_goose("Старый"), HonkGoose("Новый", 5))
+    assert isinstance(casino.search_goose("Новый"), HonkGoose)
+    with pytest.raises(ValueError):
+        casino.search_goose("Старый")
+
+
+def test_random_goose_by_type(casino):
+    """Тест выбора случайного гуся нужного типа"""
+    casino.add_goose(WarGoose("Боевой1", 5))
+    casino.add_goose(HonkGoose("Гогочущий1", 5))
+    casino.add_goose(WarGoose("Боевой2", 5))
+    casino.remove_goose(casino.search_goose("Боевой2"))
+    goose = casino.random_war_goose()
+    assert isinstance(goose, WarGoose)
+    assert goose.name == "Боевой1"
+    assert casino.random_honk_goose().name == "Гогочущий1"
+    assert set(casino.index_dict_goose.build_dict_war_goose()) == {"Боевой1"}
+
+
+def test_bulk_operations_reuse_rows(casino):
+    """Тест пакетных операций над столбцами с переиспользованием строк"""
+    casino.add_players_many([Player(f"Игрок{i}", i) for i in range(16)])
+    casino.add_geese_many([WarGoose("Боевой", 5), HonkGoose("Гогочущий", 4)])
+    removed = casino.remove_players_many(
+        [casino.search_player(f"Игрок{i}") for i in range(0, 16, 2)]
+    )
+    assert [p.name for p in removed] == [f"Игрок{i}" for i in range(0, 16, 2)]
+    casino.remove_players_many([casino.search_player("Игрок1")])
+    casino.add_players_many([Player(f"Новый{i}", 100 + i) for i in range(12)])
+    store = casino.player_collection.items.store
+    assert len(store.names) == 19
+    names = [p.name for p in casino.iter_player()]
+    assert names[:7] == [f"Игрок{i}" for i in range(3, 16, 2)]
+    assert names[7:] == [f"Новый{i}" for i in range(12)]
+    for position, name in enumerate(names):
+        assert casino.player_collection.items.index(casino.search_player(name)) == position
+    assert casino.search_player_balance("Новый11") == 111
+    assert casino.random_honk_goose().name == "Гогочущий"
+    with pytest.raises(ValueError):
+        casino.add_geese_many([WarGoose("Боевой", 1)])
+
+
+def test_snapshot_keeps_rows_of_removed_entities(casino):
+    """Тест снимка: строки удалённых игроков не отдаются новым, пока он жив"""
+    casino.add_players_many([Player(f"Игрок{i}", i) for i in range(4)])
+    snapshot = casino.player_collection.snapshot()
+    casino.remove_player(casino.search_player("Игрок1"))
+    casino.remove_players_many([casino.search_player("Игрок2")])
+    casino.add_players_many([Player("Новый1", 100), Player("Новый2", 200)])
+    assert [(p.name, p.balance) for p in snapshot] == [
+        ("Игрок0", 0),
+        ("Игрок1", 1),
+        ("Игрок2", 2),
+        ("Игрок3", 3),
+    ]
+    store = casino.player_collection.items.store
+    assert len(store.names) == 6
+
+    del snapshot
+    casino.remove_player(casino.search_player("Новый1"))
+    casino.add_player(Player("Новый3", 300))
+    assert len(store.names) == 6
+    assert casino.search_player_balance("Новый3") == 300
@@ -0,0 +1,104 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from usecases.events import (
+    BinaryFileSink,
+    EventSink,
+    JsonlFileSink,
+    RingBufferSink,
+    SimulationEvent,
+    read_binary_events,
+)
+from usecases.simulation import SimulationConfig, SimulationEngine
+
+
+def make_config():
+    """Создание конфигурации с двумя игроками и двумя гусями"""
+    return SimulationConfig(
+        [("Игрок1", 100), ("Игрок2", 100)],
+        [("Гусь1", "war", 5), ("Гусь2", "honk", 5)],
+    )
+
+
+def test_ring_buffer_records_engine_steps():
+    """Тест записи событий движка в кольцевой буфер"""
+    sink = RingBufferSink(capacity=50)
+    result = SimulationEngine(make_config(), sink).run(200, seed=3)
+    events = list(sink.events)
+    assert len(events) == 50
+    assert events[-1].step <= result.steps
+    for event in events:
+        if event.ok and event.action == "honk_goose_do_honk":
+            assert event.player_before - event.player_after == event.amount
+            assert event.goose_after - event.goose_before == event.amount
+
+
+def test_sink_does_not_change_result():
+    """Тест одинакового результата с приёмником и без него"""
+    quiet = SimulationEngine(make_config()).run(500, seed=5)
+    loud = SimulationEngine(make_config(), RingBufferSink()).run(500, seed=5)
+    assert quiet.player_balances == loud.player_balances
+    assert quiet.goose_balances == loud.goose_balances
+
+
+def test_jsonl_sink_writes_lines(tmp_path):
+    """Тест записи событий в JSON Lines"""
+    path = tmp_path / "events.jsonl"
+    event = SimulationEvent(1, "player_bet", player="Игрок1", amount=-10)
+    with JsonlFileSink(str(path)) as sink:
+        sink.emit(event)
+        sink.emit(event)
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0]) == event.to_dict()
+
+
+def test_binary_sink_round_trip(tmp_path):
+    """Тест чтения событий из двоичного файла"""
+    path = tmp_path / "events.bin"
+    events = [
+        SimulationEvent(1, "war_goose_attack", "Гусь1", "Игрок1", 5, 100, 95, 0, 5),
+        SimulationEvent(2, "recreate_goose", "Гусь1", new_goose="Goose#1"),
+    ]
+    with BinaryFileSink(str(path)) as sink:
+        for event in events:
+            sink.emit(event)
+    assert list(read_binary_events(str(path))) == events
+
+
+def test_event_sink_requires_emit():
+    """Тест абстрактного приёмника без emit"""
+    with pytest.raises(TypeError):
+        EventSink()
+
+
+def test_quiet_run_does_not_prompt():
+    """Тест тихого запуска: действия без вопросов и вывода на каждом шаге"""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "main.py",
+            "--quiet",
+            "--synthetic",
+            "50",
+            "--steps",
+            "200",
+            "--seed",
+            "1",
+        ],
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True,
+        stdin=subprocess.DEVNULL,
+        check=True,
+    )
+    output = result.stdout + result.stderr
+    assert "ПЕРЕСОЗДАНИЕ ГУСЯ" not in output
+    assert "СТАВКА ИГРОКА" not in output
+    assert "not a terminal" not in output
+    assert "СИМУЛЯЦИЯ ЗАВЕРШЕНА" in output
+    assert len(output.splitlines()) <= 3
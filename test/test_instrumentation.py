@@ -0,0 +1,52 @@
+import json
+
+import pytest
+from usecases.instrumentation import Instrumentation
+from usecases.simulation import SimulationConfig, SimulationEngine
+
+
+def test_wrap_counts_successes_and_failures():
+    """Тест подсчёта успешных и неудачных вызовов"""
+    instrumentation = Instrumentation()
+
+    def action(fail):
+        if fail:
+            raise ValueError("неудача")
+        return 1
+
+    wrapped = instrumentation.wrap("action", action)
+    assert wrapped(False) == 1
+    with pytest.raises(ValueError):
+        wrapped(True)
+
+    stats = instrumentation.stats["action"]
+    assert stats.calls == 2
+    assert stats.successes == 1
+    assert stats.failures == 1
+    assert stats.errors == {"ValueError": 1}
+    assert stats.max_ns <= stats.total_ns
+    assert wrapped.__name__ == "action"
+
+
+def test_engine_instrumentation_matches_action_counts(tmp_path):
+    """Тест счётчиков движка и экспорта в JSON"""
+    config = SimulationConfig(
+        [("Игрок1", 1000), ("Игрок2", 1000)],
+        [("Гусь1", "war", 5), ("Гусь2", "honk", 5)],
+    )
+    instrumentation = Instrumentation()
+    expected = SimulationEngine(config).run(300, seed=9)
+    result = SimulationEngine(config, instrumentation=instrumentation).run(
+        300, seed=9
+    )
+    assert result.player_balances == expected.player_balances
+    for name, count in result.action_counts.items():
+        assert instrumentation.stats[name].calls == count
+    steals = instrumentation.stats["casino.war_goose_steal_chip"]
+    assert steals.failures == steals.errors.get("ValueError", 0)
+    assert "player_bet" in instrumentation.summary()
+
+    path = tmp_path / "stats.json"
+    instrumentation.export_json(str(path))
+    exported = json.loads(path.read_text(encoding="utf-8"))
+    assert exported["player_bet"]["calls"] == result.action_counts["player_bet"]
@@ -0,0 +1,127 @@
+import io
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from adapter.cli import cli
+from adapter.live_status import CSI, LiveStatus, run_live
+from domain.casino_entities import Player
+from usecases.simulation import SimulationConfig, SimulationEngine
+
+
+class FakeClock:
+    """Часы, которые двигает тест"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_status(tty, max_rows=3):
+    engine = SimulationEngine(SimulationConfig([], []))
+    engine.casino.add_players_many([Player(f"Игрок{i}", 100) for i in range(5)])
+    clock = FakeClock()
+    stream = io.StringIO()
+    status = LiveStatus(
+        engine.casino,
+        stream,
+        tty=tty,
+        fps=10,
+        summary_interval=1.0,
+        max_rows=max_rows,
+        clock=clock,
+    )
+    status.attach()
+    return engine.casino, status, stream, clock
+
+
+def test_tty_redraws_only_dirty_visible_rows():
+    """Тест перерисовки на месте только изменившихся видимых строк"""
+    casino, status, stream, clock = make_status(tty=True)
+    assert status.update(0)
+    first = stream.getvalue()
+    assert first.count("\n") == 1 + 3 + 1
+    assert "Игрок3" not in first
+
+    player = casino.search_player("Игрок1")
+    player.balance -= 7
+    casino._balance_changed(player, -7)
+    casino._balance_changed(casino.search_player("Игрок4"), 0)
+    clock.now = 0.01
+    assert not status.update(1)
+    clock.now = 0.2
+    assert status.update(2)
+    frame = stream.getvalue()[len(first) :]
+    assert frame.count(f"{CSI}2K") == 2
+    assert f"{CSI}3A\r{CSI}2KИгрок1" in frame and "93" in frame
+    assert "Игрок4" not in frame
+    assert "изменилось 2" in frame
+    assert not status.dirty
+
+
+def test_removed_player_marked_and_summaries_without_tty():
+    """Тест отметки выбывшего игрока и сводок вне терминала"""
+    casino, status, stream, clock = make_status(tty=True)
+    status.update(0)
+    player = casino.search_player("Игрок0")
+    casino._balance_changed(player, 0)
+    casino.remove_player(player)
+    status.close(1)
+    assert "выбыл" in stream.getvalue()
+    assert status.on_balance_change not in casino.balance_listeners
+
+    casino, status, stream, clock = make_status(tty=False)
+    for step in range(50):
+        clock.now = step * 0.1
+        casino._balance_changed(casino.search_player("Игрок2"), 0)
+        status.update(step)
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 5
+    assert CSI not in stream.getvalue()
+
+
+def test_run_live_reaches_result():
+    """Тест автоматической симуляции с живым статусом"""
+    stream = io.StringIO()
+    result = run_live(2000, seed=3, synthetic=50, stream=stream)
+    output = stream.getvalue()
+    assert "Загружено игроков: 50" in output
+    assert result.steps <= 2000
+    assert "Победитель" in output
+
+
+def test_headless_run_without_prompts_and_ui_imports():
+    """Тест запуска --live --steps без вопросов и без интерактивных модулей"""
+    code = (
+        "import sys\n"
+        "sys.argv = ['main.py', '--live', '--steps', '50', '--synthetic', '20',"
+        " '--seed', '1']\n"
+        "import main\n"
+        "main.main()\n"
+        "loaded = {'typer', 'questionary', 'numpy', 'adapter.casino_simulation'}\n"
+        "print(sorted(loaded & sys.modules.keys()))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True,
+        stdin=subprocess.DEVNULL,
+        check=True,
+    )
+    assert "Победитель" in result.stdout
+    assert result.stdout.strip().endswith("[]")
+
+
+def test_cli_rejects_flags_of_other_mode():
+    """Тест отказа от флагов, которые в выбранном режиме игнорировались бы"""
+    with pytest.raises(ValueError, match="--next-event"):
+        cli(quiet=True, steps=1, seed=0, synthetic=2, next_event=True)
+    with pytest.raises(ValueError, match="--stats"):
+        cli(stats=True, live=True, steps=1, seed=0, synthetic=2)
+    with pytest.raises(ValueError, match="--stats"):
+        cli(stats_json="stats.json", live=True, steps=1, seed=0, synthetic=2)
@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+from usecases.loader import (
+    load_geese,
+    load_players,
+    read_geese,
+    read_players,
+    synthetic_geese,
+    synthetic_players,
+)
+from usecases.online_stats import BalanceAggregator
+from usecases.simulation import SimulationConfig, SimulationEngine
+
+
+def empty_casino(columnar=False):
+    return SimulationEngine(SimulationConfig([], [], columnar=columnar)).casino
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_load_synthetic_population_in_chunks(columnar):
+    """Тест загрузки случайного состава блоками в коллекции и индексы"""
+    casino = empty_casino(columnar)
+    report = load_players(casino, synthetic_players(1000, seed=1), chunk_size=128)
+    load_geese(casino, synthetic_geese(300, seed=1), report, chunk_size=128)
+    assert report.players == 1000
+    assert report.geese == 300
+    assert report.chunks == 8 + 3
+    assert report.rate > 0
+    assert len(casino.player_collection) == 1000
+    assert len(casino.goose_collection) == 300
+    assert casino.search_player("Игрок999").balance >= 1
+    assert casino.search_goose("Гусь299").name == "Гусь299"
+    assert list(synthetic_players(50, seed=1)) == list(synthetic_players(50, seed=1))
+
+
+def test_load_from_csv_and_jsonl(tmp_path):
+    """Тест чтения игроков из CSV и гусей из JSON Lines"""
+    players = tmp_path / "players.csv"
+    players.write_text("name,balance\nАня,100\nБоря,250\n", encoding="utf-8")
+    geese = tmp_path / "geese.jsonl"
+    geese.write_text(
+        json.dumps({"name": "Серый", "kind": "war", "volume": 3}, ensure_ascii=False)
+        + "\n\n"
+        + json.dumps({"name": "Белый", "kind": "honk", "volume": 7}, ensure_ascii=False)
+        + "\n",
+        encoding="utf-8",
+    )
+    casino = empty_casino()
+    aggregator = BalanceAggregator()
+    casino.add_aggregator(aggregator)
+    report = load_players(casino, read_players(str(players)))
+    load_geese(casino, read_geese(str(geese)), report)
+    assert report.entities == 4
+    assert casino.search_player_balance("Боря") == 250
+    assert aggregator.players.total == 350
+    assert [type(goose).__name__ for goose in casino.goose_collection] == [
+        "WarGoose",
+        "HonkGoose",
+    ]
+
+
+def test_duplicate_names_rejected_or_skipped():
+    """Тест отсечения повторяющихся имён"""
+    casino = empty_casino()
+    load_players(casino, [("Аня", 10)])
+    with pytest.raises(ValueError):
+        load_players(casino, [("Боря", 5), ("Аня", 20)])
+    report = load_players(
+        casino, [("Аня", 20), ("Вова", 3), ("Вова", 4)], skip_duplicates=True
+    )
+    assert report.players == 1
+    assert report.duplicates == 2
+    assert casino.search_player_balance("Аня") == 10
+    with pytest.raises(ValueError):
+        load_geese(casino, [("Гусь", "duck", 1)])
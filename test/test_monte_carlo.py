@@ -0,0 +1,38 @@
+from usecases.monte_carlo import MonteCarloStats, RunSummary, run_monte_carlo
+from usecases.simulation import SimulationConfig
+
+
+def make_config():
+    """Конфигурация для серии запусков"""
+    return SimulationConfig(
+        [("Игрок1", 50), ("Игрок2", 50)],
+        [("Гусь1", "war", 5), ("Гусь2", "honk", 5)],
+    )
+
+
+def test_monte_carlo_streams_every_run():
+    """Тест получения итога каждого запуска"""
+    summaries = list(run_monte_carlo(make_config(), 20, 10**5, seed=3, workers=2))
+    assert sorted(summary.run_index for summary in summaries) == list(range(20))
+    assert all(summary.steps > 0 for summary in summaries)
+
+
+def test_monte_carlo_does_not_depend_on_workers():
+    """Тест независимости результатов от количества воркеров и пачек"""
+    first = run_monte_carlo(make_config(), 12, 10**5, seed=5, workers=1, chunk_size=5)
+    second = run_monte_carlo(make_config(), 12, 10**5, seed=5, workers=2, chunk_size=2)
+    by_index = {summary.run_index: summary for summary in first}
+    for summary in second:
+        assert summary.steps == by_index[summary.run_index].steps
+        assert summary.goose_loot == by_index[summary.run_index].goose_loot
+
+
+def test_monte_carlo_stats():
+    """Тест накопления статистики по серии"""
+    stats = MonteCarloStats()
+    stats.add(RunSummary(0, 10, "geese", {}, 100))
+    stats.add(RunSummary(1, 30, "players", {"Игрок1": 5000}, 20))
+    assert stats.runs == 2
+    assert stats.bankruptcy_rate == 0.5
+    assert stats.mean_steps == 20
+    assert stats.total_goose_loot == 120
@@ -0,0 +1,88 @@
+import random
+import statistics
+
+import pytest
+
+from usecases.events import RingBufferSink
+from usecases.online_stats import BalanceAggregator, BalanceSketch, OnlineStats
+from usecases.simulation import SimulationConfig, SimulationEngine
+
+
+def test_online_stats_follow_updates():
+    """Тест среднего и дисперсии при добавлении, удалении и замене"""
+    rng = random.Random(1)
+    values = [rng.randint(-50, 10**6) for _ in range(500)]
+    stats = OnlineStats()
+    for value in values:
+        stats.add(value)
+    for i in range(0, 500, 3):
+        new = rng.randint(0, 5000)
+        stats.replace(values[i], new)
+        values[i] = new
+    for value in values[:200]:
+        stats.remove(value)
+    rest = values[200:]
+    assert stats.count == len(rest)
+    assert stats.total == sum(rest)
+    assert stats.mean == pytest.approx(statistics.fmean(rest))
+    assert stats.stddev == pytest.approx(statistics.pstdev(rest))
+
+
+def test_sketch_quantiles_within_bucket_error():
+    """Тест точности квантилей эскиза"""
+    rng = random.Random(2)
+    values = sorted(rng.randint(-1000, 10**7) for _ in range(10000))
+    sketch = BalanceSketch()
+    for value in values:
+        sketch.add(value)
+    for value in values[:5000:2]:
+        sketch.remove(value)
+    rest = sorted(values[1:5000:2] + values[5000:])
+    for q in (0.0, 0.1, 0.5, 0.9, 0.99, 1.0):
+        exact = rest[min(len(rest) - 1, int(q * len(rest)))]
+        assert sketch.quantile(q) == pytest.approx(exact, rel=1 / 64, abs=1)
+    assert sketch.min <= rest[0]
+    assert sketch.min == pytest.approx(rest[0], rel=1 / 64)
+    assert sketch.max >= rest[-1]
+    assert len(sketch.counts) < 2000
+
+
+def test_small_values_are_exact():
+    """Тест точного хранения небольших значений"""
+    sketch = BalanceSketch()
+    for value in (5, 7, 7, 100):
+        sketch.add(value)
+    sketch.replace(100, 3)
+    assert [sketch.quantile(q) for q in (0.0, 0.5, 1.0)] == [3, 7, 7]
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_aggregator_tracks_simulation(columnar):
+    """Тест совпадения сводки с полным обходом игроков после симуляции"""
+    config = SimulationConfig(
+        [(f"Игрок{i}", 200 + i) for i in range(100)],
+        [(f"Гусь{i}", "war" if i % 2 else "honk", 4) for i in range(10)],
+        columnar=columnar,
+    )
+    engine = SimulationEngine(config, sink=RingBufferSink(10**5))
+    engine.reset(4)
+    aggregator = BalanceAggregator()
+    engine.casino.add_aggregator(aggregator)
+    engine.advance(5000)
+
+    balances = [player.balance for player in engine.casino.iter_player()]
+    summary = aggregator.to_dict()
+    assert summary["players"]["count"] == len(balances)
+    assert summary["players"]["sum"] == sum(balances)
+    assert summary["players"]["mean"] == pytest.approx(statistics.fmean(balances))
+    assert summary["departed"] == len(engine.bankrupt_players)
+    attacks = {"war_goose_attack": "war", "honk_goose_do_honk": "honk"}
+    for action, kind in attacks.items():
+        events = [e for e in engine.sink.events if e.action == action and e.ok]
+        assert aggregator.loot[kind].count == len(events)
+        assert aggregator.loot[kind].total == sum(e.amount for e in events)
+    assert "Квантили баланса" in aggregator.summary()
+
+    engine.reset(5)
+    assert aggregator.players.count == 100
+    assert aggregator.loot["war"].count == 0
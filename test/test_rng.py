@@ -0,0 +1,112 @@
+import random
+
+from domain.casino_entities import HonkGoose, Player, WarGoose
+from domain.rng import NumpyRandom, SeedSequence, spawn_rngs
+from repository.casino_collections import (
+    ChipCollection,
+    GooseCollection,
+    IndexDictChip,
+    IndexDictGoose,
+    IndexDictPlayer,
+    PlayerCollection,
+)
+from usecases.casino import Casino
+from usecases.simulation import SimulationConfig, SimulationEngine
+
+
+def make_casino(rng):
+    """Создание казино с собственным генератором"""
+    casino = Casino(
+        ChipCollection(),
+        PlayerCollection(),
+        GooseCollection(),
+        IndexDictChip(),
+        IndexDictPlayer(),
+        IndexDictGoose(),
+        rng,
+    )
+    casino.add_player(Player("Игрок", 10**6))
+    casino.add_goose(WarGoose("Вор", 10, rng))
+    casino.add_goose(HonkGoose("Крикун", 5, rng))
+    return casino
+
+
+def play(casino, steps):
+    """Прогон набора действий с записью результатов"""
+    outcomes = []
+    for _ in range(steps):
+        try:
+            outcomes.append(casino.war_goose_steal_chip("Вор", "Игрок").value)
+        except ValueError:
+            outcomes.append(0)
+        try:
+            outcomes.append(casino.honk_goose_honk("Крикун", "Игрок"))
+        except ValueError:
+            outcomes.append(0)
+        outcomes.append(casino.player_bet("Игрок", 10, 7))
+    return outcomes
+
+
+def test_injected_rng_is_isolated_from_global_random():
+    """Тест независимости казино от глобального random"""
+    expected = play(make_casino(random.Random(5)), 50)
+    casino = make_casino(random.Random(5))
+    random.seed(123)
+    interleaved = []
+    for _ in range(50):
+        random.random()
+        interleaved.extend(play(casino, 1))
+    assert interleaved == expected
+
+
+def test_two_casinos_do_not_disturb_each_other():
+    """Тест чередования двух казино в одном процессе"""
+    first, second = make_casino(random.Random(1)), make_casino(random.Random(2))
+    expected_first = play(make_casino(random.Random(1)), 30)
+    outcomes = []
+    for _ in range(30):
+        outcomes.extend(play(first, 1))
+        play(second, 1)
+    assert outcomes == expected_first
+
+
+def test_seed_sequence_children_are_reproducible_and_distinct():
+    """Тест воспроизводимости и различия потомков"""
+    children = SeedSequence(42).spawn(3)
+    again = SeedSequence(42).spawn(3)
+    states = [child.generate_state() for child in children]
+    assert states == [child.generate_state() for child in again]
+    assert len(set(states)) == 3
+
+
+def test_seed_sequence_spawn_continues_numbering():
+    """Тест продолжения нумерации при повторном порождении"""
+    root = SeedSequence(7)
+    first = root.spawn(2)
+    second = root.spawn(2)
+    assert [child.spawn_key for child in first + second] == [(0,), (1,), (2,), (3,)]
+
+
+def test_spawn_rngs_drive_engine_reproducibly():
+    """Тест запуска движка на порождённых генераторах"""
+    config = SimulationConfig(
+        [("Игрок1", 100), ("Игрок2", 100)], [("Гусь1", "war", 5), ("Гусь2", "honk", 5)]
+    )
+    first = [SimulationEngine(config).run(300, rng=rng) for rng in spawn_rngs(9, 2)]
+    second = [SimulationEngine(config).run(300, rng=rng) for rng in spawn_rngs(9, 2)]
+    assert [r.player_balances for r in first] == [r.player_balances for r in second]
+
+
+def test_numpy_random_adapter():
+    """Тест адаптера генератора NumPy"""
+
+    class FakeGenerator:
+        def random(self):
+            return 0.25
+
+        def integers(self, low, high):
+            return high - 1
+
+    rng = NumpyRandom(FakeGenerator())
+    assert rng.random() == 0.25
+    assert rng.randint(1, 36) == 36
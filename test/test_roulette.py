@@ -0,0 +1,154 @@
+import random
+
+import numpy as np
+from domain.casino_entities import Player
+from domain.roulette import (
+    BET_BLACK,
+    BET_EVEN,
+    BET_INVALID,
+    BET_ODD,
+    BET_RED,
+    NUMBER_COLOUR,
+    encode_bet,
+)
+from repository.casino_collections import (
+    ChipCollection,
+    GooseCollection,
+    IndexDictChip,
+    IndexDictGoose,
+    IndexDictPlayer,
+    PlayerCollection,
+)
+from usecases.casino import Casino
+from usecases.roulette import (
+    STATUS_INSUFFICIENT_BALANCE,
+    STATUS_INVALID_BET,
+    STATUS_INVALID_NUMBER,
+    STATUS_LOSS,
+    STATUS_UNKNOWN_PLAYER,
+    STATUS_WIN,
+    VectorizedRoulette,
+)
+
+
+class FixedSpins:
+    """Генератор, всегда выдающий заданные числа"""
+
+    def __init__(self, number):
+        self.number = number
+
+    def integers(self, low, high, size):
+        return np.full(size, self.number)
+
+
+def test_encode_bet():
+    """Тест кодирования типов ставок"""
+    assert encode_bet(17) == 17
+    assert encode_bet("четное") == BET_EVEN
+    assert encode_bet("чёрное") == BET_BLACK
+    assert encode_bet("синее") == BET_INVALID
+
+
+def test_number_colour_table():
+    """Тест таблицы цветов колеса"""
+    assert NUMBER_COLOUR[0] == "зелёное"
+    assert NUMBER_COLOUR[1] == "красное"
+    assert NUMBER_COLOUR[2] == "чёрное"
+
+
+def test_bet_many_payouts():
+    """Тест выплат на число и на внешние ставки"""
+    roulette = VectorizedRoulette([1000, 1000, 1000, 1000], rng=FixedSpins(7))
+    result = roulette.bet_many([0, 1, 2, 3], [100, 100, 100, 100],
+                               [7, BET_ODD, BET_RED, BET_EVEN])
+    assert result.statuses.tolist() == [STATUS_WIN, STATUS_WIN, STATUS_WIN, STATUS_LOSS]
+    assert roulette.balances.tolist() == [1000 + 34 * 100, 1100, 1100, 900]
+
+
+def test_bet_many_zero_loses_outside_bets():
+    """Тест проигрыша внешних ставок на зеро"""
+    roulette = VectorizedRoulette([100, 100], rng=FixedSpins(0))
+    result = roulette.bet_many([0, 1], [10, 10], [BET_EVEN, 0])
+    assert result.statuses.tolist() == [STATUS_LOSS, STATUS_WIN]
+    assert roulette.balances.tolist() == [90, 100 + 34 * 10]
+
+
+def test_bet_many_reports_errors_per_element():
+    """Тест поэлементных ошибок вместо исключений"""
+    roulette = VectorizedRoulette([100, 100, 100, 100], rng=FixedSpins(5))
+    result = roulette.bet_many([0, 1, 2, 9], [500, 10, 10, 10],
+                               [5, 50, BET_INVALID, 5])
+    assert result.statuses.tolist() == [
+        STATUS_INSUFFICIENT_BALANCE,
+        STATUS_INVALID_NUMBER,
+        STATUS_INVALID_BET,
+        STATUS_UNKNOWN_PLAYER,
+    ]
+    assert roulette.balances.tolist() == [100, 100, 100, 100]
+
+
+def test_bet_many_checks_cumulative_stakes():
+    """Тест проверки баланса с учётом предыдущих ставок игрока в пакете"""
+    roulette = VectorizedRoulette([100, 50], rng=FixedSpins(2))
+    result = roulette.bet_many([0, 1, 0, 0], [60, 50, 40, 10], [1, 1, 1, 1])
+    assert result.statuses.tolist() == [
+        STATUS_LOSS, STATUS_LOSS, STATUS_LOSS, STATUS_INSUFFICIENT_BALANCE
+    ]
+    assert roulette.balances.tolist() == [0, 0]
+
+
+def test_bet_many_matches_sequential_player_bet():
+    """Тест пакета со смесью отклонённых и принятых ставок против player_bet"""
+    class LosingRandom(random.Random):
+        """Генератор, на котором ставка на число 1 проигрывает"""
+
+        def randint(self, a, b):
+            return 2
+
+    balances = [100, 30, 500]
+    ids = [0, 0, 1, 0, 1, 2, 0, 2, 9]
+    stakes = [150, 50, 40, 60, 30, 600, 50, 500, 10]
+    codes = [1, 1, 1, 1, 1, 1, 1, 40, 1]
+    casino = Casino(
+        ChipCollection(),
+        PlayerCollection(),
+        GooseCollection(),
+        IndexDictChip(),
+        IndexDictPlayer(),
+        IndexDictGoose(),
+        LosingRandom(),
+    )
+    for position, balance in enumerate(balances):
+        casino.add_player(Player(f"Игрок{position}", balance))
+    expected = []
+    for player_id, stake, code in zip(ids, stakes, codes):
+        try:
+            casino.player_bet(f"Игрок{player_id}", stake, code)
+        except ValueError as error:
+            expected.append(str(error))
+        else:
+            expected.append(STATUS_LOSS)
+
+    roulette = VectorizedRoulette(balances, rng=FixedSpins(2))
+    result = roulette.bet_many(ids, stakes, codes)
+
+    messages = {
+        STATUS_INSUFFICIENT_BALANCE: "Ставка больше чем баланс игрока",
+        STATUS_INVALID_NUMBER: "Нужно выбрать число от 0 до 36",
+        STATUS_UNKNOWN_PLAYER: "Игрока с таким именем нет",
+    }
+    actual = [messages.get(status, status) for status in result.statuses.tolist()]
+    assert actual == expected
+    assert roulette.balances.tolist() == [
+        casino.search_player_balance(f"Игрок{i}") for i in range(3)
+    ]
+
+
+def test_from_players_and_write_back():
+    """Тест переноса балансов между игроками и массивом"""
+    players = [Player("Игрок1", 100), Player("Игрок2", 200)]
+    roulette = VectorizedRoulette.from_players(players, rng=FixedSpins(3))
+    roulette.bet_many([1], [100], [3])
+    roulette.write_back(players)
+    assert players[1].balance == 200 + 34 * 100
+    assert roulette.balances.flags["C_CONTIGUOUS"]
@@ -0,0 +1,113 @@
+import math
+import random
+
+import pytest
+from domain.casino_entities import Chip, Player, WarGoose
+from domain.sampling import AliasTable, binomial, multinomial
+from repository.casino_collections import (
+    ChipCollection,
+    GooseCollection,
+    IndexDictChip,
+    IndexDictGoose,
+    IndexDictPlayer,
+    PlayerCollection,
+)
+from usecases.casino import Casino
+
+
+@pytest.fixture
+def casino():
+    """Фикстура казино с игроком и боевым гусем"""
+    casino = Casino(
+        ChipCollection(),
+        PlayerCollection(),
+        GooseCollection(),
+        IndexDictChip(),
+        IndexDictPlayer(),
+        IndexDictGoose(),
+        random.Random(3),
+    )
+    casino.add_player(Player("Игрок", 10**6))
+    casino.add_goose(WarGoose("Вор", 100))
+    return casino
+
+
+def test_alias_table_matches_weights():
+    """Тест частот выбора по таблице псевдонимов"""
+    weights = [1, 0, 3, 6]
+    table = AliasTable(weights)
+    rng = random.Random(0)
+    counts = [0] * len(weights)
+    for _ in range(100000):
+        counts[table.sample(rng)] += 1
+    assert counts[1] == 0
+    for count, weight in zip(counts, weights):
+        assert abs(count / 100000 - weight / 10) < 0.01
+
+
+def test_alias_table_rejects_bad_weights():
+    """Тест проверки весов"""
+    with pytest.raises(ValueError):
+        AliasTable([0, 0])
+    with pytest.raises(ValueError):
+        AliasTable([1, -1])
+
+
+@pytest.mark.parametrize("n, p", [(20, 0.1), (50, 0.9), (100000, 0.3), (5000, 0.75)])
+def test_binomial_mean_and_variance(n, p):
+    """Тест среднего и дисперсии биномиального броска"""
+    rng = random.Random(1)
+    draws = [binomial(rng, n, p) for _ in range(20000)]
+    mean = sum(draws) / len(draws)
+    variance = sum((draw - mean) ** 2 for draw in draws) / len(draws)
+    assert all(0 <= draw <= n for draw in draws)
+    assert abs(mean - n * p) < 4 * math.sqrt(n * p * (1 - p) / len(draws))
+    assert abs(variance / (n * p * (1 - p)) - 1) < 0.05
+
+
+def test_binomial_edge_cases():
+    """Тест крайних вероятностей и проверки аргументов"""
+    rng = random.Random(2)
+    assert binomial(rng, 10, 0.0) == 0
+    assert binomial(rng, 10, 1.0) == 10
+    assert binomial(rng, 0, 0.5) == 0
+    with pytest.raises(ValueError):
+        binomial(rng, -1, 0.5)
+
+
+def test_multinomial_splits_count():
+    """Тест полиномиального броска: сумма сохраняется, нулевые веса пусты"""
+    rng = random.Random(3)
+    weights = (0.5, 0.0, 1.5, 0.0)
+    totals = [0] * len(weights)
+    for _ in range(2000):
+        counts = multinomial(rng, 1000, weights)
+        assert sum(counts) == 1000
+        assert counts[1] == counts[3] == 0
+        totals = [total + count for total, count in zip(totals, counts)]
+    assert abs(totals[0] / 2000000 - 0.25) < 0.005
+
+
+def test_chips_stay_sorted_by_value(casino):
+    """Тест порядка фишек и двустороннего поиска номинала"""
+    casino.add_chip(Chip("purple", 7))
+    assert [chip.value for chip in casino.iter_chip()] == [1, 5, 7, 10, 25, 50]
+    assert [value for _, value in casino.index_dict_chip] == [1, 5, 7, 10, 25, 50]
+    assert casino.index_dict_chip.search_chip_colour(7) == "purple"
+    with pytest.raises(ValueError, match="наминал"):
+        casino.add_chip(Chip("pink", 7))
+    assert len(casino.chip_collection) == 6
+
+
+def test_weighted_theft_uses_weights(casino, mocker):
+    """Тест кражи фишки с заданными весами"""
+    mocker.patch.object(WarGoose, "steal_chip", return_value=True)
+    casino.set_chip_theft_weights({"white": 0, "green": 0, "blue": 0, "red": 0})
+    stolen = {casino.war_goose_steal_chip("Вор", "Игрок").colour for _ in range(50)}
+    assert stolen == {"black"}
+
+    casino.add_chip(Chip("gold", 1000))
+    casino.set_chip_theft_weights({"gold": 1, "black": 0})
+    casino.pop_chip(1)
+    stolen = {casino.war_goose_steal_chip("Вор", "Игрок").colour for _ in range(200)}
+    assert stolen == {"green", "blue", "red", "gold"}
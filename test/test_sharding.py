@@ -0,0 +1,100 @@
+import pytest
+
+from usecases.sharding import ShardCoordinator, ShardStats
+from usecases.simulation import SimulationConfig
+
+
+def make_config():
+    """Конфигурация на несколько столов"""
+    return SimulationConfig(
+        [(f"Игрок{i}", 200) for i in range(40)],
+        [(f"Гусь{i}", "war" if i % 2 else "honk", 3) for i in range(16)],
+        win_balance=10**6,
+    )
+
+
+def summary(stats):
+    """Поля статистики для сравнения"""
+    return [vars(part) for part in stats]
+
+
+def test_players_are_partitioned_by_id():
+    """Тест раскладки игроков и гусей по столам"""
+    with ShardCoordinator(make_config(), 4, processes=False) as coordinator:
+        first = coordinator.local[1].engine.casino
+        assert [player.name for player in first.iter_player()][:2] == [
+            "Игрок1",
+            "Игрок5",
+        ]
+        assert len(first.goose_collection) == 4
+        assert coordinator.owner["Игрок6"] == 2
+
+
+def test_processes_match_local_run():
+    """Тест совпадения столов в процессах и в текущем процессе"""
+    results = []
+    for processes in (False, True):
+        with ShardCoordinator(
+            make_config(), 3, seed=5, migration=0.1, processes=processes
+        ) as coordinator:
+            coordinator.run(4, 200)
+            results.append(summary(coordinator.stats))
+    assert results[0] == results[1]
+
+
+def test_moves_are_applied_between_rounds():
+    """Тест перехода игрока за другой стол в начале следующего раунда"""
+    with ShardCoordinator(make_config(), 2, processes=False) as coordinator:
+        coordinator.move("Игрок0", 1)
+        combined = coordinator.play_round(1)
+        assert combined.moves == 1
+        assert coordinator.owner["Игрок0"] == 1
+        assert coordinator.arrivals[1][0][0] == "Игрок0"
+        coordinator.play_round(1)
+        casino = coordinator.local[1].engine.casino
+        assert casino.search_player("Игрок0").balance > 0
+        with pytest.raises(ValueError):
+            coordinator.move("Игрок0", 7)
+
+
+def test_players_are_conserved_under_migration():
+    """Тест сохранения игроков при случайных переходах"""
+    with ShardCoordinator(
+        make_config(), 4, seed=1, migration=0.2, processes=False
+    ) as coordinator:
+        for _ in range(5):
+            combined = coordinator.play_round(100)
+            waiting = sum(len(arrivals) for arrivals in coordinator.arrivals)
+            assert combined.players + combined.bankrupt + waiting == 40
+        assert combined.moves > 0
+
+
+def test_combine_winner():
+    """Тест итога игры по статистике столов"""
+
+    def part(winner):
+        return ShardStats(0, 1, winner, 0, 0, 0, 0, 0, {"player_bet": 1})
+
+    assert ShardStats.combine([part("geese"), part("geese")]).winner == "geese"
+    assert ShardStats.combine([part("geese"), part(None)]).winner is None
+    combined = ShardStats.combine([part(None), part("players")])
+    assert combined.winner == "players"
+    assert combined.action_counts == {"player_bet": 2}
+
+
+def test_bankrupt_players_leave_owner():
+    """Тест отказа в переходе игроку, который уже обанкротился"""
+    with ShardCoordinator(make_config(), 2, processes=False) as coordinator:
+        coordinator.run(4, 300)
+        bankrupt = [
+            name
+            for shard in coordinator.local
+            for name in shard.engine.bankrupt_players
+        ]
+        assert bankrupt
+        assert not set(bankrupt) & set(coordinator.owner)
+        assert len(coordinator.owner) == sum(
+            part.players for part in coordinator.stats
+        )
+        with pytest.raises(ValueError):
+            coordinator.move(bankrupt[0], 0)
@@ -0,0 +1,124 @@
+import statistics
+
+import pytest
+from domain.casino_entities import WarGoose
+from usecases.events import RingBufferSink
+from usecases.instrumentation import Instrumentation
+from usecases.simulation import SimulationConfig, SimulationEngine
+
+
+@pytest.fixture
+def config():
+    """Фикстура конфигурации с тремя игроками и двумя гусями"""
+    return SimulationConfig(
+        [("Игрок1", 100), ("Игрок2", 100), ("Игрок3", 100)],
+        [("Гусь1", "war", 5), ("Гусь2", "honk", 5)],
+    )
+
+
+def test_engine_builds_casino(config):
+    """Тест создания казино по конфигурации"""
+    engine = SimulationEngine(config)
+    assert len(engine.casino.player_collection) == 3
+    assert len(engine.casino.goose_collection) == 2
+
+
+def test_engine_run_is_reproducible(config):
+    """Тест воспроизводимости запуска с одним сидом"""
+    first = SimulationEngine(config).run(500, seed=42)
+    second = SimulationEngine(config).run(500, seed=42)
+    assert first.steps == second.steps
+    assert first.player_balances == second.player_balances
+    assert first.goose_balances == second.goose_balances
+
+
+def test_engine_stops_on_game_over(config):
+    """Тест остановки симуляции при окончании игры"""
+    result = SimulationEngine(config).run(10**6, seed=1)
+    assert result.winner in ("players", "geese")
+    assert result.steps < 10**6
+    assert sum(result.action_counts.values()) == result.steps
+    if result.winner == "geese":
+        assert result.player_balances == {}
+        assert len(result.bankrupt_players) == 3
+
+
+def test_engine_advance_continues_run(config):
+    """Тест продолжения симуляции по частям"""
+    engine = SimulationEngine(config)
+    engine.run(10, seed=7)
+    result = engine.advance(10)
+    assert result.steps == 20 or result.winner is not None
+
+
+def test_config_rejects_unknown_goose_kind():
+    """Тест проверки типа гуся в конфигурации"""
+    with pytest.raises(ValueError, match="Неизвестный тип гуся"):
+        SimulationConfig([("Игрок1", 100)], [("Гусь1", "fire", 5)])
+
+
+def test_columnar_engine_matches_object_engine(config):
+    """Тест совпадения столбцового и объектного хранения"""
+    columnar = SimulationConfig(config.players, config.geese, columnar=True)
+    expected = SimulationEngine(config).run(2000, seed=11)
+    result = SimulationEngine(columnar).run(2000, seed=11)
+    assert result.steps == expected.steps
+    assert result.player_balances == expected.player_balances
+    assert result.goose_balances == expected.goose_balances
+
+
+def test_next_event_matches_step_distribution(config):
+    """Тест совпадения распределения итогов пошагового цикла и планировщика"""
+    event_config = SimulationConfig(config.players, config.geese, next_event=True)
+    summaries = []
+    for current in (config, event_config):
+        engine = SimulationEngine(current)
+        results = [engine.run(300, seed=seed) for seed in range(1000)]
+        counts = [result.action_counts for result in results]
+        summaries.append(
+            (
+                statistics.mean(result.steps for result in results),
+                statistics.mean(result.total_goose_loot for result in results),
+                statistics.mean(
+                    count["war_goose_attack"] / sum(count.values()) for count in counts
+                ),
+            )
+        )
+    (steps, loot, war_share), (event_steps, event_loot, event_war_share) = summaries
+    assert event_steps == pytest.approx(steps, rel=0.05)
+    assert event_loot == pytest.approx(loot, rel=0.15)
+    assert event_war_share == pytest.approx(war_share, abs=0.02)
+
+
+def test_next_event_counts_skipped_steps():
+    """Тест учёта пропущенных пустых шагов в счётчиках действий"""
+    engine = SimulationEngine(SimulationConfig([], [], next_event=True))
+    result = engine.run(1000, seed=3)
+    assert result.steps == 1000
+    assert result.winner is None
+    assert sum(result.action_counts.values()) == 1000
+
+
+def test_next_event_rates_follow_casino_changes(config):
+    """Тест перестройки сводки гусей после изменений в обход движка"""
+    engine = SimulationEngine(SimulationConfig(config.players, [], next_event=True))
+    engine.reset(5)
+    engine.step_events(20)
+    assert engine.goose_rates.ceilings[WarGoose] == 0.0
+    engine.casino.add_goose(WarGoose("Громкий", 40, engine.rng))
+    engine.step_events(1)
+    assert engine.goose_rates.ceilings[WarGoose] == 1.0
+    assert engine.step == 21 or engine.winner is not None
+
+
+def test_next_event_rejects_sink_and_instrumentation(config):
+    """Тест запрета планировщика вместе с приёмником и счётчиками"""
+    event_config = SimulationConfig(config.players, config.geese, next_event=True)
+    with pytest.raises(ValueError):
+        SimulationEngine(event_config, sink=RingBufferSink(10))
+    with pytest.raises(ValueError):
+        SimulationEngine(event_config, instrumentation=Instrumentation())
+    engine = SimulationEngine(event_config)
+    engine.sink = RingBufferSink(10)
+    with pytest.raises(ValueError):
+        engine.advance(10)
@@ -0,0 +1,153 @@
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from domain.casino_entities import HonkGoose, Player, WarGoose
+from repository.casino_collections import (
+    ChipCollection,
+    IndexDictChip,
+    IndexDictGoose,
+    IndexDictPlayer,
+    IndexedGooseCollection,
+    IndexedPlayerCollection,
+)
+from usecases.casino import Casino
+from usecases.events import RingBufferSink
+from usecases.simulation import SimulationConfig, SimulationEngine
+from usecases.snapshot import load_snapshot, save_snapshot
+
+
+def make_config(columnar=False):
+    """Конфигурация с несколькими игроками и гусями обоих типов"""
+    return SimulationConfig(
+        [(f"Игрок{i}", 300) for i in range(12)],
+        [(f"Гусь{i}", "war" if i % 3 else "honk", i % 10) for i in range(12)],
+        columnar=columnar,
+    )
+
+
+def continue_from_snapshot(path, source_columnar, target_columnar):
+    """Прогон с сохранением посередине и продолжение в новом движке"""
+    original = SimulationEngine(make_config(source_columnar), sink=RingBufferSink(10**5))
+    original.reset(7)
+    original.advance(300)
+    save_snapshot(path, original.casino, original)
+    expected = original.advance(3000)
+
+    resumed = SimulationEngine(make_config(target_columnar), sink=RingBufferSink(10**5))
+    resumed.reset(1)
+    load_snapshot(path, resumed.casino, resumed)
+    actual = resumed.advance(3000)
+    return expected, actual, original, resumed
+
+
+def test_resume_is_bit_for_bit(tmp_path):
+    """Тест совпадения продолженного запуска с непрерванным"""
+    path = tmp_path / "casino.snap"
+    expected, actual, original, resumed = continue_from_snapshot(path, False, False)
+    assert vars(actual) == vars(expected)
+    tail = list(original.sink.events)[-len(resumed.sink.events) :]
+    assert list(resumed.sink.events) == tail
+
+
+@pytest.mark.parametrize("source, target", [(True, True), (False, True), (True, False)])
+def test_resume_columnar(tmp_path, source, target):
+    """Тест снимка столбцового казино и загрузки в другое хранение"""
+    path = tmp_path / "casino.snap"
+    expected, actual, *_ = continue_from_snapshot(path, source, target)
+    assert vars(actual) == vars(expected)
+
+
+def test_snapshot_keeps_theft_weights_and_winner(tmp_path):
+    """Тест сохранения весов кражи и итога игры"""
+    path = tmp_path / "casino.snap"
+    engine = SimulationEngine(make_config())
+    engine.casino.set_chip_theft_weights({"black": 5.0})
+    engine.advance(10**5)
+    save_snapshot(path, engine.casino, engine)
+
+    other = SimulationEngine(make_config())
+    load_snapshot(path, other.casino, other)
+    assert other.winner == engine.winner
+    assert other.winner_name == engine.winner_name
+    assert other.bankrupt_players == engine.bankrupt_players
+    assert other.action_counts == engine.action_counts
+    assert other.casino.chip_theft_weights["black"] == 5.0
+
+
+def test_casino_snapshot_with_stable_collections(tmp_path):
+    """Тест снимка казино без движка"""
+    path = tmp_path / "casino.snap"
+    rng = random.Random(3)
+    casino = Casino(
+        ChipCollection(),
+        IndexedPlayerCollection(stable=True),
+        IndexedGooseCollection(stable=True),
+        IndexDictChip(),
+        IndexDictPlayer(),
+        IndexDictGoose(),
+        rng,
+    )
+    for name in ("Аня", "Борис", "Вера"):
+        casino.add_player(Player(name, 100))
+    casino.remove_player(casino.search_player("Борис"))
+    casino.add_goose(WarGoose("Серый", 7, rng))
+    casino.add_goose(HonkGoose("Белый", 3, rng))
+    save_snapshot(path, casino)
+
+    restored = Casino(
+        ChipCollection(),
+        IndexedPlayerCollection(stable=True),
+        IndexedGooseCollection(stable=True),
+        IndexDictChip(),
+        IndexDictPlayer(),
+        IndexDictGoose(),
+        random.Random(),
+    )
+    load_snapshot(path, restored)
+    assert [player.name for player in restored.player_collection] == ["Аня", "Вера"]
+    assert restored.search_player("Вера").balance == 100
+    assert restored.index_dict_goose.search_goose_honk_volume("Серый") == 7
+    assert restored.rng.random() == rng.random()
+
+
+def test_resumed_winner_ends_game(tmp_path):
+    """Тест проверки порогов у игроков из снимка при продолжении"""
+    path = tmp_path / "casino.snap"
+    casino = Casino(
+        ChipCollection(),
+        IndexedPlayerCollection(stable=True),
+        IndexedGooseCollection(stable=True),
+        IndexDictChip(),
+        IndexDictPlayer(),
+        IndexDictGoose(),
+        random.Random(3),
+    )
+    casino.add_player(Player("Богач", 6000))
+    casino.add_player(Player("Середняк", 100))
+    save_snapshot(path, casino)
+
+    result = subprocess.run(
+        [sys.executable, "main.py", "--quiet", "--resume", str(path), "--steps", "1"],
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True,
+        stdin=subprocess.DEVNULL,
+        check=True,
+    )
+    assert "ИГРОКИ ПОБЕДИЛИ! 'Богач'" in result.stdout
+
+
+def test_snapshot_rejects_foreign_files(tmp_path):
+    """Тест ошибки при загрузке не снимка и снимка без движка"""
+    engine = SimulationEngine(make_config())
+    path = tmp_path / "junk.snap"
+    path.write_bytes(b"JUNK" + bytes(100))
+    with pytest.raises(ValueError):
+        load_snapshot(path, engine.casino, engine)
+    save_snapshot(path, engine.casino)
+    with pytest.raises(ValueError):
+        load_snapshot(path, engine.casino, engine)
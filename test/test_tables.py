@@ -0,0 +1,59 @@
+import asyncio
+
+from adapter.server import CasinoServer, make_tables
+from benchmarks.load_generator import run_load
+
+
+def test_bets_in_batch_share_one_spin():
+    """Тест розыгрыша всех ставок пакета одним вращением"""
+    table = make_tables(1, 4, 2, balance=100, seed=3)[0]
+    responses = table.process(
+        [
+            {"op": "bet", "player": f"Игрок{i}", "value": 10, "bet": bet}
+            for i, bet in enumerate(["красное", "чёрное", "чётное", 7])
+        ]
+    )
+    assert len({response["number"] for response in responses}) == 1
+    assert table.rounds == 1
+    for response in responses:
+        assert response["ok"]
+        assert response["balance"] == 90 + response["payout"]
+
+
+def test_batch_reports_errors_per_request():
+    """Тест ошибки одного запроса без прерывания пакета"""
+    table = make_tables(1, 2, 2, balance=100, seed=3)[0]
+    responses = table.process(
+        [
+            {"op": "bet", "player": "Никто", "value": 10, "bet": "красное"},
+            {"op": "bet", "player": "Игрок0", "value": 500, "bet": "красное"},
+            {"op": "dance"},
+            {"op": "status", "player": "Игрок1"},
+        ]
+    )
+    assert [response["ok"] for response in responses] == [False, False, False, True]
+    assert responses[3]["balance"] == 100
+    assert table.rounds == 0
+
+
+def test_server_coalesces_pipelined_requests():
+    """Тест объединения запросов клиентов в пакеты стола"""
+
+    async def scenario():
+        server = CasinoServer(make_tables(2, 10, 4, seed=0))
+        listener = await server.start("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+
+        async def connect():
+            return await asyncio.open_connection("127.0.0.1", port)
+
+        report = await run_load(connect, 4, 400, 16, 2, 10)
+        listener.close()
+        await listener.wait_closed()
+        return server, report
+
+    server, report = asyncio.run(scenario())
+    assert report["requests"] == 400
+    assert server.requests == 400
+    assert server.batches < 400
+    assert report["p50_us"] <= report["p99_us"]
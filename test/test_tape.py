@@ -0,0 +1,85 @@
+import pytest
+
+from usecases.events import RingBufferSink, TeeSink
+from usecases.simulation import SimulationConfig, SimulationEngine
+from usecases.tape import TapeReplayer, TapeSink
+
+
+def make_config(columnar=False):
+    """Конфигурация с несколькими игроками и гусями обоих типов"""
+    return SimulationConfig(
+        [(f"Игрок{i}", 300) for i in range(8)],
+        [(f"Гусь{i}", "war" if i % 3 else "honk", i % 10) for i in range(8)],
+        columnar=columnar,
+    )
+
+
+def balances(casino):
+    """Балансы игроков и гусей казино"""
+    return (
+        {player.name: player.balance for player in casino.iter_player()},
+        {goose.name: goose.balance for goose in casino.iter_goose()},
+    )
+
+
+def record(path, steps, columnar=False):
+    """Запись прогона движка на ленту"""
+    engine = SimulationEngine(make_config(columnar))
+    engine.reset(11)
+    engine.sink = TapeSink(path, engine.casino)
+    engine.advance(steps)
+    engine.sink.close()
+    return engine
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_replay_matches_run(tmp_path, columnar):
+    """Тест совпадения повтора ленты с исходным прогоном"""
+    path = tmp_path / "run.tape"
+    engine = record(path, 3000, columnar)
+    replay = SimulationEngine(make_config(columnar))
+    replayer = TapeReplayer(path, replay.casino)
+    replayer.run()
+    assert replayer.last_step == engine.step
+    assert balances(replay.casino) == balances(engine.casino)
+
+
+def test_seek_forward_and_back(tmp_path):
+    """Тест перемотки ленты вперёд и назад"""
+    path = tmp_path / "run.tape"
+    record(path, 2000)
+    middle = SimulationEngine(make_config())
+    middle.reset(11)
+    middle.advance(700)
+
+    replay = SimulationEngine(make_config())
+    replayer = TapeReplayer(path, replay.casino)
+    replayer.seek(700)
+    assert balances(replay.casino) == balances(middle.casino)
+    replayer.run()
+    replayer.seek(700)
+    assert balances(replay.casino) == balances(middle.casino)
+    replayer.seek(0)
+    assert balances(replay.casino) == balances(SimulationEngine(make_config()).casino)
+
+
+def test_tee_sink_keeps_events(tmp_path):
+    """Тест записи ленты вместе с другим приёмником"""
+    path = tmp_path / "run.tape"
+    engine = SimulationEngine(make_config())
+    ring = RingBufferSink(10**5)
+    engine.sink = TeeSink(ring, TapeSink(path, engine.casino))
+    engine.advance(500)
+    engine.sink.close()
+    assert ring.events
+    replay = SimulationEngine(make_config())
+    TapeReplayer(path, replay.casino).run()
+    assert balances(replay.casino) == balances(engine.casino)
+
+
+def test_replay_rejects_foreign_files(tmp_path):
+    """Тест ошибки при повторе файла, не являющегося лентой"""
+    path = tmp_path / "junk.tape"
+    path.write_bytes(b"JUNK" + bytes(100))
+    with pytest.raises(ValueError):
+        TapeReplayer(path, SimulationEngine(make_config()).casino)
@@ -0,0 +1,98 @@
+import pytest
+from domain.casino_entities import HonkGoose, Player
+from repository.casino_collections import (
+    ChipCollection,
+    GooseCollection,
+    IndexDictChip,
+    IndexDictGoose,
+    IndexDictPlayer,
+    PlayerCollection,
+)
+from usecases.casino import Casino
+from usecases.watchers import ThresholdWatcher
+
+
+@pytest.fixture
+def casino():
+    """Фикстура казино с наблюдателем порогов"""
+    casino = Casino(
+        ChipCollection(),
+        PlayerCollection(),
+        GooseCollection(),
+        IndexDictChip(),
+        IndexDictPlayer(),
+        IndexDictGoose(),
+    )
+    casino.watcher = ThresholdWatcher(0, 5000)
+    casino.add_balance_listener(casino.watcher.on_balance_change)
+    return casino
+
+
+def test_honk_reports_bankrupt_player(casino, mocker):
+    """Тест оповещения о банкротстве после гоготания"""
+    player = Player('Жертва', 50)
+    goose = HonkGoose('Гоготун', 75)
+    casino.add_player(player)
+    casino.add_goose(goose)
+    mocker.patch.object(HonkGoose, 'honk', return_value=True)
+
+    casino.honk_goose_honk('Гоготун', 'Жертва')
+
+    assert casino.watcher.drain_bankrupt() == [player]
+    assert not casino.watcher
+
+
+def test_bet_reports_winner(casino, mocker):
+    """Тест оповещения о победе после выигрышной ставки"""
+    player = Player('Игрок', 4990)
+    casino.add_player(player)
+    mocker.patch('random.randint', return_value=7)
+
+    assert casino.player_bet('Игрок', 10, 7)
+
+    assert casino.watcher.winners == {'Игрок': player}
+
+
+def test_rejected_bet_keeps_balance(casino):
+    """Тест отклонённой ставки без списания и оповещений"""
+    player = Player('Игрок', 100)
+    casino.add_player(player)
+
+    with pytest.raises(ValueError, match='Нужно выбрать число от 0 до 36'):
+        casino.player_bet('Игрок', 100, 50)
+
+    assert player.balance == 100
+    assert not casino.watcher
+
+
+def test_watcher_forgets_recovered_player():
+    """Тест снятия игрока с учёта после возврата в допустимый диапазон"""
+    watcher = ThresholdWatcher(0, 5000)
+    player = Player('Игрок', 0)
+    watcher.on_balance_change(player)
+    player.balance = 10
+    watcher.on_balance_change(player)
+    assert watcher.drain_bankrupt() == []
+
+
+def test_added_players_are_checked(casino):
+    """Тест проверки порогов при посадке игроков"""
+    rich = Player('Богач', 5000)
+    casino.add_player(rich)
+    broke = Player('Должник', 0)
+    casino.add_players_many([Player('Середняк', 100), broke])
+
+    assert casino.watcher.winners == {'Богач': rich}
+    assert casino.watcher.drain_bankrupt() == [broke]
+
+
+def test_scan_replaces_collected_players():
+    """Тест повторной проверки всех игроков"""
+    watcher = ThresholdWatcher(0, 5000)
+    watcher.on_balance_change(Player('Старый', 0))
+    rich = Player('Богач', 6000)
+
+    watcher.scan([Player('Середняк', 100), rich])
+
+    assert watcher.winners == {'Богач': rich}
+    assert watcher.drain_bankrupt() == []
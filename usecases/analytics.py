@@ -0,0 +1,351 @@
+from typing import Any, Sequence
+
+import numpy as np
+
+from domain.casino_entities import HonkGoose, WarGoose
+from domain.roulette import BET_CODES, payout_multiplier
+from repository.casino_collections import ChipCollection
+from usecases.simulation import BET_TYPES, SimulationConfig
+
+ROULETTE_NUMBERS = 37
+
+
+def bet_outcomes() -> dict[int, float]:
+    """
+    Распределение множителя выплаты для ставки движка.
+
+    Движок выбирает тип из BET_TYPES равновероятно, а для ставки
+    на число берёт число от 0 до 36 равновероятно.
+
+    Returns:
+        Вероятность по множителю выплаты
+    """
+    outcomes: dict[int, float] = {}
+    share = 1 / len(BET_TYPES)
+    for bet_type in BET_TYPES:
+        codes = (
+            range(ROULETTE_NUMBERS) if bet_type == 'число' else [BET_CODES[bet_type]]
+        )
+        weight = share / len(codes) / ROULETTE_NUMBERS
+        for code in codes:
+            for number in range(ROULETTE_NUMBERS):
+                multiplier = payout_multiplier(code, number)
+                outcomes[multiplier] = outcomes.get(multiplier, 0.0) + weight
+    return outcomes
+
+
+class ChainSolution:
+    """
+    Решение цепи Маркова для баланса одного игрока.
+
+    Массивы индексируются балансом от 0 до win_balance включительно;
+    0 и win_balance поглощающие.
+
+    Attributes:
+        win_balance: Баланс победы
+        bankruptcy: Вероятность банкротства
+        win: Вероятность достичь win_balance
+        expected_steps: Ожидаемое число шагов движка до поглощения
+        drift: Ожидаемое изменение баланса за один шаг
+    """
+
+    def __init__(
+        self,
+        win_balance: int,
+        bankruptcy: Any,
+        win: Any,
+        expected_steps: Any,
+        drift: Any,
+    ) -> None:
+        """
+        Инициализация решения.
+
+        Args:
+            win_balance: Баланс победы
+            bankruptcy: Вероятности банкротства по балансу
+            win: Вероятности победы по балансу
+            expected_steps: Ожидаемое число шагов по балансу
+            drift: Ожидаемый снос по балансу
+        """
+        self.win_balance = win_balance
+        self.bankruptcy = bankruptcy
+        self.win = win
+        self.expected_steps = expected_steps
+        self.drift = drift
+
+    def _index(self, balance: int) -> int:
+        """
+        Перевод баланса в индекс массивов.
+
+        Args:
+            balance: Баланс игрока
+
+        Returns:
+            Баланс, ограниченный поглощающими состояниями
+        """
+        return min(max(balance, 0), self.win_balance)
+
+    def bankruptcy_probability(self, balance: int) -> float:
+        """
+        Вероятность банкротства игрока с данным балансом.
+
+        Args:
+            balance: Баланс игрока
+
+        Returns:
+            Вероятность от 0 до 1
+        """
+        return float(self.bankruptcy[self._index(balance)])
+
+    def win_probability(self, balance: int) -> float:
+        """
+        Вероятность того, что игрок достигнет баланса победы.
+
+        Args:
+            balance: Баланс игрока
+
+        Returns:
+            Вероятность от 0 до 1
+        """
+        return float(self.win[self._index(balance)])
+
+    def steps_to_absorption(self, balance: int) -> float:
+        """
+        Ожидаемое число шагов движка до банкротства или победы.
+
+        Args:
+            balance: Баланс игрока
+
+        Returns:
+            Ожидаемое число шагов
+        """
+        return float(self.expected_steps[self._index(balance)])
+
+
+class PlayerChain:
+    """
+    Цепь Маркова для баланса одного игрока в SimulationEngine.
+
+    За шаг движок выбирает одно из четырёх действий, а жертву или
+    игрока для ставки из players игроков равновероятно. Боевой гусь
+    крадёт фишку (номинал выбирается равновероятно или по весам),
+    гогочущий забирает свою громкость, ставка равна
+    min(bet_value, баланс). Остальные шаги оставляют баланс на месте.
+
+    Цепь приближённая в двух местах: число игроков считается
+    постоянным, а состав гусей задаётся заранее. С stationary_geese
+    берётся предельный состав после многих пересозданий: каждый гусь
+    боевой или гогочущий с вероятностью 1/2, громкость равновероятна
+    от min_honk_volume до max_honk_volume.
+
+    Attributes:
+        win_balance: Баланс победы
+        bet_value: Размер ставки
+        losses: Вероятность по потере, не зависящая от баланса
+        bet_share: Вероятность ставки игрока за шаг
+        bets: Вероятность по множителю выплаты ставки
+    """
+
+    def __init__(
+        self,
+        config: SimulationConfig,
+        players: int | None = None,
+        stationary_geese: bool = False,
+        chip_values: Sequence[int] | None = None,
+        chip_weights: Sequence[float] | None = None,
+    ) -> None:
+        """
+        Построение переходов цепи.
+
+        Args:
+            config: Конфигурация симуляции
+            players: Число игроков; по умолчанию из конфигурации
+            stationary_geese: Использовать предельный состав гусей
+            chip_values: Номиналы фишек; по умолчанию ChipCollection()
+            chip_weights: Веса кражи фишек в том же порядке
+
+        Raises:
+            ValueError: Если игроков нет или веса не подходят к фишкам
+        """
+        players = len(config.players) if players is None else players
+        if players <= 0:
+            raise ValueError('Нужен хотя бы один игрок')
+        if chip_values is None:
+            chip_values = [chip.value for chip in ChipCollection()]
+        if chip_weights is None:
+            chip_weights = [1.0] * len(chip_values)
+        if len(chip_weights) != len(chip_values) or sum(chip_weights) <= 0:
+            raise ValueError('Веса должны соответствовать фишкам')
+        self.win_balance = config.win_balance
+        self.bet_value = config.bet_value
+        action = 1 / 4 / players
+
+        if stationary_geese:
+            volumes = range(config.min_honk_volume, config.max_honk_volume + 1)
+            present = 1 - 0.5 ** len(config.geese)
+            war_volumes = [(volume, present / len(volumes)) for volume in volumes]
+            honk_volumes = war_volumes
+        else:
+            war = [volume for _, kind, volume in config.geese if kind == 'war']
+            honk = [volume for _, kind, volume in config.geese if kind == 'honk']
+            war_volumes = [(volume, 1 / len(war)) for volume in war]
+            honk_volumes = [(volume, 1 / len(honk)) for volume in honk]
+
+        total_weight = sum(chip_weights)
+        steal = action * sum(
+            share * WarGoose.steal_probability(volume) for volume, share in war_volumes
+        )
+        self.losses: dict[int, float] = {}
+        for value, weight in zip(chip_values, chip_weights, strict=True):
+            self._add_loss(value, steal * weight / total_weight)
+        for volume, share in honk_volumes:
+            self._add_loss(volume, action * share * HonkGoose.honk_probability(volume))
+        self.bet_share = action
+        self.bets = bet_outcomes()
+
+    def _add_loss(self, value: int, probability: float) -> None:
+        """
+        Учёт перехода с потерей value.
+
+        Args:
+            value: Потеря баланса
+            probability: Вероятность перехода за шаг
+        """
+        if value and probability:
+            self.losses[value] = self.losses.get(value, 0.0) + probability
+
+    def moves(self, balance: int) -> dict[int, float]:
+        """
+        Переходы из состояния с данным балансом.
+
+        Args:
+            balance: Баланс игрока
+
+        Returns:
+            Вероятность по изменению баланса, без шагов на месте
+        """
+        moves = {-loss: probability for loss, probability in self.losses.items()}
+        stake = min(self.bet_value, balance)
+        for multiplier, probability in self.bets.items():
+            delta = stake * (multiplier - 1)
+            moves[delta] = moves.get(delta, 0.0) + self.bet_share * probability
+        return moves
+
+    def solve(self) -> ChainSolution:
+        """
+        Решение цепи для всех начальных балансов.
+
+        Вероятности поглощения h и ожидаемое время t удовлетворяют
+        h = Q h + r и t = Q t + 1, где Q переходы между балансами
+        от 1 до win_balance - 1. Матрица I - Q ленточная: ширина
+        ограничена наибольшей потерей и наибольшим выигрышем, поэтому
+        система решается исключением Гаусса по ленте за
+        O(n * нижняя * верхняя ширина).
+
+        Returns:
+            Решение цепи
+
+        Raises:
+            ValueError: Если баланс победы меньше 2
+        """
+        size = self.win_balance - 1
+        if size < 1:
+            raise ValueError('Баланс победы должен быть больше 1')
+        balances = np.arange(1, self.win_balance, dtype=np.int64)
+        stakes = np.minimum(balances, self.bet_value)
+        jumps = [(np.full(size, -loss), p) for loss, p in self.losses.items()]
+        jumps += [
+            (stakes * (multiplier - 1), self.bet_share * p)
+            for multiplier, p in self.bets.items()
+        ]
+        block = max(1, min(size, max(int(abs(d).max()) for d, _ in jumps)))
+        blocks = -(-size // block)
+
+        window = np.zeros((blocks * block, 3 * block))
+        offsets = np.arange(blocks * block) % block
+        window[np.arange(size, blocks * block), offsets[size:] + block] = 1.0
+        rhs = np.zeros((blocks * block, 3))
+        rhs[:size, 2] = 1.0
+        drift = np.zeros(size)
+        rows = np.arange(size)
+        for deltas, probability in jumps:
+            drift += deltas * probability
+            window[rows, offsets[:size] + block] += probability
+            target = balances + deltas
+            bankrupt = target <= 0
+            won = target >= self.win_balance
+            rhs[:size][bankrupt, 0] += probability
+            rhs[:size][won, 1] += probability
+            inside = ~(bankrupt | won)
+            columns = offsets[:size][inside] + block + deltas[inside]
+            window[rows[inside], columns] -= probability
+
+        solution = _solve_block_tridiagonal(
+            window.reshape(blocks, block, 3 * block),
+            rhs.reshape(blocks, block, 3),
+        ).reshape(-1, 3)[:size]
+        bankruptcy = np.concatenate(([1.0], solution[:, 0], [0.0]))
+        win = np.concatenate(([0.0], solution[:, 1], [1.0]))
+        steps = np.concatenate(([0.0], solution[:, 2], [0.0]))
+        return ChainSolution(
+            self.win_balance,
+            bankruptcy,
+            win,
+            steps,
+            np.concatenate(([0.0], drift, [0.0])),
+        )
+
+
+def _solve_block_tridiagonal(window: Any, rhs: Any) -> Any:
+    """
+    Решение блочно-трёхдиагональной системы блочной прогонкой.
+
+    Строки матрицы разбиты на блоки размера не меньше ширины ленты,
+    поэтому каждая строка блока i касается только блоков i - 1, i и
+    i + 1: window[i] хранит их рядом. Прогонка делает по одному
+    плотному решению на блок, и вся работа уходит в LAPACK. Матрица
+    I - Q имеет диагональное преобладание, поэтому ведущие блоки
+    невырождены.
+
+    Args:
+        window: Блоки [нижний, диагональный, верхний] по строкам блоков
+        rhs: Правые части по строкам блоков
+
+    Returns:
+        Решения по строкам блоков
+    """
+    blocks, block, _ = window.shape
+    forward = np.empty((blocks, block, block + rhs.shape[2]))
+    for i in range(blocks):
+        lower = window[i, :, :block]
+        diagonal = window[i, :, block : 2 * block]
+        system = np.concatenate((window[i, :, 2 * block :], rhs[i]), axis=1)
+        if i:
+            diagonal = diagonal - lower @ forward[i - 1, :, :block]
+            system[:, block:] -= lower @ forward[i - 1, :, block:]
+        forward[i] = np.linalg.solve(diagonal, system)
+
+    solution = np.empty_like(rhs)
+    solution[-1] = forward[-1, :, block:]
+    for i in range(blocks - 2, -1, -1):
+        solution[i] = forward[i, :, block:] - forward[i, :, :block] @ solution[i + 1]
+    return solution
+
+
+def analyse_player(
+    config: SimulationConfig,
+    players: int | None = None,
+    stationary_geese: bool = False,
+) -> ChainSolution:
+    """
+    Аналитический расчёт исходов для игрока без запуска симуляции.
+
+    Args:
+        config: Конфигурация симуляции
+        players: Число игроков; по умолчанию из конфигурации
+        stationary_geese: Использовать предельный состав гусей
+
+    Returns:
+        Решение цепи для всех начальных балансов
+    """
+    return PlayerChain(config, players, stationary_geese).solve()
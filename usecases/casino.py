@@ -1,7 +1,20 @@
 import random
+from typing import Callable, Iterable, Iterator
 
 from domain.casino_entities import Chip, Goose, HonkGoose, Player, WarGoose
+from domain.rng import RandomSource
+from domain.roulette import (
+    BET_BLACK,
+    BET_CODES,
+    BET_INVALID_NUMBER,
+    WINNING_BETS,
+    encode_bet,
+    payout_multiplier,
+)
+from domain.sampling import AliasTable
+from repository.base_classes import CollectionSnapshot
 from repository.casino_collections import (
+    BetBook,
     ChipCollection,
     GooseCollection,
     IndexDictChip,
@@ -9,6 +22,44 @@ from repository.casino_collections import (
     IndexDictPlayer,
     PlayerCollection,
 )
+from usecases.online_stats import BalanceAggregator
+
+
+class RoundResult:
+    """
+    Итог раунда рулетки с одним вращением колеса.
+
+    Attributes:
+        number: Выпавшее число
+        bets: Количество ставок в раунде
+        winning_bets: Количество выигравших ставок
+        total_stake: Сумма всех ставок
+        total_payout: Сумма выплат игрокам
+    """
+
+    def __init__(
+        self,
+        number: int,
+        bets: int,
+        winning_bets: int,
+        total_stake: int,
+        total_payout: int,
+    ) -> None:
+        """
+        Инициализация итога раунда.
+
+        Args:
+            number: Выпавшее число
+            bets: Количество ставок
+            winning_bets: Количество выигравших ставок
+            total_stake: Сумма ставок
+            total_payout: Сумма выплат
+        """
+        self.number = number
+        self.bets = bets
+        self.winning_bets = winning_bets
+        self.total_stake = total_stake
+        self.total_payout = total_payout
 
 
 class Casino:
@@ -22,6 +73,11 @@ class Casino:
         index_dict_chip: Индекс для поиска фишек
         index_dict_player: Индекс для поиска игроков
         index_dict_goose: Индекс для поиска гусей
+        rng: Генератор случайных чисел казино
+        balance_listeners: Обработчики изменения баланса игрока
+        aggregators: Сводки балансов, обновляемые на каждом изменении
+        observed: Есть ли обработчики или сводки
+        chip_theft_weights: Веса выбора фишки для кражи по цвету или None
     """
 
     def __init__(
@@ -32,6 +88,7 @@ class Casino:
         index_dict_chip: IndexDictChip,
         index_dict_player: IndexDictPlayer,
         index_dict_goose: IndexDictGoose,
+        rng: RandomSource = random,
     ) -> None:
         """
         Инициализация казино.
@@ -43,6 +100,7 @@ class Casino:
             index_dict_chip: Индекс фишек
             index_dict_player: Индекс игроков
             index_dict_goose: Индекс гусей
+            rng: Генератор случайных чисел (по умолчанию глобальный random)
         """
         self.chip_collection = chip_collection
         self.player_collection = player_collection
@@ -50,6 +108,90 @@ class Casino:
         self.index_dict_chip = index_dict_chip
         self.index_dict_player = index_dict_player
         self.index_dict_goose = index_dict_goose
+        self.rng = rng
+        self.balance_listeners: list[Callable[[Player], None]] = []
+        self.aggregators: list[BalanceAggregator] = []
+        self.observed = False
+        self.chip_theft_weights: dict[str, float] | None = None
+        self._theft_table: AliasTable | None = None
+        self._theft_version = -1
+
+    def add_balance_listener(self, listener: Callable[[Player], None]) -> None:
+        """
+        Подписка на изменения баланса игроков.
+
+        Обработчик вызывается с игроком после каждого изменения его
+        баланса в ставках, кражах и раундах стола, а также при посадке
+        игрока, чтобы пороги проверялись и для новых игроков.
+
+        Args:
+            listener: Функция, принимающая игрока
+        """
+        self.balance_listeners.append(listener)
+        self.observed = True
+
+    def remove_balance_listener(self, listener: Callable[[Player], None]) -> None:
+        """
+        Отписка от изменений баланса игроков.
+
+        Args:
+            listener: Ранее добавленный обработчик
+
+        Raises:
+            ValueError: Если обработчик не был добавлен
+        """
+        self.balance_listeners.remove(listener)
+        self.observed = bool(self.balance_listeners or self.aggregators)
+
+    def add_aggregator(self, aggregator: BalanceAggregator) -> None:
+        """
+        Подключение сводки балансов.
+
+        Сводка сбрасывается и заполняется текущими игроками, дальше она
+        обновляется при посадке и уходе игроков, изменениях балансов и
+        кражах гусей.
+
+        Args:
+            aggregator: Сводка балансов
+        """
+        aggregator.clear()
+        for player in self.player_collection:
+            aggregator.on_player_added(player.balance)
+        self.aggregators.append(aggregator)
+        self.observed = True
+
+    def remove_aggregator(self, aggregator: BalanceAggregator) -> None:
+        """
+        Отключение сводки балансов.
+
+        Args:
+            aggregator: Ранее подключённая сводка
+
+        Raises:
+            ValueError: Если сводка не была подключена
+        """
+        self.aggregators.remove(aggregator)
+        self.observed = bool(self.balance_listeners or self.aggregators)
+
+    def _balance_changed(
+        self, player: Player, delta: int, looted_by: str | None = None
+    ) -> None:
+        """
+        Оповещение обработчиков и сводок об изменении баланса игрока.
+
+        Args:
+            player: Игрок, баланс которого изменился
+            delta: Изменение баланса
+            looted_by: Тип гуся ('war', 'honk'), если баланс уменьшила кража
+        """
+        for listener in self.balance_listeners:
+            listener(player)
+        if self.aggregators:
+            balance = player.balance
+            for aggregator in self.aggregators:
+                aggregator.on_balance_change(balance - delta, balance)
+                if looted_by is not None:
+                    aggregator.on_goose_loot(looted_by, -delta)
 
     def add_chip(self, chip: Chip) -> None:
         """
@@ -57,9 +199,51 @@ class Casino:
 
         Args:
             chip: Фишка для добавления
+
+        Raises:
+            ValueError: Если фишка с таким цветом или номиналом уже есть
         """
-        self.chip_collection.add(chip)
         self.index_dict_chip.add(chip)
+        self.chip_collection.add(chip)
+
+    def set_chip_theft_weights(self, weights: dict[str, float] | None) -> None:
+        """
+        Задание весов, с которыми боевой гусь выбирает фишку для кражи.
+
+        Фишки, цвета которых нет в словаре, получают вес 1. Таблица
+        выбора строится при следующей краже и перестраивается только
+        после изменения набора фишек.
+
+        Args:
+            weights: Веса по цвету фишки или None для равновероятного выбора
+        """
+        self.chip_theft_weights = dict(weights) if weights else None
+        self._theft_table = None
+
+    def _pick_stolen_chip(self) -> Chip:
+        """
+        Выбор фишки для кражи.
+
+        Без весов фишка выбирается равновероятно одним randint, с весами
+        по таблице псевдонимов за O(1).
+
+        Returns:
+            Выбранная фишка
+        """
+        chips = self.chip_collection
+        weights = self.chip_theft_weights
+        if weights is None:
+            chip = chips[self.rng.randint(0, len(chips) - 1)]
+        else:
+            if self._theft_table is None or self._theft_version != chips.mod_count:
+                self._theft_table = AliasTable(
+                    [weights.get(chip.colour, 1.0) for chip in chips.items]
+                )
+                self._theft_version = chips.mod_count
+            chip = chips.items[self._theft_table.sample(self.rng)]
+        if not isinstance(chip, Chip):
+            raise TypeError()
+        return chip
 
     def add_player(self, player: Player) -> None:
         """
@@ -70,6 +254,10 @@ class Casino:
         """
         self.player_collection.add(player)
         self.index_dict_player.add(player)
+        for listener in self.balance_listeners:
+            listener(player)
+        for aggregator in self.aggregators:
+            aggregator.on_player_added(player.balance)
 
     def add_goose(self, goose: Goose) -> None:
         """
@@ -77,10 +265,96 @@ class Casino:
 
         Args:
             goose: Гусь для добавления
+
+        Raises:
+            ValueError: Если гусь с таким именем уже есть
         """
+        if goose.name in self.index_dict_goose:
+            raise ValueError('Гусь с таким именем уже есть')
         self.goose_collection.add(goose)
         self.index_dict_goose.add(goose)
 
+    def add_players_many(self, players: Iterable[Player]) -> None:
+        """
+        Добавление нескольких игроков одним расширением коллекции и индекса.
+
+        Пакет проверяется целиком до изменений, поэтому при ошибке
+        казино не меняется.
+
+        Args:
+            players: Игроки для добавления
+
+        Raises:
+            ValueError: Если имя повторяется в пакете или игрок уже есть
+        """
+        added = list(players)
+        names = {player.name for player in added}
+        if len(names) != len(added) or self.index_dict_player.contains_any(names):
+            raise ValueError('Игрок с таким именем уже есть')
+        self.player_collection.extend(added)
+        self.index_dict_player.add_many(added)
+        for listener in self.balance_listeners:
+            for player in added:
+                listener(player)
+        for aggregator in self.aggregators:
+            for player in added:
+                aggregator.on_player_added(player.balance)
+
+    def add_geese_many(self, geese: Iterable[Goose]) -> None:
+        """
+        Добавление нескольких гусей одним расширением коллекции и индекса.
+
+        Args:
+            geese: Гуси для добавления
+
+        Raises:
+            ValueError: Если имя повторяется в пакете или гусь уже есть
+        """
+        added = list(geese)
+        names = {goose.name for goose in added}
+        if len(names) != len(added) or self.index_dict_goose.contains_any(names):
+            raise ValueError('Гусь с таким именем уже есть')
+        self.goose_collection.extend(added)
+        self.index_dict_goose.add_many(added)
+
+    def remove_players_many(self, players: Iterable[Player]) -> list[Player]:
+        """
+        Удаление нескольких игроков одним проходом по коллекции.
+
+        Args:
+            players: Игроки для удаления
+
+        Returns:
+            Удаленные игроки в порядке пакета
+
+        Raises:
+            ValueError: Если какого-то игрока нет или он повторяется в пакете
+        """
+        removed = list(players)
+        names = {player.name for player in removed}
+        if len(names) != len(removed) or not self.index_dict_player.contains_all(names):
+            raise ValueError('Игрока с таким именем нет')
+        deleted_players = self.player_collection.remove_many(removed)
+        self.index_dict_player.pop_many(deleted_players)
+        for aggregator in self.aggregators:
+            for player in deleted_players:
+                aggregator.on_player_removed(player.balance)
+        return deleted_players
+
+    def clear(self) -> None:
+        """
+        Удаление всех игроков и гусей.
+
+        Фишки сохраняются, поэтому казино можно переиспользовать
+        для следующего запуска симуляции.
+        """
+        self.player_collection.clear()
+        self.index_dict_player.clear()
+        self.goose_collection.clear()
+        self.index_dict_goose.clear()
+        for aggregator in self.aggregators:
+            aggregator.clear()
+
     def pop_chip(self, index: int) -> Chip:
         """
         Удаление и возврат фишки по индексу.
@@ -107,6 +381,8 @@ class Casino:
         """
         deleted_player = self.player_collection.pop(index - 1)
         self.index_dict_player.pop(deleted_player)
+        for aggregator in self.aggregators:
+            aggregator.on_player_removed(deleted_player.balance)
         return deleted_player
 
     def pop_goose(self, index: int) -> Goose:
@@ -123,7 +399,49 @@ class Casino:
         self.index_dict_goose.pop(deleted_goose)
         return deleted_goose
 
-    def iter_chip(self) -> list[Chip]:
+    def remove_player(self, player: Player) -> Player:
+        """
+        Удаление игрока по значению.
+
+        Для IndexedPlayerCollection и столбцовых коллекций выполняется
+        за O(1), для обычной коллекции требует поиска позиции.
+
+        Args:
+            player: Игрок для удаления
+
+        Returns:
+            Удаленный игрок
+
+        Raises:
+            ValueError: Если игрока нет в казино
+        """
+        if not self.index_dict_player.contains_all({player.name}):
+            raise ValueError('Игрока с таким именем нет')
+        balance = player.balance
+        deleted_player = self.player_collection.remove(player)
+        self.index_dict_player.pop(deleted_player)
+        for aggregator in self.aggregators:
+            aggregator.on_player_removed(balance)
+        return deleted_player
+
+    def remove_goose(self, goose: Goose) -> Goose:
+        """
+        Удаление гуся по значению.
+
+        Для IndexedGooseCollection и столбцовых коллекций выполняется
+        за O(1), для обычной коллекции требует поиска позиции.
+
+        Args:
+            goose: Гусь для удаления
+
+        Returns:
+            Удаленный гусь
+        """
+        deleted_goose = self.goose_collection.remove(goose)
+        self.index_dict_goose.pop(deleted_goose)
+        return deleted_goose
+
+    def iter_chip(self) -> Iterator[Chip]:
         """
         Получение итератора по фишкам.
 
@@ -132,7 +450,7 @@ class Casino:
         """
         return iter(self.chip_collection)
 
-    def iter_player(self) -> list[Player]:
+    def iter_player(self) -> Iterator[Player]:
         """
         Получение итератора по игрокам.
 
@@ -141,7 +459,7 @@ class Casino:
         """
         return iter(self.player_collection)
 
-    def iter_goose(self) -> list[Goose]:
+    def iter_goose(self) -> Iterator[Goose]:
         """
         Получение итератора по гусям.
 
@@ -150,6 +468,27 @@ class Casino:
         """
         return iter(self.goose_collection)
 
+    def snapshot_player(self) -> CollectionSnapshot:
+        """
+        Получение снимка игроков за O(1).
+
+        Снимок можно обходить, пока казино продолжает добавлять
+        и удалять игроков, в том числе из другого потока.
+
+        Returns:
+            Снимок коллекции игроков
+        """
+        return self.player_collection.snapshot()
+
+    def snapshot_goose(self) -> CollectionSnapshot:
+        """
+        Получение снимка гусей за O(1).
+
+        Returns:
+            Снимок коллекции гусей
+        """
+        return self.goose_collection.snapshot()
+
     def get_chip_slice(self, key: int | slice) -> Chip | list[Chip]:
         """
         Получение фишки или среза фишек.
@@ -234,6 +573,30 @@ class Casino:
         """
         return self.index_dict_goose.search_goose(goose_name)
 
+    def random_war_goose(self) -> WarGoose:
+        """
+        Выбор случайного боевого гуся за O(1).
+
+        Returns:
+            Боевой гусь
+
+        Raises:
+            ValueError: Если боевых гусей нет
+        """
+        return self.index_dict_goose.random_war_goose(self.rng)
+
+    def random_honk_goose(self) -> HonkGoose:
+        """
+        Выбор случайного гогочущего гуся за O(1).
+
+        Returns:
+            Гогочущий гусь
+
+        Raises:
+            ValueError: Если гогочущих гусей нет
+        """
+        return self.index_dict_goose.random_honk_goose(self.rng)
+
     def search_goose_balance(self, goose_name: str) -> int:
         """
         Поиск баланса гуся по имени.
@@ -258,13 +621,17 @@ class Casino:
         """
         return self.index_dict_goose.search_goose_honk_volume(goose_name)
 
-    def war_goose_steal_chip(self, goose_name: str, player_name: str) -> Chip:
+    def war_goose_steal_chip(
+        self, goose_name: str, player_name: str, roll: bool = True
+    ) -> Chip:
         """
         Боевой гусь пытается украсть фишку у игрока.
 
         Args:
             goose_name: Имя боевого гуся
             player_name: Имя игрока-жертвы
+            roll: Разыгрывать ли удачу гуся; False, если вызывающий уже
+                решил, что кража удалась
 
         Returns:
             Украденная фишка
@@ -276,26 +643,29 @@ class Casino:
         player = self.index_dict_player.search_player(player_name)
         if not isinstance(goose, WarGoose):
             raise TypeError
-        result_stealing = goose.steal_chip()
+        result_stealing = goose.steal_chip() if roll else 1
         if result_stealing:
-            random_chip_index = random.randint(0, len(self.chip_collection) - 1)
-            random_chip = self.chip_collection[random_chip_index]
-            if not isinstance(random_chip, Chip):
-                raise TypeError()
+            random_chip = self._pick_stolen_chip()
             stolen_value = random_chip.value
             player.balance -= stolen_value
             goose.balance += stolen_value
+            if self.observed:
+                self._balance_changed(player, -stolen_value, 'war')
             return random_chip
         else:
             raise ValueError('Гусь потерял равновесие и не смог украсть фишку')
 
-    def honk_goose_honk(self, goose_name: str, player_name: str) -> int:
+    def honk_goose_honk(
+        self, goose_name: str, player_name: str, roll: bool = True
+    ) -> int:
         """
         Гогочущий гусь пытается напугать игрока громким криком.
 
         Args:
             goose_name: Имя гогочущего гуся
             player_name: Имя игрока-жертвы
+            roll: Разыгрывать ли удачу гуся; False, если вызывающий уже
+                решил, что крик удался
 
         Returns:
             Украденная сумма
@@ -307,11 +677,13 @@ class Casino:
         player = self.index_dict_player.search_player(player_name)
         if not isinstance(goose, HonkGoose):
             raise TypeError()
-        result_honking = goose.honk()
+        result_honking = goose.honk() if roll else goose.honk_volume
         if result_honking:
             stolen_value = goose.honk_volume
             player.balance -= stolen_value
             goose.balance += stolen_value
+            if self.observed:
+                self._balance_changed(player, -stolen_value, 'honk')
             return stolen_value
         else:
             raise ValueError('Гусь потерял равновесие и крикнул не в ту сторону')
@@ -324,9 +696,7 @@ class Casino:
             del_goose: Гусь для удаления
             new_goose: Новый гусь для добавления
         """
-        index = self.goose_collection.items.index(del_goose)
-        self.goose_collection.pop(index)
-        self.index_dict_goose.pop(del_goose)
+        self.remove_goose(del_goose)
         self.add_goose(new_goose)
 
     def player_bet(self, player_name: str, bet_value: int, bet_type: int | str) -> bool:
@@ -348,28 +718,81 @@ class Casino:
         player = self.index_dict_player.search_player(player_name)
         if player.balance < bet_value:
             raise ValueError('Ставка больше чем баланс игрока')
-        player.balance -= bet_value
         if isinstance(bet_type, int):
-            if -1 < bet_type < 37:
-                if bet_type == random.randint(0, 36):
-                    player.balance += 35 * bet_value
-                    return True
-                return False
-            else:
+            if not -1 < bet_type < 37:
                 raise ValueError('Нужно выбрать число от 0 до 36')
-        if isinstance(bet_type, str):
-            if bet_type in (
-                'чёрное',
-                'черное',
-                'красное',
-                'чётное',
-                'четное',
-                'нечётное',
-                'нечетное',
-            ):
-                if random.randint(0, 36) % 2:
-                    player.balance += bet_value * 2
-                    return True
-                return False
-            else:
-                raise ValueError('Сделайте корректную ставку')
+            number = self.rng.randint(0, 36)
+            multiplier = 35 if bet_type == number else 0
+        elif bet_type in BET_CODES:
+            number = self.rng.randint(0, 36)
+            multiplier = payout_multiplier(BET_CODES[bet_type], number)
+        else:
+            raise ValueError('Сделайте корректную ставку')
+        change = bet_value * (multiplier - 1)
+        player.balance += change
+        if self.observed:
+            self._balance_changed(player, change)
+        return multiplier > 0
+
+    def place_bet(
+        self, bet_book: BetBook, player_name: str, bet_value: int, bet_type: int | str
+    ) -> None:
+        """
+        Размещение ставки игрока в книге ставок текущего раунда.
+
+        Ставка сразу списывается с баланса, а разыгрывается в play_round.
+
+        Args:
+            bet_book: Книга ставок раунда
+            player_name: Имя игрока
+            bet_value: Размер ставки
+            bet_type: Тип ставки (число 0-36 или строка типа 'чётное', 'красное')
+
+        Raises:
+            ValueError: Если баланс недостаточен,
+                номер некорректен или тип ставки неверен
+        """
+        player = self.index_dict_player.search_player(player_name)
+        if player.balance < bet_value:
+            raise ValueError('Ставка больше чем баланс игрока')
+        code = encode_bet(bet_type)
+        if code == BET_INVALID_NUMBER:
+            raise ValueError('Нужно выбрать число от 0 до 36')
+        if code < BET_BLACK:
+            raise ValueError('Сделайте корректную ставку')
+        player.balance -= bet_value
+        bet_book.add(player, bet_value, code)
+        if self.observed:
+            self._balance_changed(player, -bet_value)
+
+    def play_round(self, bet_book: BetBook) -> RoundResult:
+        """
+        Одно вращение колеса и расчёт всей книги ставок.
+
+        Для выпавшего числа заранее известны выигравшие коды ставок
+        (само число, его цвет и чётность), поэтому расчёт затрагивает
+        только выигравшие ставки. Книга очищается для следующего раунда.
+
+        Args:
+            bet_book: Книга ставок раунда
+
+        Returns:
+            Итог раунда
+        """
+        number = self.rng.randint(0, 36)
+        observed = self.observed
+        winning_bets = 0
+        total_payout = 0
+        for code, multiplier in WINNING_BETS[number]:
+            for player, bet_value in bet_book.bets_by_code.get(code, ()):
+                payout = bet_value * multiplier
+                player.balance += payout
+                total_payout += payout
+                winning_bets += 1
+                if observed:
+                    self._balance_changed(player, payout)
+        result = RoundResult(
+            number, len(bet_book), winning_bets, bet_book.total_stake, total_payout
+        )
+        bet_book.clear()
+        return result
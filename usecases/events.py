@@ -0,0 +1,418 @@
+import json
+import struct
+from abc import ABC, abstractmethod
+from collections import deque
+from types import TracebackType
+from typing import Any, BinaryIO, Iterator
+
+ACTIONS = (
+    'war_goose_attack',
+    'honk_goose_do_honk',
+    'recreate_goose',
+    'player_bet',
+    'bankrupt',
+)
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+
+_RECORD = struct.Struct('<qBBqqqqq')
+_NAME_LENGTH = struct.Struct('<H')
+_NO_NAME = 0xFFFF
+
+
+class SimulationEvent:
+    """
+    Одно действие симуляции.
+
+    Attributes:
+        step: Номер шага
+        action: Название действия из ACTIONS
+        goose: Имя гуся или None
+        player: Имя игрока или None
+        amount: Украденная сумма или изменение баланса игрока
+        player_before: Баланс игрока до действия
+        player_after: Баланс игрока после действия
+        goose_before: Баланс гуся до действия
+        goose_after: Баланс гуся после действия
+        ok: Удалось ли действие
+        new_goose: Имя нового гуся при пересоздании
+        message: Причина неудачи
+    """
+
+    __slots__ = (
+        'step',
+        'action',
+        'goose',
+        'player',
+        'amount',
+        'player_before',
+        'player_after',
+        'goose_before',
+        'goose_after',
+        'ok',
+        'new_goose',
+        'message',
+    )
+
+    def __init__(
+        self,
+        step: int,
+        action: str,
+        goose: str | None = None,
+        player: str | None = None,
+        amount: int = 0,
+        player_before: int = 0,
+        player_after: int = 0,
+        goose_before: int = 0,
+        goose_after: int = 0,
+        ok: bool = True,
+        new_goose: str | None = None,
+        message: str | None = None,
+    ) -> None:
+        """
+        Инициализация события.
+
+        Args:
+            step: Номер шага
+            action: Название действия
+            goose: Имя гуся
+            player: Имя игрока
+            amount: Сумма действия
+            player_before: Баланс игрока до действия
+            player_after: Баланс игрока после действия
+            goose_before: Баланс гуся до действия
+            goose_after: Баланс гуся после действия
+            ok: Удалось ли действие
+            new_goose: Имя нового гуся
+            message: Причина неудачи
+        """
+        self.step = step
+        self.action = action
+        self.goose = goose
+        self.player = player
+        self.amount = amount
+        self.player_before = player_before
+        self.player_after = player_after
+        self.goose_before = goose_before
+        self.goose_after = goose_after
+        self.ok = ok
+        self.new_goose = new_goose
+        self.message = message
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Сравнение событий по всем полям.
+
+        Args:
+            other: Другой объект
+
+        Returns:
+            True, если все поля совпадают
+        """
+        if not isinstance(other, SimulationEvent):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        """
+        Строковое представление события.
+
+        Returns:
+            Описание события
+        """
+        return f'SimulationEvent({self.to_dict()!r})'
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Преобразование события в словарь.
+
+        Returns:
+            Словарь полей события
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class EventSink(ABC):
+    """
+    Базовый приёмник событий.
+
+    Источник событий проверяет enabled и не создаёт события для
+    выключенного приёмника, поэтому тихий запуск почти ничего не стоит.
+
+    Attributes:
+        enabled: Нужно ли создавать события для этого приёмника
+    """
+
+    enabled = True
+
+    @abstractmethod
+    def emit(self, event: SimulationEvent) -> None:
+        """
+        Приём события.
+
+        Args:
+            event: Событие симуляции
+        """
+
+    def flush(self) -> None:
+        """Сброс буферизованных событий; по умолчанию буфера нет."""
+        return None
+
+    def close(self) -> None:
+        """Сброс буфера и освобождение ресурсов."""
+        self.flush()
+
+    def __enter__(self) -> 'EventSink':
+        """
+        Вход в контекст.
+
+        Returns:
+            Сам приёмник
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """
+        Закрытие приёмника при выходе из контекста.
+
+        Args:
+            exc_type: Тип исключения
+            exc: Исключение
+            traceback: Трассировка
+        """
+        self.close()
+
+
+class NullSink(EventSink):
+    """Приёмник, отбрасывающий все события."""
+
+    enabled = False
+
+    def emit(self, event: SimulationEvent) -> None:
+        """
+        Отбрасывание события.
+
+        Args:
+            event: Событие симуляции
+        """
+
+
+class RingBufferSink(EventSink):
+    """
+    Хранение последних событий в памяти.
+
+    Attributes:
+        events: Последние capacity событий
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        """
+        Инициализация буфера.
+
+        Args:
+            capacity: Максимальное количество хранимых событий
+        """
+        self.events: deque[SimulationEvent] = deque(maxlen=capacity)
+
+    def emit(self, event: SimulationEvent) -> None:
+        """
+        Добавление события, вытесняющее самое старое.
+
+        Args:
+            event: Событие симуляции
+        """
+        self.events.append(event)
+
+
+class TeeSink(EventSink):
+    """
+    Передача событий нескольким приёмникам.
+
+    Attributes:
+        sinks: Приёмники, получающие каждое событие
+        enabled: Включён ли хотя бы один приёмник
+    """
+
+    def __init__(self, *sinks: EventSink) -> None:
+        """
+        Инициализация разветвителя.
+
+        Args:
+            *sinks: Приёмники событий
+        """
+        self.sinks = sinks
+        self.enabled = any(sink.enabled for sink in sinks)
+
+    def emit(self, event: SimulationEvent) -> None:
+        """
+        Передача события включённым приёмникам.
+
+        Args:
+            event: Событие симуляции
+        """
+        for sink in self.sinks:
+            if sink.enabled:
+                sink.emit(event)
+
+    def flush(self) -> None:
+        """Сброс буферов всех приёмников."""
+        for sink in self.sinks:
+            sink.flush()
+
+    def close(self) -> None:
+        """Закрытие всех приёмников."""
+        for sink in self.sinks:
+            sink.close()
+
+
+class JsonlFileSink(EventSink):
+    """
+    Запись событий в файл JSON Lines блоками.
+
+    Attributes:
+        file: Файл, открытый с буфером buffer_size байт
+    """
+
+    def __init__(self, path: str, buffer_size: int = 1 << 16) -> None:
+        """
+        Открытие файла для записи.
+
+        Args:
+            path: Путь к файлу
+            buffer_size: Размер буфера записи в байтах
+        """
+        self.file = open(path, 'w', encoding='utf-8', buffering=buffer_size)
+
+    def emit(self, event: SimulationEvent) -> None:
+        """
+        Запись события одной строкой JSON.
+
+        Args:
+            event: Событие симуляции
+        """
+        self.file.write(json.dumps(event.to_dict(), ensure_ascii=False))
+        self.file.write('\n')
+
+    def flush(self) -> None:
+        """Сброс буфера в файл."""
+        self.file.flush()
+
+    def close(self) -> None:
+        """Закрытие файла."""
+        self.file.close()
+
+
+class BinaryFileSink(EventSink):
+    """
+    Запись событий в компактный двоичный файл блоками.
+
+    Запись состоит из заголовка фиксированного размера (шаг, код
+    действия, признак успеха, сумма и четыре баланса) и трёх имён
+    в UTF-8 с длиной в два байта. Прочитать файл можно функцией
+    read_binary_events.
+
+    Attributes:
+        file: Файл, открытый с буфером buffer_size байт
+    """
+
+    def __init__(self, path: str, buffer_size: int = 1 << 16) -> None:
+        """
+        Открытие файла для записи.
+
+        Args:
+            path: Путь к файлу
+            buffer_size: Размер буфера записи в байтах
+        """
+        self.file: BinaryIO = open(path, 'wb', buffering=buffer_size)
+
+    def emit(self, event: SimulationEvent) -> None:
+        """
+        Запись события.
+
+        Args:
+            event: Событие симуляции
+        """
+        write = self.file.write
+        write(
+            _RECORD.pack(
+                event.step,
+                ACTION_CODES[event.action],
+                event.ok,
+                event.amount,
+                event.player_before,
+                event.player_after,
+                event.goose_before,
+                event.goose_after,
+            )
+        )
+        for name in (event.goose, event.player, event.new_goose):
+            if name is None:
+                write(_NAME_LENGTH.pack(_NO_NAME))
+            else:
+                encoded = name.encode()
+                write(_NAME_LENGTH.pack(len(encoded)))
+                write(encoded)
+
+    def flush(self) -> None:
+        """Сброс буфера в файл."""
+        self.file.flush()
+
+    def close(self) -> None:
+        """Закрытие файла."""
+        self.file.close()
+
+
+def read_binary_events(path: str) -> Iterator[SimulationEvent]:
+    """
+    Чтение событий, записанных BinaryFileSink.
+
+    Причина неудачи в двоичном формате не хранится.
+
+    Args:
+        path: Путь к файлу
+
+    Yields:
+        События в порядке записи
+    """
+    with open(path, 'rb') as file:
+        data = file.read()
+    offset = 0
+    while offset < len(data):
+        (
+            step,
+            code,
+            ok,
+            amount,
+            player_before,
+            player_after,
+            goose_before,
+            goose_after,
+        ) = _RECORD.unpack_from(data, offset)
+        offset += _RECORD.size
+        names: list[str | None] = []
+        for _ in range(3):
+            (length,) = _NAME_LENGTH.unpack_from(data, offset)
+            offset += _NAME_LENGTH.size
+            if length == _NO_NAME:
+                names.append(None)
+            else:
+                names.append(data[offset : offset + length].decode())
+                offset += length
+        goose, player, new_goose = names
+        yield SimulationEvent(
+            step,
+            ACTIONS[code],
+            goose,
+            player,
+            amount,
+            player_before,
+            player_after,
+            goose_before,
+            goose_after,
+            bool(ok),
+            new_goose,
+        )
@@ -0,0 +1,198 @@
+import json
+import time
+from functools import wraps
+from typing import Any, Callable
+
+from usecases.casino import Casino
+
+CASINO_METHODS = (
+    'player_bet',
+    'war_goose_steal_chip',
+    'honk_goose_honk',
+    'recreate_goose',
+    'place_bet',
+    'play_round',
+)
+
+
+class ActionStats:
+    """
+    Счётчики и время одного действия.
+
+    Attributes:
+        calls: Количество вызовов
+        successes: Количество вызовов без исключения
+        failures: Количество вызовов с исключением
+        total_ns: Суммарное время в наносекундах
+        max_ns: Максимальное время одного вызова в наносекундах
+        errors: Количество исключений по имени типа
+    """
+
+    __slots__ = ('calls', 'successes', 'failures', 'total_ns', 'max_ns', 'errors')
+
+    def __init__(self) -> None:
+        """Инициализация нулевых счётчиков."""
+        self.calls = 0
+        self.successes = 0
+        self.failures = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.errors: dict[str, int] = {}
+
+    @property
+    def mean_ns(self) -> float:
+        """
+        Среднее время вызова.
+
+        Returns:
+            Среднее время в наносекундах
+        """
+        return self.total_ns / self.calls if self.calls else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Преобразование счётчиков в словарь.
+
+        Returns:
+            Словарь счётчиков
+        """
+        return {
+            'calls': self.calls,
+            'successes': self.successes,
+            'failures': self.failures,
+            'total_ns': self.total_ns,
+            'mean_ns': round(self.mean_ns, 1),
+            'max_ns': self.max_ns,
+            'errors': dict(self.errors),
+        }
+
+
+class Instrumentation:
+    """
+    Сбор счётчиков и времени по действиям симуляции и методам казино.
+
+    Обёртка добавляет два вызова perf_counter_ns и несколько сложений
+    на вызов; без инструментирования код выполняется как прежде.
+
+    Attributes:
+        stats: Счётчики по имени действия
+    """
+
+    def __init__(self) -> None:
+        """Инициализация пустого набора счётчиков."""
+        self.stats: dict[str, ActionStats] = {}
+
+    def wrap(self, name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Обёртка функции сбором счётчиков под заданным именем.
+
+        Исключения учитываются и пробрасываются дальше.
+
+        Args:
+            name: Имя действия в отчёте
+            func: Оборачиваемая функция
+
+        Returns:
+            Функция с тем же поведением и именем
+        """
+        stats = self.stats.setdefault(name, ActionStats())
+        clock = time.perf_counter_ns
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = clock()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as error:
+                stats.failures += 1
+                error_name = type(error).__name__
+                stats.errors[error_name] = stats.errors.get(error_name, 0) + 1
+                raise
+            finally:
+                elapsed = clock() - start
+                stats.calls += 1
+                stats.total_ns += elapsed
+                if elapsed > stats.max_ns:
+                    stats.max_ns = elapsed
+            stats.successes += 1
+            return result
+
+        return wrapper
+
+    def instrument_commands(
+        self, commands: dict[int, Callable[..., Any]]
+    ) -> dict[int, Callable[..., Any]]:
+        """
+        Обёртка таблицы команд симуляции.
+
+        Args:
+            commands: Команды по номеру
+
+        Returns:
+            Новая таблица с обёрнутыми командами
+        """
+        return {
+            number: self.wrap(command.__name__, command)
+            for number, command in commands.items()
+        }
+
+    def instrument_casino(
+        self, casino: Casino, methods: tuple[str, ...] = CASINO_METHODS
+    ) -> None:
+        """
+        Обёртка методов конкретного казино.
+
+        Обёрнутые методы записываются в атрибуты экземпляра, класс
+        Casino не меняется. Имена в отчёте получают префикс 'casino.'.
+
+        Args:
+            casino: Казино
+            methods: Имена оборачиваемых методов
+        """
+        for method in methods:
+            setattr(
+                casino, method, self.wrap(f'casino.{method}', getattr(casino, method))
+            )
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        """
+        Преобразование всех счётчиков в словарь.
+
+        Returns:
+            Счётчики по имени действия
+        """
+        return {name: stats.to_dict() for name, stats in self.stats.items()}
+
+    def export_json(self, path: str) -> None:
+        """
+        Запись счётчиков в JSON-файл.
+
+        Args:
+            path: Путь к файлу
+        """
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.to_dict(), file, ensure_ascii=False, indent=2)
+
+    def summary(self) -> str:
+        """
+        Таблица счётчиков, отсортированная по суммарному времени.
+
+        Returns:
+            Текст таблицы
+        """
+        lines = [
+            f'{"действие":<28}{"вызовы":>9}{"успех":>9}{"ошибки":>9}'
+            f'{"всего, мс":>12}{"сред., мкс":>12}{"макс., мкс":>12}'
+        ]
+        ordered = sorted(
+            self.stats.items(), key=lambda item: item[1].total_ns, reverse=True
+        )
+        for name, stats in ordered:
+            lines.append(
+                f'{name:<28}{stats.calls:>9}{stats.successes:>9}{stats.failures:>9}'
+                f'{stats.total_ns / 1e6:>12.2f}{stats.mean_ns / 1e3:>12.2f}'
+                f'{stats.max_ns / 1e3:>12.2f}'
+            )
+            for error_name, count in sorted(stats.errors.items()):
+                lines.append(f'    {error_name}: {count}')
+        return '\n'.join(lines)
@@ -0,0 +1,381 @@
+import csv
+import json
+import math
+import random
+import time
+from itertools import islice
+from typing import Iterable, Iterator
+
+from domain.casino_entities import Goose, HonkGoose, Player, WarGoose
+from usecases.casino import Casino
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+GOOSE_KINDS = ('war', 'honk')
+
+PlayerRow = tuple[str, int]
+GooseRow = tuple[str, str, int]
+
+
+class LoadReport:
+    """
+    Итог массовой загрузки.
+
+    Attributes:
+        players: Количество загруженных игроков
+        geese: Количество загруженных гусей
+        duplicates: Количество пропущенных строк с повторяющимся именем
+        chunks: Количество обработанных блоков
+        seconds: Время загрузки в секундах
+    """
+
+    def __init__(self) -> None:
+        """Инициализация пустого итога."""
+        self.players = 0
+        self.geese = 0
+        self.duplicates = 0
+        self.chunks = 0
+        self.seconds = 0.0
+
+    @property
+    def entities(self) -> int:
+        """
+        Общее количество загруженных сущностей.
+
+        Returns:
+            Игроки и гуси вместе
+        """
+        return self.players + self.geese
+
+    @property
+    def rate(self) -> float:
+        """
+        Скорость загрузки.
+
+        Returns:
+            Сущностей в секунду
+        """
+        return self.entities / self.seconds if self.seconds else 0.0
+
+    def summary(self) -> str:
+        """
+        Текстовый итог.
+
+        Returns:
+            Строка с количествами и скоростью
+        """
+        return (
+            f'Загружено игроков: {self.players}, гусей: {self.geese}, '
+            f'повторов пропущено: {self.duplicates}, '
+            f'{self.seconds:.2f} с, {self.rate:,.0f} сущностей/с'
+        )
+
+
+def _chunks(rows: Iterable[tuple], chunk_size: int) -> Iterator[list[tuple]]:
+    """
+    Разбиение потока строк на блоки.
+
+    Args:
+        rows: Строки
+        chunk_size: Размер блока
+
+    Yields:
+        Блоки не длиннее chunk_size
+    """
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _goose_kind(kind: str) -> str:
+    """
+    Проверка типа гуся из источника.
+
+    Args:
+        kind: Тип гуся
+
+    Returns:
+        Тот же тип
+
+    Raises:
+        ValueError: Если тип неизвестен
+    """
+    if kind not in GOOSE_KINDS:
+        raise ValueError(f'Неизвестный тип гуся: {kind}')
+    return kind
+
+
+def read_players_csv(path: str) -> Iterator[PlayerRow]:
+    """
+    Потоковое чтение игроков из CSV с колонками name и balance.
+
+    Args:
+        path: Путь к файлу
+
+    Yields:
+        Пары (имя, баланс)
+    """
+    with open(path, newline='', encoding='utf-8') as file:
+        for row in csv.DictReader(file):
+            yield row['name'], int(row['balance'])
+
+
+def read_geese_csv(path: str) -> Iterator[GooseRow]:
+    """
+    Потоковое чтение гусей из CSV с колонками name, kind и volume.
+
+    Args:
+        path: Путь к файлу
+
+    Yields:
+        Тройки (имя, тип, громкость)
+    """
+    with open(path, newline='', encoding='utf-8') as file:
+        for row in csv.DictReader(file):
+            yield row['name'], row['kind'], int(row['volume'])
+
+
+def read_players_jsonl(path: str) -> Iterator[PlayerRow]:
+    """
+    Потоковое чтение игроков из JSON Lines с полями name и balance.
+
+    Args:
+        path: Путь к файлу
+
+    Yields:
+        Пары (имя, баланс)
+    """
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            if line.strip():
+                row = json.loads(line)
+                yield row['name'], int(row['balance'])
+
+
+def read_geese_jsonl(path: str) -> Iterator[GooseRow]:
+    """
+    Потоковое чтение гусей из JSON Lines с полями name, kind и volume.
+
+    Args:
+        path: Путь к файлу
+
+    Yields:
+        Тройки (имя, тип, громкость)
+    """
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            if line.strip():
+                row = json.loads(line)
+                yield row['name'], row['kind'], int(row['volume'])
+
+
+def read_players(path: str) -> Iterator[PlayerRow]:
+    """
+    Чтение игроков из CSV или JSON Lines по расширению файла.
+
+    Args:
+        path: Путь к файлу .csv или .jsonl
+
+    Returns:
+        Поток пар (имя, баланс)
+    """
+    if path.endswith('.csv'):
+        return read_players_csv(path)
+    return read_players_jsonl(path)
+
+
+def read_geese(path: str) -> Iterator[GooseRow]:
+    """
+    Чтение гусей из CSV или JSON Lines по расширению файла.
+
+    Args:
+        path: Путь к файлу .csv или .jsonl
+
+    Returns:
+        Поток троек (имя, тип, громкость)
+    """
+    if path.endswith('.csv'):
+        return read_geese_csv(path)
+    return read_geese_jsonl(path)
+
+
+def synthetic_players(
+    count: int,
+    seed: int = 0,
+    median_balance: int = 1000,
+    sigma: float = 0.25,
+    prefix: str = 'Игрок',
+) -> Iterator[PlayerRow]:
+    """
+    Игроки с логнормальным распределением балансов.
+
+    Args:
+        count: Количество игроков
+        seed: Сид генератора
+        median_balance: Медиана баланса
+        sigma: Параметр разброса логнормального распределения
+        prefix: Начало имени игрока
+
+    Yields:
+        Пары (имя, баланс не меньше 1)
+    """
+    rng = random.Random(seed)
+    mu = math.log(median_balance)
+    for i in range(count):
+        yield f'{prefix}{i}', max(1, int(rng.lognormvariate(mu, sigma)))
+
+
+def synthetic_geese(
+    count: int,
+    seed: int = 0,
+    war_share: float = 0.5,
+    min_volume: int = 1,
+    max_volume: int = 10,
+    prefix: str = 'Гусь',
+) -> Iterator[GooseRow]:
+    """
+    Гуси со случайным типом и равномерной громкостью.
+
+    Args:
+        count: Количество гусей
+        seed: Сид генератора
+        war_share: Доля боевых гусей
+        min_volume: Минимальная громкость
+        max_volume: Максимальная громкость
+        prefix: Начало имени гуся
+
+    Yields:
+        Тройки (имя, тип, громкость)
+    """
+    rng = random.Random(seed)
+    span = max_volume - min_volume + 1
+    for i in range(count):
+        kind = 'war' if rng.random() < war_share else 'honk'
+        yield f'{prefix}{i}', kind, min_volume + int(rng.random() * span)
+
+
+def load_players(
+    casino: Casino,
+    rows: Iterable[PlayerRow],
+    report: LoadReport | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    skip_duplicates: bool = False,
+) -> LoadReport:
+    """
+    Потоковая загрузка игроков блоками.
+
+    Источник читается блоками по chunk_size строк, поэтому в памяти,
+    кроме самого казино, держится только один блок и множество имён
+    для проверки повторов. Каждый блок добавляется в коллекцию и индекс
+    одним вызовом Casino.add_players_many.
+
+    Args:
+        casino: Казино
+        rows: Пары (имя, баланс)
+        report: Итог, в который добавляются результаты; по умолчанию новый
+        chunk_size: Размер блока
+        skip_duplicates: Пропускать повторяющиеся имена вместо ошибки
+
+    Returns:
+        Итог загрузки
+
+    Raises:
+        ValueError: Если имя повторяется и skip_duplicates не задан
+    """
+    report = report if report is not None else LoadReport()
+    start = time.perf_counter()
+    seen = {player.name for player in casino.player_collection}
+    for chunk in _chunks(rows, chunk_size):
+        players = []
+        for name, balance in chunk:
+            if name in seen:
+                if not skip_duplicates:
+                    raise ValueError(f'Игрок с именем {name} уже есть')
+                report.duplicates += 1
+                continue
+            seen.add(name)
+            players.append(Player(name, balance))
+        casino.add_players_many(players)
+        report.players += len(players)
+        report.chunks += 1
+    report.seconds += time.perf_counter() - start
+    return report
+
+
+def load_geese(
+    casino: Casino,
+    rows: Iterable[GooseRow],
+    report: LoadReport | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    skip_duplicates: bool = False,
+) -> LoadReport:
+    """
+    Потоковая загрузка гусей блоками.
+
+    Args:
+        casino: Казино
+        rows: Тройки (имя, тип 'war' или 'honk', громкость)
+        report: Итог, в который добавляются результаты; по умолчанию новый
+        chunk_size: Размер блока
+        skip_duplicates: Пропускать повторяющиеся имена вместо ошибки
+
+    Returns:
+        Итог загрузки
+
+    Raises:
+        ValueError: Если имя повторяется и skip_duplicates не задан
+            или тип гуся неизвестен
+    """
+    report = report if report is not None else LoadReport()
+    start = time.perf_counter()
+    seen = {goose.name for goose in casino.goose_collection}
+    rng = casino.rng
+    for chunk in _chunks(rows, chunk_size):
+        geese: list[Goose] = []
+        for name, kind, volume in chunk:
+            if name in seen:
+                if not skip_duplicates:
+                    raise ValueError(f'Гусь с именем {name} уже есть')
+                report.duplicates += 1
+                continue
+            seen.add(name)
+            goose_type = WarGoose if _goose_kind(kind) == 'war' else HonkGoose
+            geese.append(goose_type(name, volume, rng))
+        casino.add_geese_many(geese)
+        report.geese += len(geese)
+        report.chunks += 1
+    report.seconds += time.perf_counter() - start
+    return report
+
+
+def load_population(
+    casino: Casino,
+    players: str | None = None,
+    geese: str | None = None,
+    synthetic: int = 0,
+    seed: int = 0,
+) -> LoadReport:
+    """
+    Загрузка игроков и гусей из файлов или случайная генерация.
+
+    Args:
+        casino: Казино
+        players: Файл игроков; без него создаётся synthetic случайных
+        geese: Файл гусей; без него создаётся synthetic случайных
+        synthetic: Количество случайных игроков и гусей
+        seed: Сид случайных игроков и гусей
+
+    Returns:
+        Итог загрузки
+    """
+    report = LoadReport()
+    load_players(
+        casino,
+        read_players(players) if players else synthetic_players(synthetic, seed),
+        report,
+    )
+    load_geese(
+        casino,
+        read_geese(geese) if geese else synthetic_geese(synthetic, seed),
+        report,
+    )
+    return report
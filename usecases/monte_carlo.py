@@ -0,0 +1,200 @@
+import os
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    as_completed,
+    wait,
+)
+from typing import Iterator
+
+from domain.rng import SeedSequence
+from usecases.simulation import SimulationConfig, SimulationEngine
+
+_worker_engine: SimulationEngine | None = None
+_worker_steps = 0
+
+
+class RunSummary:
+    """
+    Краткий итог одного запуска симуляции.
+
+    Attributes:
+        run_index: Номер запуска в серии
+        steps: Количество шагов до окончания игры или до лимита
+        winner: 'players', 'geese' или None
+        player_balances: Финальные балансы оставшихся игроков
+        goose_loot: Суммарная добыча гусей
+    """
+
+    def __init__(
+        self,
+        run_index: int,
+        steps: int,
+        winner: str | None,
+        player_balances: dict[str, int],
+        goose_loot: int,
+    ) -> None:
+        """
+        Инициализация итога.
+
+        Args:
+            run_index: Номер запуска в серии
+            steps: Количество шагов
+            winner: Победившая сторона или None
+            player_balances: Финальные балансы игроков
+            goose_loot: Суммарная добыча гусей
+        """
+        self.run_index = run_index
+        self.steps = steps
+        self.winner = winner
+        self.player_balances = player_balances
+        self.goose_loot = goose_loot
+
+
+class MonteCarloStats:
+    """
+    Накопитель статистики по серии запусков.
+
+    Attributes:
+        runs: Количество учтённых запусков
+        geese_wins: Количество запусков, где все игроки обанкротились
+        players_wins: Количество запусков, где игрок достиг баланса победы
+        total_steps: Суммарное количество шагов
+        total_goose_loot: Суммарная добыча гусей
+    """
+
+    def __init__(self) -> None:
+        """Инициализация пустой статистики."""
+        self.runs = 0
+        self.geese_wins = 0
+        self.players_wins = 0
+        self.total_steps = 0
+        self.total_goose_loot = 0
+
+    def add(self, summary: RunSummary) -> None:
+        """
+        Учёт итога одного запуска.
+
+        Args:
+            summary: Итог запуска
+        """
+        self.runs += 1
+        self.total_steps += summary.steps
+        self.total_goose_loot += summary.goose_loot
+        if summary.winner == 'geese':
+            self.geese_wins += 1
+        elif summary.winner == 'players':
+            self.players_wins += 1
+
+    @property
+    def bankruptcy_rate(self) -> float:
+        """
+        Доля запусков, закончившихся банкротством всех игроков.
+
+        Returns:
+            Доля от 0 до 1
+        """
+        return self.geese_wins / self.runs if self.runs else 0.0
+
+    @property
+    def mean_steps(self) -> float:
+        """
+        Среднее количество шагов на запуск.
+
+        Returns:
+            Среднее количество шагов
+        """
+        return self.total_steps / self.runs if self.runs else 0.0
+
+
+def _init_worker(config: SimulationConfig, steps: int) -> None:
+    """
+    Создание движка, который воркер переиспользует для всех своих запусков.
+
+    Args:
+        config: Конфигурация симуляции
+        steps: Лимит шагов одного запуска
+    """
+    global _worker_engine, _worker_steps
+    _worker_engine = SimulationEngine(config)
+    _worker_steps = steps
+
+
+def _run_chunk(chunk: list[tuple[int, int]]) -> list[RunSummary]:
+    """
+    Выполнение пачки запусков в воркере.
+
+    Args:
+        chunk: Пары (номер запуска, состояние генератора)
+
+    Returns:
+        Итоги запусков пачки
+    """
+    engine = _worker_engine
+    if engine is None:
+        raise RuntimeError('Воркер не инициализирован')
+    summaries = []
+    for run_index, state in chunk:
+        engine.reset(state)
+        result = engine.advance(_worker_steps)
+        summaries.append(
+            RunSummary(
+                run_index,
+                result.steps,
+                result.winner,
+                result.player_balances,
+                result.total_goose_loot,
+            )
+        )
+    return summaries
+
+
+def run_monte_carlo(
+    config: SimulationConfig,
+    runs: int,
+    steps: int,
+    seed: int = 0,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+) -> Iterator[RunSummary]:
+    """
+    Параллельный прогон серии независимых симуляций.
+
+    Каждый запуск получает собственный поток случайных чисел от
+    SeedSequence(seed), поэтому результаты не зависят от количества
+    воркеров и порядка выполнения. Итоги отдаются по мере готовности
+    пачек, а количество пачек в работе ограничено, чтобы память
+    родителя не росла вместе с числом запусков.
+
+    Args:
+        config: Конфигурация симуляции
+        runs: Количество запусков
+        steps: Лимит шагов одного запуска
+        seed: Корневой сид серии
+        workers: Количество процессов (по умолчанию число ядер)
+        chunk_size: Количество запусков в одной задаче
+
+    Yields:
+        Итоги запусков в порядке завершения пачек
+    """
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, min(256, runs // (workers * 4)))
+    tasks = [
+        (run_index, child.generate_state())
+        for run_index, child in enumerate(SeedSequence(seed).spawn(runs))
+    ]
+    chunks = (tasks[start : start + chunk_size] for start in range(0, runs, chunk_size))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(config, steps)
+    ) as executor:
+        pending: set[Future[list[RunSummary]]] = set()
+        for chunk in chunks:
+            pending.add(executor.submit(_run_chunk, chunk))
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        for future in as_completed(pending):
+            yield from future.result()
@@ -0,0 +1,395 @@
+import math
+from typing import Any
+
+SKETCH_PRECISION_BITS = 6
+
+
+class OnlineStats:
+    """
+    Потоковые количество, сумма, среднее, дисперсия, минимум и максимум.
+
+    Среднее и дисперсия считаются методом Уэлфорда, который поддерживает
+    и удаление значения, поэтому статистику можно вести по текущему
+    составу, а не только по потоку наблюдений. Минимум и максимум
+    учитывают все добавленные значения и при удалении не пересчитываются.
+
+    Attributes:
+        count: Количество значений
+        total: Точная сумма значений
+        mean: Среднее
+        m2: Сумма квадратов отклонений от среднего
+        min: Наименьшее добавленное значение или None
+        max: Наибольшее добавленное значение или None
+    """
+
+    def __init__(self) -> None:
+        """Инициализация пустой статистики."""
+        self.clear()
+
+    def clear(self) -> None:
+        """Сброс статистики."""
+        self.count = 0
+        self.total = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min: int | None = None
+        self.max: int | None = None
+
+    def add(self, value: int) -> None:
+        """
+        Учёт значения.
+
+        Args:
+            value: Значение
+        """
+        self.count += 1
+        self.total += value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def remove(self, value: int) -> None:
+        """
+        Исключение ранее учтённого значения.
+
+        Args:
+            value: Значение
+        """
+        self.count -= 1
+        self.total -= value
+        if not self.count:
+            self.mean = 0.0
+            self.m2 = 0.0
+            return
+        delta = value - self.mean
+        self.mean -= delta / self.count
+        self.m2 = max(0.0, self.m2 - delta * (value - self.mean))
+
+    def replace(self, old: int, new: int) -> None:
+        """
+        Замена учтённого значения новым без изменения количества.
+
+        Args:
+            old: Прежнее значение
+            new: Новое значение
+        """
+        self.total += new - old
+        delta = new - old
+        old_mean = self.mean
+        self.mean += delta / self.count
+        self.m2 = max(0.0, self.m2 + delta * (new - self.mean + old - old_mean))
+        if self.min is None or new < self.min:
+            self.min = new
+        if self.max is None or new > self.max:
+            self.max = new
+
+    @property
+    def variance(self) -> float:
+        """
+        Дисперсия совокупности.
+
+        Returns:
+            Дисперсия или 0 для пустой статистики
+        """
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def stddev(self) -> float:
+        """
+        Стандартное отклонение совокупности.
+
+        Returns:
+            Стандартное отклонение
+        """
+        return math.sqrt(self.variance)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Преобразование в словарь для отчётов.
+
+        Returns:
+            Количество, сумма, среднее, стандартное отклонение и границы
+        """
+        return {
+            'count': self.count,
+            'sum': self.total,
+            'mean': self.mean,
+            'stddev': self.stddev,
+            'min': self.min,
+            'max': self.max,
+        }
+
+
+class BalanceSketch:
+    """
+    Приближённые квантили целых значений с добавлением и удалением.
+
+    Логарифмически-линейная гистограмма: значения по модулю меньше
+    2 * 2**precision_bits хранятся точно, остальные попадают в корзину
+    с относительной шириной 2**-precision_bits (около 1.6% при 6 битах).
+    Количество корзин ограничено разрядностью значений, а не их
+    количеством, поэтому память не растёт вместе с составом.
+
+    Attributes:
+        precision_bits: Точность корзин в битах
+        counts: Количество значений в каждой непустой корзине
+        count: Общее количество значений
+    """
+
+    def __init__(self, precision_bits: int = SKETCH_PRECISION_BITS) -> None:
+        """
+        Инициализация пустого эскиза.
+
+        Args:
+            precision_bits: Точность корзин в битах
+        """
+        self.precision_bits = precision_bits
+        self.counts: dict[int, int] = {}
+        self.count = 0
+
+    def _bucket(self, value: int) -> int:
+        """
+        Номер корзины значения.
+
+        Args:
+            value: Значение
+
+        Returns:
+            Номер корзины; отрицательные значения получают отрицательные номера
+        """
+        if value < 0:
+            return -1 - self._bucket(-value)
+        size = 1 << self.precision_bits
+        if value < 2 * size:
+            return value
+        shift = value.bit_length() - self.precision_bits - 1
+        return size * (shift + 1) + (value >> shift) - size
+
+    def _bounds(self, bucket: int) -> tuple[int, int]:
+        """
+        Наименьшее и наибольшее значение корзины.
+
+        Args:
+            bucket: Номер корзины
+
+        Returns:
+            Границы корзины включительно
+        """
+        if bucket < 0:
+            low, high = self._bounds(-1 - bucket)
+            return -high, -low
+        size = 1 << self.precision_bits
+        if bucket < 2 * size:
+            return bucket, bucket
+        shift = bucket // size - 1
+        mantissa = size + bucket % size
+        return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+    def add(self, value: int) -> None:
+        """
+        Учёт значения.
+
+        Args:
+            value: Значение
+        """
+        bucket = self._bucket(value)
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.count += 1
+
+    def remove(self, value: int) -> None:
+        """
+        Исключение ранее учтённого значения.
+
+        Args:
+            value: Значение
+        """
+        bucket = self._bucket(value)
+        left = self.counts[bucket] - 1
+        if left:
+            self.counts[bucket] = left
+        else:
+            del self.counts[bucket]
+        self.count -= 1
+
+    def replace(self, old: int, new: int) -> None:
+        """
+        Замена учтённого значения новым.
+
+        Args:
+            old: Прежнее значение
+            new: Новое значение
+        """
+        if self._bucket(old) != self._bucket(new):
+            self.remove(old)
+            self.add(new)
+
+    def clear(self) -> None:
+        """Удаление всех значений."""
+        self.counts.clear()
+        self.count = 0
+
+    def quantile(self, q: float) -> int | None:
+        """
+        Приближённый квантиль.
+
+        Args:
+            q: Уровень от 0 до 1
+
+        Returns:
+            Середина корзины, содержащей квантиль, или None без значений
+        """
+        if not self.count:
+            return None
+        rank = min(self.count - 1, int(q * self.count))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen > rank:
+                low, high = self._bounds(bucket)
+                return (low + high) // 2
+        return None
+
+    @property
+    def min(self) -> int | None:
+        """
+        Нижняя граница наименьшей непустой корзины.
+
+        Returns:
+            Приближённый минимум или None без значений
+        """
+        return self._bounds(min(self.counts))[0] if self.counts else None
+
+    @property
+    def max(self) -> int | None:
+        """
+        Верхняя граница наибольшей непустой корзины.
+
+        Returns:
+            Приближённый максимум или None без значений
+        """
+        return self._bounds(max(self.counts))[1] if self.counts else None
+
+
+class BalanceAggregator:
+    """
+    Сводка по балансам игроков и добыче гусей без обхода состава.
+
+    Подключается к казино через Casino.add_aggregator и обновляется
+    на каждом изменении: посадке и уходе игрока, изменении его баланса
+    и краже гуся. Балансы, изменённые в обход казино, не учитываются.
+
+    Attributes:
+        players: Статистика текущих балансов игроков
+        sketch: Эскиз квантилей текущих балансов игроков
+        loot: Статистика краж по типу гуся ('war', 'honk')
+        departed: Количество ушедших игроков
+    """
+
+    def __init__(self, precision_bits: int = SKETCH_PRECISION_BITS) -> None:
+        """
+        Инициализация пустой сводки.
+
+        Args:
+            precision_bits: Точность эскиза квантилей в битах
+        """
+        self.players = OnlineStats()
+        self.sketch = BalanceSketch(precision_bits)
+        self.loot = {'war': OnlineStats(), 'honk': OnlineStats()}
+        self.departed = 0
+
+    def clear(self) -> None:
+        """Сброс всей сводки."""
+        self.players.clear()
+        self.sketch.clear()
+        for stats in self.loot.values():
+            stats.clear()
+        self.departed = 0
+
+    def on_player_added(self, balance: int) -> None:
+        """
+        Учёт нового игрока.
+
+        Args:
+            balance: Баланс игрока
+        """
+        self.players.add(balance)
+        self.sketch.add(balance)
+
+    def on_player_removed(self, balance: int) -> None:
+        """
+        Учёт ушедшего игрока.
+
+        Args:
+            balance: Баланс игрока в момент ухода
+        """
+        self.players.remove(balance)
+        self.sketch.remove(balance)
+        self.departed += 1
+
+    def on_balance_change(self, old: int, new: int) -> None:
+        """
+        Учёт изменения баланса игрока.
+
+        Args:
+            old: Прежний баланс
+            new: Новый баланс
+        """
+        self.players.replace(old, new)
+        self.sketch.replace(old, new)
+
+    def on_goose_loot(self, kind: str, amount: int) -> None:
+        """
+        Учёт кражи гуся.
+
+        Args:
+            kind: Тип гуся ('war' или 'honk')
+            amount: Украденная сумма
+        """
+        self.loot[kind].add(amount)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Сводка в виде словаря.
+
+        Returns:
+            Статистика игроков с квантилями и добыча гусей по типам
+        """
+        players = self.players.to_dict()
+        players['min'] = self.sketch.min
+        players['max'] = self.sketch.max
+        for level in (0.5, 0.9, 0.99):
+            players[f'p{round(level * 100)}'] = self.sketch.quantile(level)
+        return {
+            'players': players,
+            'departed': self.departed,
+            'loot': {kind: stats.to_dict() for kind, stats in self.loot.items()},
+        }
+
+    def summary(self) -> str:
+        """
+        Текстовая сводка для статуса игры.
+
+        Returns:
+            Несколько строк со статистикой игроков и добычей гусей
+        """
+        data = self.to_dict()
+        players = data['players']
+        lines = [
+            f'Игроков: {players["count"]} (ушло {data["departed"]}), '
+            f'сумма балансов: {players["sum"]}',
+            f'Баланс: среднее {players["mean"]:.1f}, '
+            f'откл. {players["stddev"]:.1f}, '
+            f'мин. {players["min"]}, макс. {players["max"]}',
+            f'Квантили баланса: p50 {players["p50"]}, p90 {players["p90"]}, '
+            f'p99 {players["p99"]}',
+        ]
+        for kind, loot in data['loot'].items():
+            lines.append(
+                f'Добыча {kind}: {loot["sum"]} за {loot["count"]} краж, '
+                f'среднее {loot["mean"]:.1f}, макс. {loot["max"]}'
+            )
+        return '\n'.join(lines)
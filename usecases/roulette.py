@@ -0,0 +1,212 @@
+from typing import Any, Sequence
+
+import numpy as np
+
+from domain.casino_entities import Player
+from domain.roulette import BET_BLACK, PAYOUT_TABLE
+
+STATUS_LOSS = 0
+STATUS_WIN = 1
+STATUS_INSUFFICIENT_BALANCE = 2
+STATUS_INVALID_NUMBER = 3
+STATUS_INVALID_BET = 4
+STATUS_UNKNOWN_PLAYER = 5
+
+_PAYOUTS = np.array(PAYOUT_TABLE, dtype=np.int64)
+
+
+class BatchBetResult:
+    """
+    Итог пакета ставок.
+
+    Attributes:
+        statuses: Статус каждой ставки (STATUS_*)
+        spins: Выпавшее число для каждой ставки
+        payouts: Сумма, возвращённая игроку (0 при проигрыше и ошибке)
+    """
+
+    def __init__(self, statuses: Any, spins: Any, payouts: Any) -> None:
+        """
+        Инициализация итога.
+
+        Args:
+            statuses: Массив статусов
+            spins: Массив выпавших чисел
+            payouts: Массив выплат
+        """
+        self.statuses = statuses
+        self.spins = spins
+        self.payouts = payouts
+
+
+class VectorizedRoulette:
+    """
+    Пакетная рулетка над непрерывным массивом балансов.
+
+    Игрок задаётся позицией в массиве balances. Коды ставок те же, что
+    в domain.roulette: 0-36 для ставки на число, BET_* для внешних ставок.
+
+    Attributes:
+        balances: Балансы игроков (int64, C-непрерывный)
+        rng: Генератор NumPy
+    """
+
+    def __init__(self, balances: Any, rng: Any = None, seed: int | None = None):
+        """
+        Инициализация рулетки.
+
+        Args:
+            balances: Начальные балансы игроков
+            rng: numpy.random.Generator; если не задан, создаётся из сида
+            seed: Сид генератора
+        """
+        self.balances = np.ascontiguousarray(balances, dtype=np.int64)
+        self.rng = rng if rng is not None else np.random.default_rng(seed)
+
+    @classmethod
+    def from_players(
+        cls, players: Sequence[Player], rng: Any = None, seed: int | None = None
+    ) -> 'VectorizedRoulette':
+        """
+        Создание рулетки по балансам игроков.
+
+        Args:
+            players: Игроки в порядке их идентификаторов
+            rng: numpy.random.Generator
+            seed: Сид генератора
+
+        Returns:
+            Новая рулетка
+        """
+        balances = np.fromiter(
+            (player.balance for player in players), np.int64, len(players)
+        )
+        return cls(balances, rng, seed)
+
+    def write_back(self, players: Sequence[Player]) -> None:
+        """
+        Перенос балансов обратно в объекты игроков.
+
+        Args:
+            players: Игроки в том же порядке, что и при создании
+        """
+        for player, balance in zip(players, self.balances.tolist(), strict=True):
+            player.balance = balance
+
+    def bet_many(
+        self,
+        player_ids: Any,
+        stakes: Any,
+        bet_codes: Any,
+        single_spin: bool = False,
+    ) -> BatchBetResult:
+        """
+        Разыгрывание пакета ставок.
+
+        По умолчанию каждая ставка получает своё вращение колеса, как при
+        последовательных вызовах Casino.player_bet. С single_spin=True весь
+        пакет считается одним раундом стола и разыгрывается на одном числе.
+
+        Проверки те же, что у Casino.player_bet, но ошибка возвращается
+        статусом ставки, а не исключением. Если игрок ставит несколько раз,
+        баланс проверяется с учётом его предыдущих принятых ставок в
+        пакете, а выигрыши зачисляются после разыгрывания всего пакета.
+
+        Args:
+            player_ids: Позиции игроков в balances
+            stakes: Размеры ставок
+            bet_codes: Коды ставок
+            single_spin: Разыграть весь пакет на одном вращении
+
+        Returns:
+            Статусы, выпавшие числа и выплаты
+        """
+        ids = np.asarray(player_ids, dtype=np.int64)
+        stakes = np.asarray(stakes, dtype=np.int64)
+        codes = np.asarray(bet_codes, dtype=np.int64)
+        size = ids.shape[0]
+        statuses = np.full(size, STATUS_LOSS, dtype=np.int8)
+
+        known = (ids >= 0) & (ids < self.balances.shape[0])
+        safe_ids = np.where(known, ids, 0)
+        invalid_number = codes > 36
+        invalid_bet = codes < BET_BLACK
+        well_formed = known & ~invalid_number & ~invalid_bet
+        prior = self._prior_stakes(safe_ids, np.where(well_formed, stakes, 0))
+        insufficient = known & (self.balances[safe_ids] - prior < stakes)
+        if insufficient.any():
+            self._recheck_balances(safe_ids, stakes, well_formed, insufficient)
+
+        statuses[invalid_bet] = STATUS_INVALID_BET
+        statuses[invalid_number] = STATUS_INVALID_NUMBER
+        statuses[insufficient] = STATUS_INSUFFICIENT_BALANCE
+        statuses[~known] = STATUS_UNKNOWN_PLAYER
+        accepted = well_formed & ~insufficient
+
+        spins = self.rng.integers(0, 37, size=1 if single_spin else size)
+        if single_spin:
+            spins = np.broadcast_to(spins, (size,))
+        multipliers = _PAYOUTS[np.where(accepted, codes - BET_BLACK, 0), spins]
+        payouts = np.where(accepted, multipliers * stakes, 0)
+        statuses[accepted & (payouts > 0)] = STATUS_WIN
+
+        np.add.at(self.balances, ids[accepted], (payouts - stakes)[accepted])
+        return BatchBetResult(statuses, spins, payouts)
+
+    def _recheck_balances(
+        self, ids: Any, stakes: Any, well_formed: Any, insufficient: Any
+    ) -> None:
+        """
+        Последовательная проверка баланса игроков с отклонёнными ставками.
+
+        Сумма предыдущих ставок в bet_many учитывает и те, что сами
+        не прошли проверку баланса, поэтому для игроков с такими ставками
+        баланс пересчитывается по порядку только по принятым ставкам.
+        Остальные игроки не затрагиваются.
+
+        Args:
+            ids: Позиции игроков (0 для неизвестных)
+            stakes: Размеры ставок
+            well_formed: Маска ставок без ошибок игрока, числа и типа
+            insufficient: Маска нехватки баланса; исправляется на месте
+        """
+        affected = np.isin(ids, np.unique(ids[insufficient]))
+        rows = np.flatnonzero(affected & (insufficient | well_formed))
+        remaining: dict[int, int] = {}
+        for row, player, stake, valid in zip(
+            rows.tolist(),
+            ids[rows].tolist(),
+            stakes[rows].tolist(),
+            well_formed[rows].tolist(),
+            strict=True,
+        ):
+            balance = remaining.get(player, int(self.balances[player]))
+            short = balance < stake
+            insufficient[row] = short
+            if valid and not short:
+                remaining[player] = balance - stake
+
+    @staticmethod
+    def _prior_stakes(ids: Any, stakes: Any) -> Any:
+        """
+        Сумма предыдущих ставок того же игрока для каждой ставки пакета.
+
+        Args:
+            ids: Позиции игроков
+            stakes: Размеры ставок (0 для отклонённых заранее)
+
+        Returns:
+            Массив сумм предыдущих ставок
+        """
+        order = np.argsort(ids, kind='stable')
+        sorted_ids = ids[order]
+        sorted_stakes = stakes[order]
+        exclusive = np.cumsum(sorted_stakes) - sorted_stakes
+        starts = np.ones(ids.shape[0], dtype=bool)
+        starts[1:] = sorted_ids[1:] != sorted_ids[:-1]
+        group_start = np.maximum.accumulate(
+            np.where(starts, np.arange(ids.shape[0]), 0)
+        )
+        prior = np.empty_like(exclusive)
+        prior[order] = exclusive - exclusive[group_start]
+        return prior
@@ -0,0 +1,440 @@
+import multiprocessing
+from multiprocessing.connection import Connection
+from types import TracebackType
+from typing import Any
+
+from domain.casino_entities import Player
+from domain.rng import SeedSequence
+from usecases.simulation import SimulationConfig, SimulationEngine
+
+Move = tuple[str, int]
+Arrival = tuple[str, int]
+Departure = tuple[str, int, int]
+
+
+class ShardStats:
+    """
+    Статистика стола-шарда или всех шардов вместе.
+
+    Attributes:
+        shard: Номер шарда или -1 для сводной статистики
+        steps: Количество выполненных шагов
+        winner: 'players', 'geese' или None
+        players: Количество игроков за столом
+        bankrupt: Количество обанкротившихся игроков
+        player_total: Сумма балансов игроков
+        goose_loot: Сумма балансов гусей
+        moves: Количество игроков, ушедших за другие столы
+        action_counts: Количество вызовов каждого действия
+    """
+
+    def __init__(
+        self,
+        shard: int,
+        steps: int,
+        winner: str | None,
+        players: int,
+        bankrupt: int,
+        player_total: int,
+        goose_loot: int,
+        moves: int,
+        action_counts: dict[str, int],
+    ) -> None:
+        """
+        Инициализация статистики.
+
+        Args:
+            shard: Номер шарда
+            steps: Количество шагов
+            winner: Победившая сторона или None
+            players: Количество игроков
+            bankrupt: Количество банкротов
+            player_total: Сумма балансов игроков
+            goose_loot: Сумма балансов гусей
+            moves: Количество ушедших игроков
+            action_counts: Вызовы действий
+        """
+        self.shard = shard
+        self.steps = steps
+        self.winner = winner
+        self.players = players
+        self.bankrupt = bankrupt
+        self.player_total = player_total
+        self.goose_loot = goose_loot
+        self.moves = moves
+        self.action_counts = action_counts
+
+    @classmethod
+    def combine(cls, parts: list['ShardStats']) -> 'ShardStats':
+        """
+        Сведение статистики шардов.
+
+        Игроки побеждают, если победили хотя бы за одним столом, гуси —
+        если обанкротили игроков за всеми столами.
+
+        Args:
+            parts: Статистика каждого шарда
+
+        Returns:
+            Сводная статистика с номером шарда -1
+        """
+        action_counts: dict[str, int] = {}
+        for part in parts:
+            for action, count in part.action_counts.items():
+                action_counts[action] = action_counts.get(action, 0) + count
+        winners = {part.winner for part in parts}
+        winner = None
+        if 'players' in winners:
+            winner = 'players'
+        elif winners == {'geese'}:
+            winner = 'geese'
+        return cls(
+            -1,
+            sum(part.steps for part in parts),
+            winner,
+            sum(part.players for part in parts),
+            sum(part.bankrupt for part in parts),
+            sum(part.player_total for part in parts),
+            sum(part.goose_loot for part in parts),
+            sum(part.moves for part in parts),
+            action_counts,
+        )
+
+
+class Shard:
+    """
+    Один стол шардированного казино.
+
+    Стол владеет своим движком и генератором. Раунд состоит из приёма
+    пришедших игроков, шагов симуляции и выдачи уходящих игроков,
+    поэтому переходы между столами происходят только между раундами.
+
+    Attributes:
+        index: Номер шарда
+        shards: Общее количество шардов
+        migration: Доля игроков, случайно меняющих стол за раунд
+        engine: Движок стола
+        moves: Количество ушедших игроков
+        reported: Количество банкротов, уже переданных координатору
+    """
+
+    def __init__(
+        self,
+        index: int,
+        shards: int,
+        config: SimulationConfig,
+        state: int,
+        migration: float = 0.0,
+    ) -> None:
+        """
+        Создание стола.
+
+        Args:
+            index: Номер шарда
+            shards: Общее количество шардов
+            config: Игроки и гуси этого стола
+            state: Состояние генератора стола
+            migration: Доля игроков, случайно меняющих стол за раунд
+        """
+        self.index = index
+        self.shards = shards
+        self.migration = migration
+        self.engine = SimulationEngine(config)
+        self.engine.reset(state)
+        self.moves = 0
+        self.reported = 0
+
+    def play_round(
+        self, steps: int, evictions: list[Move], arrivals: list[Arrival]
+    ) -> tuple[ShardStats, list[Departure], list[str]]:
+        """
+        Один раунд стола.
+
+        Args:
+            steps: Количество шагов симуляции
+            evictions: Пары (имя, новый стол) игроков, которых нужно
+                отправить за другой стол после шагов
+            arrivals: Пары (имя, баланс) пришедших игроков
+
+        Returns:
+            Статистика после раунда, тройки (имя, баланс, новый стол)
+            ушедших игроков и имена игроков, обанкротившихся за раунд
+        """
+        engine = self.engine
+        casino = engine.casino
+        for name, balance in arrivals:
+            casino.add_player(Player(name, balance))
+        if arrivals and engine.winner == 'geese':
+            engine.winner = None
+        engine.step_many(steps)
+
+        departures: list[Departure] = []
+        for name, target in evictions:
+            try:
+                player = casino.search_player(name)
+            except ValueError:
+                continue
+            casino.remove_player(player)
+            departures.append((name, player.balance, target))
+        if self.migration and self.shards > 1:
+            departures.extend(self._migrants())
+        self.moves += len(departures)
+        if not len(casino.player_collection) and engine.winner is None:
+            engine.winner = 'geese'
+        bankrupt = engine.bankrupt_players[self.reported :]
+        self.reported = len(engine.bankrupt_players)
+        return self.stats(), departures, bankrupt
+
+    def _migrants(self) -> list[Departure]:
+        """
+        Случайный выбор игроков, уходящих за другие столы.
+
+        Количество округляется случайно, чтобы и маленькие столы в
+        среднем теряли долю migration игроков.
+
+        Returns:
+            Тройки (имя, баланс, новый стол)
+        """
+        casino = self.engine.casino
+        rng = self.engine.rng
+        items = casino.player_collection.items
+        count = int(len(items) * self.migration + rng.random())
+        departures = []
+        for _ in range(min(count, len(items))):
+            player = items[int(rng.random() * len(items))]
+            target = int(rng.random() * (self.shards - 1))
+            if target >= self.index:
+                target += 1
+            casino.remove_player(player)
+            departures.append((player.name, player.balance, target))
+        return departures
+
+    def stats(self) -> ShardStats:
+        """
+        Текущая статистика стола.
+
+        Returns:
+            Статистика шарда
+        """
+        engine = self.engine
+        casino = engine.casino
+        return ShardStats(
+            self.index,
+            engine.step,
+            engine.winner,
+            len(casino.player_collection),
+            len(engine.bankrupt_players),
+            sum(player.balance for player in casino.player_collection.items),
+            sum(goose.balance for goose in casino.goose_collection.items),
+            self.moves,
+            dict(engine.action_counts),
+        )
+
+
+def _serve_shard(connection: Connection, *args: Any) -> None:
+    """
+    Цикл процесса-воркера: раунды стола по командам координатора.
+
+    Args:
+        connection: Конец канала со стороны воркера
+        *args: Аргументы Shard
+    """
+    shard = Shard(*args)
+    while True:
+        message = connection.recv()
+        if message is None:
+            break
+        connection.send(shard.play_round(*message))
+    connection.close()
+
+
+class ShardCoordinator:
+    """
+    Координатор столов, разнесённых по процессам.
+
+    Игрок с номером i в конфигурации попадает за стол i % shards, гусь
+    с номером j — за стол j % shards. Каждый стол получает свой поток
+    случайных чисел от SeedSequence(seed), поэтому итог не зависит от
+    того, выполняются ли столы в процессах или в текущем процессе.
+
+    Раунд — барьер: координатор рассылает всем столам команду и ждёт
+    ответа каждого. Переходы игроков копятся в течение раунда и
+    передаются новым столам одним пакетом в начале следующего раунда.
+
+    Attributes:
+        shards: Количество столов
+        owner: Стол каждого игрока, который ещё не обанкротился
+        evictions: Запрошенные переходы (имя, новый стол) по текущему столу
+        arrivals: Игроки (имя, баланс), ожидающие посадки, по новому столу
+        rounds: Количество сыгранных раундов
+        stats: Статистика каждого стола после последнего раунда
+    """
+
+    def __init__(
+        self,
+        config: SimulationConfig,
+        shards: int,
+        seed: int = 0,
+        migration: float = 0.0,
+        processes: bool = True,
+    ) -> None:
+        """
+        Разбиение конфигурации по столам и запуск воркеров.
+
+        Args:
+            config: Конфигурация всего казино
+            shards: Количество столов
+            seed: Корневой сид
+            migration: Доля игроков, случайно меняющих стол за раунд
+            processes: Запускать столы в отдельных процессах; иначе они
+                выполняются по очереди в текущем процессе
+
+        Raises:
+            ValueError: Если количество столов не положительно
+        """
+        if shards <= 0:
+            raise ValueError('Количество столов должно быть положительным')
+        self.shards = shards
+        self.owner = {name: i % shards for i, (name, _) in enumerate(config.players)}
+        self.evictions: list[list[Move]] = [[] for _ in range(shards)]
+        self.arrivals: list[list[Arrival]] = [[] for _ in range(shards)]
+        self.rounds = 0
+        self.stats: list[ShardStats] = []
+        self.local: list[Shard] = []
+        self.connections: list[Connection] = []
+        self.workers: list[multiprocessing.Process] = []
+        states = [child.generate_state() for child in SeedSequence(seed).spawn(shards)]
+        for index in range(shards):
+            part = SimulationConfig(
+                config.players[index::shards],
+                config.geese[index::shards],
+                config.bet_value,
+                config.win_balance,
+                config.min_honk_volume,
+                config.max_honk_volume,
+                config.columnar,
+                config.next_event,
+            )
+            args = (index, shards, part, states[index], migration)
+            if not processes:
+                self.local.append(Shard(*args))
+                continue
+            parent, child = multiprocessing.Pipe()
+            worker = multiprocessing.Process(
+                target=_serve_shard, args=(child, *args), daemon=True
+            )
+            worker.start()
+            child.close()
+            self.connections.append(parent)
+            self.workers.append(worker)
+
+    def move(self, name: str, shard: int) -> None:
+        """
+        Запрос перехода игрока за другой стол после текущего раунда.
+
+        Args:
+            name: Имя игрока
+            shard: Номер нового стола
+
+        Raises:
+            ValueError: Если стола нет или игрок уже выбыл
+        """
+        if not 0 <= shard < self.shards:
+            raise ValueError('Нет такого стола')
+        source = self.owner.get(name)
+        if source is None:
+            raise ValueError('Игрок не найден')
+        if source != shard:
+            self.evictions[source].append((name, shard))
+
+    def play_round(self, steps: int) -> ShardStats:
+        """
+        Один раунд всех столов с барьером в конце.
+
+        Args:
+            steps: Количество шагов симуляции каждого стола
+
+        Returns:
+            Сводная статистика после раунда
+        """
+        messages = [
+            (steps, self.evictions[index], self.arrivals[index])
+            for index in range(self.shards)
+        ]
+        self.evictions = [[] for _ in range(self.shards)]
+        self.arrivals = [[] for _ in range(self.shards)]
+        if self.local:
+            replies = [
+                shard.play_round(*message)
+                for shard, message in zip(self.local, messages, strict=True)
+            ]
+        else:
+            for connection, message in zip(self.connections, messages, strict=True):
+                connection.send(message)
+            replies = [connection.recv() for connection in self.connections]
+
+        self.stats = []
+        for stats, departures, bankrupt in replies:
+            self.stats.append(stats)
+            for name in bankrupt:
+                del self.owner[name]
+            for name, balance, target in departures:
+                self.arrivals[target].append((name, balance))
+                self.owner[name] = target
+        self.rounds += 1
+        return ShardStats.combine(self.stats)
+
+    def run(self, rounds: int, steps: int) -> ShardStats:
+        """
+        Несколько раундов подряд.
+
+        Останавливается раньше, если у всего казино определился победитель.
+
+        Args:
+            rounds: Максимальное количество раундов
+            steps: Шагов каждого стола за раунд
+
+        Returns:
+            Сводная статистика после последнего раунда
+        """
+        combined = ShardStats.combine(self.stats)
+        for _ in range(rounds):
+            combined = self.play_round(steps)
+            if combined.winner is not None:
+                break
+        return combined
+
+    def close(self) -> None:
+        """Остановка воркеров."""
+        for connection in self.connections:
+            connection.send(None)
+            connection.close()
+        for worker in self.workers:
+            worker.join()
+        self.connections = []
+        self.workers = []
+
+    def __enter__(self) -> 'ShardCoordinator':
+        """
+        Вход в контекст.
+
+        Returns:
+            Сам координатор
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """
+        Остановка воркеров при выходе из контекста.
+
+        Args:
+            exc_type: Тип исключения
+            exc: Исключение
+            traceback: Трассировка
+        """
+        self.close()
@@ -0,0 +1,862 @@
+import math
+import random
+from typing import Any, Callable, Sequence, TypeVar
+
+from domain.casino_entities import Goose, HonkGoose, Player, WarGoose
+from domain.rng import RandomSource
+from domain.sampling import multinomial
+from repository.base_classes import BaseCollection
+from repository.casino_collections import (
+    ChipCollection,
+    IndexDictChip,
+    IndexDictGoose,
+    IndexDictPlayer,
+    IndexedGooseCollection,
+    IndexedPlayerCollection,
+)
+from repository.columnar_storage import (
+    ColumnarGooseCollection,
+    ColumnarIndexDictGoose,
+    ColumnarIndexDictPlayer,
+    ColumnarPlayerCollection,
+    GooseStore,
+    PlayerStore,
+)
+from usecases.casino import Casino
+from usecases.events import EventSink, NullSink, SimulationEvent
+from usecases.instrumentation import Instrumentation
+from usecases.watchers import ThresholdWatcher
+
+WIN_BALANCE = 5000
+BET_TYPES: tuple[str, ...] = ('число', 'чётное', 'нечётное', 'красное', 'чёрное')
+GOOSE_KINDS: dict[str, type[Goose]] = {'war': WarGoose, 'honk': HonkGoose}
+SUCCESS_PROBABILITY: dict[type[Goose], Callable[[int], float]] = {
+    WarGoose: WarGoose.steal_probability,
+    HonkGoose: HonkGoose.honk_probability,
+}
+
+T = TypeVar('T')
+
+
+class SimulationConfig:
+    """
+    Параметры headless-симуляции казино.
+
+    Attributes:
+        players: Пары (имя, начальный баланс) игроков
+        geese: Тройки (имя, тип 'war' или 'honk', громкость гоготания) гусей
+        bet_value: Размер ставки игрока (ограничивается его балансом)
+        win_balance: Баланс, при достижении которого игроки побеждают
+        min_honk_volume: Минимальная громкость пересозданного гуся
+        max_honk_volume: Максимальная громкость пересозданного гуся
+        columnar: Хранить игроков и гусей в столбцах (PlayerStore, GooseStore)
+        next_event: Выполнять step_many планировщиком следующего события
+    """
+
+    def __init__(
+        self,
+        players: list[tuple[str, int]],
+        geese: list[tuple[str, str, int]],
+        bet_value: int = 10,
+        win_balance: int = WIN_BALANCE,
+        min_honk_volume: int = 1,
+        max_honk_volume: int = 10,
+        columnar: bool = False,
+        next_event: bool = False,
+    ) -> None:
+        """
+        Инициализация конфигурации.
+
+        Args:
+            players: Пары (имя, начальный баланс) игроков
+            geese: Тройки (имя, тип 'war' или 'honk', громкость) гусей
+            bet_value: Размер ставки игрока
+            win_balance: Баланс победы игроков
+            min_honk_volume: Минимальная громкость пересозданного гуся
+            max_honk_volume: Максимальная громкость пересозданного гуся
+            columnar: Хранить игроков и гусей в столбцах
+            next_event: Пропускать шаги без изменений одним броском
+
+        Raises:
+            ValueError: Если тип гуся неизвестен или ставка не положительна
+        """
+        for _, kind, _ in geese:
+            if kind not in GOOSE_KINDS:
+                raise ValueError(f'Неизвестный тип гуся: {kind}')
+        if bet_value <= 0:
+            raise ValueError('Ставка должна быть положительной')
+        self.players = list(players)
+        self.geese = list(geese)
+        self.bet_value = bet_value
+        self.win_balance = win_balance
+        self.min_honk_volume = min_honk_volume
+        self.max_honk_volume = max_honk_volume
+        self.columnar = columnar
+        self.next_event = next_event
+
+
+class SimulationResult:
+    """
+    Итог headless-симуляции.
+
+    Attributes:
+        steps: Количество выполненных шагов
+        winner: 'players', 'geese' или None, если шаги закончились раньше
+        winner_name: Имя игрока, достигшего баланса победы
+        player_balances: Финальные балансы оставшихся игроков
+        goose_balances: Финальные балансы гусей
+        bankrupt_players: Имена игроков в порядке банкротства
+        action_counts: Количество вызовов каждого действия
+    """
+
+    def __init__(
+        self,
+        steps: int,
+        winner: str | None,
+        winner_name: str | None,
+        player_balances: dict[str, int],
+        goose_balances: dict[str, int],
+        bankrupt_players: list[str],
+        action_counts: dict[str, int],
+    ) -> None:
+        """
+        Инициализация результата.
+
+        Args:
+            steps: Количество выполненных шагов
+            winner: Победившая сторона или None
+            winner_name: Имя победившего игрока или None
+            player_balances: Финальные балансы игроков
+            goose_balances: Финальные балансы гусей
+            bankrupt_players: Имена обанкротившихся игроков
+            action_counts: Количество вызовов каждого действия
+        """
+        self.steps = steps
+        self.winner = winner
+        self.winner_name = winner_name
+        self.player_balances = player_balances
+        self.goose_balances = goose_balances
+        self.bankrupt_players = bankrupt_players
+        self.action_counts = action_counts
+
+    @property
+    def total_goose_loot(self) -> int:
+        """
+        Суммарная добыча всех гусей.
+
+        Returns:
+            Сумма балансов гусей
+        """
+        return sum(self.goose_balances.values())
+
+
+class GooseRates:
+    """
+    Сводка гусей для планировщика следующего события.
+
+    Хранит количество гусей каждого типа по громкости и наибольшую
+    вероятность удачи по типу. Планировщик разыгрывает попытки типа
+    с этой наибольшей вероятностью и принимает случайного гуся с долей
+    его собственной удачи (прореживание), поэтому сводка меняет частоты,
+    только когда появляется более удачливый гусь или уходит последний
+    гусь с наибольшей удачей. Сводка привязана к коллекции и её
+    mod_count: если гусей добавили или удалили в обход движка, она
+    строится заново.
+
+    Attributes:
+        collection: Коллекция гусей, по которой построена сводка
+        version: mod_count коллекции на момент сводки
+        volumes: Количество гусей по типу и громкости
+        ceilings: Наибольшая вероятность удачи по типу
+        changed: Менялись ли наибольшие вероятности с момента, когда
+            планировщик сбросил флаг
+    """
+
+    def __init__(self) -> None:
+        """Инициализация пустой сводки."""
+        self.collection: BaseCollection | None = None
+        self.version = -1
+        self.volumes: dict[type[Goose], dict[int, int]] = {}
+        self.ceilings: dict[type[Goose], float] = {}
+        self.clear()
+
+    def clear(self) -> None:
+        """Очистка сводки без привязки к коллекции."""
+        for kind in SUCCESS_PROBABILITY:
+            self.volumes[kind] = {}
+            self.ceilings[kind] = 0.0
+        self.collection = None
+        self.version = -1
+        self.changed = True
+
+    def sync(self, collection: BaseCollection) -> None:
+        """
+        Перестройка сводки, если коллекция сменилась или изменилась.
+
+        Args:
+            collection: Коллекция гусей казино
+        """
+        if collection is self.collection and collection.mod_count == self.version:
+            return
+        self.clear()
+        for goose in collection:
+            self.add(goose)
+        self.collection = collection
+        self.version = collection.mod_count
+
+    def add(self, goose: Goose) -> None:
+        """
+        Учёт нового гуся.
+
+        Args:
+            goose: Гусь
+        """
+        kind = WarGoose if isinstance(goose, WarGoose) else HonkGoose
+        volume = goose.honk_volume
+        volumes = self.volumes[kind]
+        if volume in volumes:
+            volumes[volume] += 1
+            return
+        volumes[volume] = 1
+        probability = SUCCESS_PROBABILITY[kind](volume)
+        if probability > self.ceilings[kind]:
+            self.ceilings[kind] = probability
+            self.changed = True
+
+    def remove(self, goose: Goose) -> None:
+        """
+        Учёт удалённого гуся; вызывается до удаления из казино.
+
+        Args:
+            goose: Гусь
+        """
+        kind = WarGoose if isinstance(goose, WarGoose) else HonkGoose
+        volume = goose.honk_volume
+        volumes = self.volumes[kind]
+        if volumes[volume] > 1:
+            volumes[volume] -= 1
+            return
+        del volumes[volume]
+        probability = SUCCESS_PROBABILITY[kind]
+        ceiling = self.ceilings[kind]
+        if probability(volume) < ceiling:
+            return
+        ceiling = max(map(probability, volumes), default=0.0)
+        if ceiling != self.ceilings[kind]:
+            self.ceilings[kind] = ceiling
+            self.changed = True
+
+
+class SimulationEngine:
+    """
+    Симуляция казино без терминального ввода-вывода.
+
+    Выполняет тот же набор действий, что и интерактивная симуляция
+    (war_goose_attack, honk_goose_do_honk, recreate_goose, player_bet),
+    но выбирает всех участников случайно и не ждёт пользователя.
+
+    Attributes:
+        config: Конфигурация симуляции
+        casino: Текущее казино
+        rng: Генератор случайных чисел текущего запуска
+        sink: Приёмник событий симуляции
+        instrumentation: Счётчики действий или None
+        step: Количество выполненных шагов
+        winner: Победившая сторона или None
+        winner_name: Имя победившего игрока или None
+    """
+
+    def __init__(
+        self,
+        config: SimulationConfig,
+        sink: EventSink | None = None,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
+        """
+        Инициализация движка.
+
+        Args:
+            config: Конфигурация симуляции
+            sink: Приёмник событий; по умолчанию события не создаются
+            instrumentation: Счётчики для команд и методов казино
+
+        Raises:
+            ValueError: Если планировщик следующего события включён вместе
+                с приёмником событий или счётчиками
+        """
+        self.config = config
+        self.sink = sink if sink is not None else NullSink()
+        self.goose_store: GooseStore | None = None
+        if config.columnar:
+            player_store = PlayerStore()
+            goose_store = self.goose_store = GooseStore()
+            self.casino = Casino(
+                ChipCollection(),
+                ColumnarPlayerCollection(player_store),
+                ColumnarGooseCollection(goose_store),
+                IndexDictChip(),
+                ColumnarIndexDictPlayer(player_store),
+                ColumnarIndexDictGoose(goose_store),
+            )
+        else:
+            self.casino = Casino(
+                ChipCollection(),
+                IndexedPlayerCollection(),
+                IndexedGooseCollection(),
+                IndexDictChip(),
+                IndexDictPlayer(),
+                IndexDictGoose(),
+            )
+        self.goose_rates = GooseRates()
+        self.watcher = ThresholdWatcher(0, config.win_balance)
+        self.casino.add_balance_listener(self.watcher.on_balance_change)
+        self.commands: dict[int, Callable[[], Player | None]] = {
+            1: self.war_goose_attack,
+            2: self.honk_goose_do_honk,
+            3: self.recreate_goose,
+            4: self.player_bet,
+        }
+        self.instrumentation = instrumentation
+        if instrumentation is not None:
+            instrumentation.instrument_casino(self.casino)
+            self.commands = instrumentation.instrument_commands(self.commands)
+        self._check_next_event()
+        self.reset()
+
+    def reset(self, seed: int | None = None, rng: RandomSource | None = None) -> None:
+        """
+        Заполнение казино по конфигурации.
+
+        Казино создаётся один раз и при повторных запусках очищается,
+        а не пересоздаётся.
+
+        Args:
+            seed: Сид генератора случайных чисел
+            rng: Готовый генератор (например, из SeedSequence); важнее сида
+        """
+        self.rng: RandomSource = rng if rng is not None else random.Random(seed)
+        self.casino.clear()
+        self.watcher.clear()
+        self.casino.rng = self.rng
+        if self.goose_store is not None:
+            self.goose_store.rng = self.rng
+        for name, balance in self.config.players:
+            self.casino.add_player(Player(name, balance))
+        for name, kind, honk_volume in self.config.geese:
+            self.casino.add_goose(GOOSE_KINDS[kind](name, honk_volume, self.rng))
+        self.step = 0
+        self.goose_counter = 0
+        self.winner: str | None = None
+        self.winner_name: str | None = None
+        self.bankrupt_players: list[str] = []
+        self.action_counts = {command.__name__: 0 for command in self.commands.values()}
+
+    def run(
+        self, steps: int, seed: int | None = None, rng: RandomSource | None = None
+    ) -> SimulationResult:
+        """
+        Запуск симуляции с начала.
+
+        Args:
+            steps: Максимальное количество шагов
+            seed: Сид генератора случайных чисел
+            rng: Готовый генератор; важнее сида
+
+        Returns:
+            Результат симуляции
+        """
+        self.reset(seed, rng)
+        return self.advance(steps)
+
+    def advance(self, steps: int) -> SimulationResult:
+        """
+        Продолжение текущей симуляции.
+
+        Args:
+            steps: Максимальное количество дополнительных шагов
+
+        Returns:
+            Результат симуляции на момент остановки
+        """
+        self.step_many(steps)
+        return self.result()
+
+    def step_many(self, steps: int) -> None:
+        """
+        Продолжение текущей симуляции без построения результата.
+
+        Args:
+            steps: Максимальное количество дополнительных шагов
+        """
+        if self.config.next_event:
+            self.step_events(steps)
+            return
+        commands = [(command.__name__, command) for command in self.commands.values()]
+        action_counts = self.action_counts
+        watcher = self.watcher
+        uniform = self.rng.random
+        for _ in range(steps):
+            if self.winner is not None:
+                break
+            name, command = commands[int(uniform() * 4)]
+            action_counts[name] += 1
+            self.step += 1
+            try:
+                command()
+            except ValueError:
+                continue
+            if watcher:
+                self.settle()
+        self.sink.flush()
+
+    def step_events(self, steps: int) -> None:
+        """
+        Продолжение текущей симуляции планировщиком следующего события.
+
+        В step_many шаг выбирает одно из четырёх действий равновероятно,
+        но кража и крик удаются не всегда, а без игроков или без гусей
+        нужного типа действие ничего не меняет. Здесь по GooseRates
+        считается вероятность того, что шаг может изменить состояние,
+        и число пустых шагов до такого шага разыгрывается одним
+        геометрическим броском. Попытка кражи или крика выбирает гуся
+        равновероятно и удаётся с вероятностью его удачи, делённой на
+        наибольшую по типу, поэтому распределение исходов, номеров шагов
+        и action_counts совпадает с step_many. Случайные числа
+        расходуются иначе, и с тем же сидом итог другой. Неудачные
+        попытки не порождают событий, а обёртки Instrumentation над
+        командами не вызываются, поэтому планировщик работает только
+        без приёмника событий и счётчиков.
+
+        Args:
+            steps: Максимальное количество дополнительных шагов
+
+        Raises:
+            ValueError: Если подключены приёмник событий или счётчики
+        """
+        self._check_next_event()
+        casino = self.casino
+        players = casino.player_collection
+        geese = casino.goose_collection
+        index = casino.index_dict_goose
+        rates = self.goose_rates
+        rates.sync(geese)
+        names = [command.__name__ for command in self.commands.values()]
+        action_counts = self.action_counts
+        rng = self.rng
+        uniform = rng.random
+        steal_probability = WarGoose.steal_probability
+        honk_probability = HonkGoose.honk_probability
+        log = math.log
+        end = self.step + steps
+        stale = True
+        while self.winner is None and self.step < end:
+            if stale or rates.changed:
+                # Пороги меняются только вместе с наибольшей удачей гусей
+                # или после банкротства, а не на каждом шаге.
+                alive = 1.0 if players.items else 0.0
+                war = alive * rates.ceilings[WarGoose]
+                honk = alive * rates.ceilings[HonkGoose]
+                recreate = 1.0 if geese.items else 0.0
+                misses = (1.0 - war, 1.0 - honk, 1.0 - recreate, 1.0 - alive)
+                honk += war
+                recreate += honk
+                total = recreate + alive
+                scale = math.log1p(-total / 4) if 0.0 < total < 4.0 else 0.0
+                stale = rates.changed = False
+            # Один бросок, как в step_many, выбирает действие и сразу
+            # служит порогом удачи гуся. Пустой шаг относится к действию
+            # тем же броском, а следующий бросок либо выбирает событие,
+            # либо геометрически задаёт длину оставшейся пустой серии.
+            choice = uniform() * 4
+            if choice >= total:
+                choice -= total
+                action = 0
+                while action < 3 and choice >= misses[action]:
+                    choice -= misses[action]
+                    action += 1
+                action_counts[names[action]] += 1
+                self.step += 1
+                if self.step == end:
+                    break
+                choice = uniform() * 4
+                if choice >= total:
+                    left = end - self.step
+                    skipped = int(log(1.0 - choice / 4) / scale) if scale else left
+                    skipped = min(max(skipped, 1), left)
+                    self._count_idle(names, skipped, misses)
+                    self.step += skipped
+                    if skipped == left:
+                        break
+                    choice = uniform() * total
+            self.step += 1
+            if choice < war:
+                action_counts[names[0]] += 1
+                goose: Goose = index.random_war_goose(rng)
+                if choice >= steal_probability(goose.honk_volume):
+                    continue
+                try:
+                    self._attack(
+                        'war_goose_attack', goose, casino.war_goose_steal_chip, False
+                    )
+                except ValueError:
+                    continue
+            elif choice < honk:
+                action_counts[names[1]] += 1
+                goose = index.random_honk_goose(rng)
+                if choice - war >= honk_probability(goose.honk_volume):
+                    continue
+                try:
+                    self._attack(
+                        'honk_goose_do_honk', goose, casino.honk_goose_honk, False
+                    )
+                except ValueError:
+                    continue
+            elif choice < recreate:
+                action_counts[names[2]] += 1
+                old_goose = self._pick(geese.items)
+                rates.remove(old_goose)
+                rates.add(self._replace_goose(old_goose))
+                rates.version = geese.mod_count
+            else:
+                action_counts[names[3]] += 1
+                try:
+                    self.player_bet()
+                except ValueError:
+                    continue
+            if self.watcher:
+                self.settle()
+                stale = True
+        self.sink.flush()
+
+    def result(self) -> SimulationResult:
+        """
+        Формирование результата по текущему состоянию.
+
+        Returns:
+            Результат симуляции
+        """
+        return SimulationResult(
+            steps=self.step,
+            winner=self.winner,
+            winner_name=self.winner_name,
+            player_balances={p.name: p.balance for p in self.casino.player_collection},
+            goose_balances={g.name: g.balance for g in self.casino.goose_collection},
+            bankrupt_players=list(self.bankrupt_players),
+            action_counts=dict(self.action_counts),
+        )
+
+    def check_player(self, player: Player) -> None:
+        """
+        Проверка условий окончания игры для изменившегося игрока.
+
+        Нужна только при изменении баланса в обход казино: изменения
+        через казино наблюдатель получает сам.
+
+        Args:
+            player: Игрок, баланс которого изменился
+        """
+        self.watcher.on_balance_change(player)
+        self.settle()
+
+    def settle(self) -> None:
+        """
+        Обработка игроков, пересёкших пороги баланса.
+
+        Наблюдатель сообщает только об игроках, чей баланс изменился,
+        поэтому проверка не обходит всю коллекцию.
+        """
+        for player in self.watcher.drain_bankrupt():
+            self.casino.remove_player(player)
+            self.bankrupt_players.append(player.name)
+            if self.sink.enabled:
+                balance = player.balance
+                self.sink.emit(
+                    SimulationEvent(
+                        self.step,
+                        'bankrupt',
+                        player=player.name,
+                        player_before=balance,
+                        player_after=balance,
+                    )
+                )
+            if len(self.casino.player_collection) == 0:
+                self.winner = 'geese'
+        if self.watcher.winners and self.winner is None:
+            player = next(iter(self.watcher.winners.values()))
+            self.winner = 'players'
+            self.winner_name = player.name
+
+    def war_goose_attack(self) -> Player | None:
+        """
+        Действие: случайный боевой гусь атакует случайного игрока.
+
+        Returns:
+            Атакованный игрок или None, если атаковать некому
+
+        Raises:
+            ValueError: Если боевых гусей нет или кража не удалась
+        """
+        if not self.casino.player_collection.items:
+            return None
+        try:
+            goose = self.casino.index_dict_goose.random_war_goose(self.rng)
+        except ValueError as error:
+            if self.sink.enabled:
+                self.sink.emit(
+                    SimulationEvent(
+                        self.step, 'war_goose_attack', ok=False, message=str(error)
+                    )
+                )
+            raise
+        return self._attack('war_goose_attack', goose, self.casino.war_goose_steal_chip)
+
+    def honk_goose_do_honk(self) -> Player | None:
+        """
+        Действие: случайный гогочущий гусь кричит на случайного игрока.
+
+        Returns:
+            Напуганный игрок или None, если кричать некому
+
+        Raises:
+            ValueError: Если гогочущих гусей нет или гусь промахнулся
+        """
+        if not self.casino.player_collection.items:
+            return None
+        try:
+            goose = self.casino.index_dict_goose.random_honk_goose(self.rng)
+        except ValueError as error:
+            if self.sink.enabled:
+                self.sink.emit(
+                    SimulationEvent(
+                        self.step, 'honk_goose_do_honk', ok=False, message=str(error)
+                    )
+                )
+            raise
+        return self._attack('honk_goose_do_honk', goose, self.casino.honk_goose_honk)
+
+    def recreate_goose(self) -> None:
+        """Действие: случайный гусь заменяется новым случайным гусем."""
+        if not self.casino.goose_collection.items:
+            return None
+        self._replace_goose(self._pick(self.casino.goose_collection.items))
+        return None
+
+    def _replace_goose(self, old_goose: Goose) -> Goose:
+        """
+        Замена гуся новым случайным гусем.
+
+        Args:
+            old_goose: Заменяемый гусь
+
+        Returns:
+            Новый гусь
+        """
+        self.goose_counter += 1
+        kind = WarGoose if self.rng.random() < 0.5 else HonkGoose
+        low = self.config.min_honk_volume
+        honk_volume = low + int(
+            self.rng.random() * (self.config.max_honk_volume - low + 1)
+        )
+        new_goose = kind(f'Goose#{self.goose_counter}', honk_volume, self.rng)
+        if not self.sink.enabled:
+            self.casino.recreate_goose(old_goose, new_goose)
+            return new_goose
+        # Столбцовое хранилище отдаёт строку старого гуся новому,
+        # поэтому имя и баланс читаются до замены.
+        old_name = old_goose.name
+        balance = old_goose.balance
+        self.casino.recreate_goose(old_goose, new_goose)
+        self.sink.emit(
+            SimulationEvent(
+                self.step,
+                'recreate_goose',
+                goose=old_name,
+                goose_before=balance,
+                goose_after=balance,
+                new_goose=new_goose.name,
+            )
+        )
+        return new_goose
+
+    def player_bet(self) -> Player | None:
+        """
+        Действие: случайный игрок делает ставку случайного типа.
+
+        Returns:
+            Игрок, сделавший ставку, или None, если игроков нет
+        """
+        if not self.casino.player_collection.items:
+            return None
+        player = self._pick(self.casino.player_collection.items)
+        bet_value = min(self.config.bet_value, player.balance)
+        bet_type: int | str = self._pick(BET_TYPES)
+        if bet_type == 'число':
+            bet_type = int(self.rng.random() * 37)
+        if self.sink.enabled:
+            self._observe(
+                'player_bet',
+                None,
+                player,
+                self.casino.player_bet,
+                player.name,
+                bet_value,
+                bet_type,
+            )
+        else:
+            self.casino.player_bet(player.name, bet_value, bet_type)
+        return player
+
+    def _attack(
+        self,
+        action: str,
+        goose: Goose,
+        method: Callable[..., Any],
+        *args: Any,
+    ) -> Player:
+        """
+        Нападение гуся на случайного игрока.
+
+        Args:
+            action: Название действия
+            goose: Нападающий гусь
+            method: Метод казино, принимающий имена гуся и игрока
+            *args: Дополнительные аргументы метода
+
+        Returns:
+            Атакованный игрок
+
+        Raises:
+            ValueError: Если нападение не удалось
+        """
+        player = self._pick(self.casino.player_collection.items)
+        if self.sink.enabled:
+            self._observe(action, goose, player, method, goose.name, player.name, *args)
+        else:
+            method(goose.name, player.name, *args)
+        return player
+
+    def _check_next_event(self) -> None:
+        """
+        Проверка, что планировщик следующего события ничего не потеряет.
+
+        Raises:
+            ValueError: Если next_event включён вместе с приёмником событий
+                или счётчиками
+        """
+        if self.config.next_event and (
+            self.sink.enabled or self.instrumentation is not None
+        ):
+            raise ValueError('next_event несовместим с приёмником событий и счётчиками')
+
+    def _count_idle(
+        self, names: list[str], count: int, misses: tuple[float, ...]
+    ) -> None:
+        """
+        Распределение пропущенных пустых шагов по действиям.
+
+        Пустой шаг приходится на действие с вероятностью, пропорциональной
+        доле его пустых исходов, как и в пошаговом цикле. Один шаг
+        разыгрывается одним броском, а серия делится между действиями
+        одним полиномиальным броском за время, не зависящее от её длины.
+
+        Args:
+            names: Названия действий в порядке misses
+            count: Количество пустых шагов
+            misses: Вероятность, что выбранное действие ничего не изменит
+        """
+        action_counts = self.action_counts
+        if count > 1:
+            for name, skipped in zip(
+                names, multinomial(self.rng, count, misses), strict=True
+            ):
+                action_counts[name] += skipped
+            return
+        choice = self.rng.random() * sum(misses)
+        action = 0
+        while action < len(misses) - 1 and choice >= misses[action]:
+            choice -= misses[action]
+            action += 1
+        action_counts[names[action]] += 1
+
+    def _observe(
+        self,
+        action: str,
+        goose: Goose | None,
+        player: Player,
+        method: Callable[..., Any],
+        *args: Any,
+    ) -> None:
+        """
+        Выполнение действия казино с отправкой события в приёмник.
+
+        Сумма события для кражи равна добыче гуся, для ставки
+        изменению баланса игрока. Неудачное действие тоже порождает
+        событие, после чего ошибка пробрасывается дальше.
+
+        Args:
+            action: Название действия
+            goose: Участвующий гусь или None
+            player: Участвующий игрок
+            method: Метод казино
+            *args: Аргументы метода
+
+        Raises:
+            ValueError: Если действие казино не удалось
+        """
+        goose_name = goose.name if goose is not None else None
+        player_before = player.balance
+        goose_before = goose.balance if goose is not None else 0
+        try:
+            method(*args)
+        except ValueError as error:
+            self.sink.emit(
+                SimulationEvent(
+                    self.step,
+                    action,
+                    goose_name,
+                    player.name,
+                    0,
+                    player_before,
+                    player_before,
+                    goose_before,
+                    goose_before,
+                    ok=False,
+                    message=str(error),
+                )
+            )
+            raise
+        player_after = player.balance
+        if goose is None:
+            goose_after = 0
+            amount = player_after - player_before
+        else:
+            goose_after = goose.balance
+            amount = goose_after - goose_before
+        self.sink.emit(
+            SimulationEvent(
+                self.step,
+                action,
+                goose_name,
+                player.name,
+                amount,
+                player_before,
+                player_after,
+                goose_before,
+                goose_after,
+            )
+        )
+
+    def _pick(self, items: Sequence[T]) -> T:
+        """
+        Быстрый равновероятный выбор элемента.
+
+        Использует один вызов random() вместо цепочки randint/choice,
+        что заметно ускоряет горячий цикл симуляции.
+
+        Args:
+            items: Непустая последовательность
+
+        Returns:
+            Случайный элемент
+        """
+        return items[int(self.rng.random() * len(items))]
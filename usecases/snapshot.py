@@ -0,0 +1,529 @@
+import mmap
+import struct
+from array import array
+from typing import Any, Sequence
+
+import numpy as np
+
+from domain.casino_entities import Chip, Goose, HonkGoose, Player, WarGoose
+from repository.columnar_storage import (
+    GOOSE_TAG_HONK,
+    GOOSE_TAG_WAR,
+    ColumnarCollection,
+    ColumnarIndexDictGoose,
+)
+from usecases.casino import Casino
+from usecases.simulation import SimulationEngine
+
+SNAPSHOT_MAGIC = b'CSNP'
+SNAPSHOT_VERSION = 1
+
+FLAG_ENGINE = 1
+FLAG_WEIGHTS = 2
+
+WINNERS: tuple[str | None, ...] = (None, 'players', 'geese')
+
+_HEADER = struct.Struct('<4sHH')
+_COUNTS = struct.Struct('<9q')
+_RNG_TAIL = struct.Struct('<qqd')
+_ENGINE = struct.Struct('<4q')
+_RNG_WORDS = 625
+_ITEM = 8
+
+
+class _Writer:
+    """
+    Последовательная запись секций с выравниванием на 8 байт.
+
+    Attributes:
+        file: Открытый на запись файл
+        size: Количество записанных байт
+    """
+
+    def __init__(self, file: Any) -> None:
+        """
+        Инициализация записи.
+
+        Args:
+            file: Открытый на запись двоичный файл
+        """
+        self.file = file
+        self.size = 0
+
+    def write(self, data: bytes) -> None:
+        """
+        Запись байтов с дополнением до границы 8 байт.
+
+        Args:
+            data: Байты секции
+        """
+        self.file.write(data)
+        padding = -len(data) % _ITEM
+        if padding:
+            self.file.write(b'\0' * padding)
+        self.size += len(data) + padding
+
+    def column(self, typecode: str, values: Any) -> None:
+        """
+        Запись столбца фиксированной ширины.
+
+        Args:
+            typecode: Код типа array ('q' или 'd')
+            values: Значения столбца
+        """
+        self.write(array(typecode, values).tobytes())
+
+
+class _Reader:
+    """
+    Последовательное чтение секций из отображённого в память файла.
+
+    Attributes:
+        view: Представление всего файла
+        offset: Смещение следующей секции
+    """
+
+    def __init__(self, view: memoryview) -> None:
+        """
+        Инициализация чтения.
+
+        Args:
+            view: Представление файла
+        """
+        self.view = view
+        self.offset = 0
+
+    def unpack(self, layout: struct.Struct) -> tuple[Any, ...]:
+        """
+        Чтение структуры фиксированного размера.
+
+        Args:
+            layout: Формат структуры
+
+        Returns:
+            Поля структуры
+        """
+        fields = layout.unpack_from(self.view, self.offset)
+        self.offset += layout.size + (-layout.size % _ITEM)
+        return fields
+
+    def raw(self, size: int) -> memoryview:
+        """
+        Чтение блока байтов без копирования.
+
+        Args:
+            size: Размер блока
+
+        Returns:
+            Представление блока
+        """
+        block = self.view[self.offset : self.offset + size]
+        self.offset += size + (-size % _ITEM)
+        return block
+
+    def column(self, typecode: str, count: int) -> 'array[Any]':
+        """
+        Копирование столбца фиксированной ширины одним memcpy.
+
+        Args:
+            typecode: Код типа array ('q' или 'd')
+            count: Количество значений
+
+        Returns:
+            Столбец
+        """
+        column = array(typecode)
+        with self.raw(count * _ITEM) as block:
+            column.frombytes(block)
+        return column
+
+
+def save_snapshot(
+    path: str, casino: Casino, engine: SimulationEngine | None = None
+) -> int:
+    """
+    Запись полного состояния казино в двоичный снимок.
+
+    Снимок версионирован. Все имена лежат в одной таблице строк
+    (UTF-8, разделитель NUL) в порядке секций, а балансы, громкости и
+    порядок гусей каждого типа в столбцах int64, поэтому загрузка
+    сводится к отображению файла в память и копированию столбцов.
+    Сохраняются состояние генератора, порядок коллекций и порядок
+    гусей в индексе, так что продолженный запуск совпадает с
+    непрерванным до бита.
+
+    Args:
+        path: Путь к файлу
+        casino: Казино
+        engine: Движок, чьи счётчики тоже нужно сохранить; его казино
+            должно совпадать с casino
+
+    Returns:
+        Размер снимка в байтах
+
+    Raises:
+        ValueError: Если состояние генератора нельзя сохранить, имя
+            содержит NUL или движок относится к другому казино
+    """
+    if engine is not None and engine.casino is not casino:
+        raise ValueError('Движок относится к другому казино')
+    rng: Any = casino.rng
+    if not hasattr(rng, 'getstate'):
+        raise ValueError('Состояние генератора нельзя сохранить')
+    version, state, gauss = rng.getstate()
+
+    chips = list(casino.chip_collection)
+    player_names, player_balances = _player_columns(casino)
+    goose_names, goose_columns, war_order, honk_order = _goose_columns(casino)
+    weights = casino.chip_theft_weights
+
+    flags = FLAG_WEIGHTS if weights is not None else 0
+    actions: list[tuple[str, int]] = []
+    bankrupt: list[str] = []
+    winner_name: list[str] = []
+    if engine is not None:
+        flags |= FLAG_ENGINE
+        actions = list(engine.action_counts.items())
+        bankrupt = engine.bankrupt_players
+        if engine.winner_name is not None:
+            winner_name.append(engine.winner_name)
+
+    strings = [chip.colour for chip in chips]
+    strings += player_names
+    strings += goose_names
+    strings += bankrupt
+    strings += [name for name, _ in actions]
+    strings += winner_name
+    text = '\0'.join(strings)
+    if text.count('\0') != max(len(strings) - 1, 0):
+        raise ValueError('Имя не может содержать символ NUL')
+    blob = text.encode()
+
+    with open(path, 'wb') as file:
+        writer = _Writer(file)
+        writer.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, flags))
+        writer.write(
+            _COUNTS.pack(
+                len(strings),
+                len(blob),
+                len(chips),
+                len(player_names),
+                len(goose_names),
+                len(war_order) // _ITEM,
+                len(honk_order) // _ITEM,
+                len(bankrupt),
+                len(actions),
+            )
+        )
+        writer.column('q', state)
+        writer.write(_RNG_TAIL.pack(version, gauss is not None, gauss or 0.0))
+        writer.write(blob)
+
+        writer.column('q', [chip.value for chip in chips])
+        if weights is not None:
+            writer.column('d', [weights.get(chip.colour, 1.0) for chip in chips])
+        writer.write(player_balances)
+        for column in goose_columns:
+            writer.write(column)
+        writer.write(war_order)
+        writer.write(honk_order)
+
+        if engine is not None:
+            writer.write(
+                _ENGINE.pack(
+                    engine.step,
+                    engine.goose_counter,
+                    WINNERS.index(engine.winner),
+                    len(winner_name),
+                )
+            )
+            writer.column('q', [count for _, count in actions])
+        return writer.size
+
+
+def load_snapshot(
+    path: str, casino: Casino, engine: SimulationEngine | None = None
+) -> None:
+    """
+    Восстановление состояния казино из снимка.
+
+    Файл отображается в память, столбцы копируются целиком, а
+    коллекции и индексы перестраиваются за один проход каждый. Для
+    столбцового казино балансы и громкости сразу становятся столбцами
+    хранилищ, объекты игроков и гусей не создаются.
+
+    Args:
+        path: Путь к файлу
+        casino: Казино, в которое загружается состояние; его генератор
+            должен поддерживать setstate
+        engine: Движок, счётчики которого нужно восстановить; его казино
+            должно совпадать с casino
+
+    Raises:
+        ValueError: Если файл не является снимком, версия неизвестна,
+            движок относится к другому казино или в снимке нет
+            состояния движка
+    """
+    if engine is not None and engine.casino is not casino:
+        raise ValueError('Движок относится к другому казино')
+    rng: Any = casino.rng
+    if not hasattr(rng, 'setstate'):
+        raise ValueError('Состояние генератора нельзя восстановить')
+    with (
+        open(path, 'rb') as file,
+        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+        memoryview(mapped) as view,
+    ):
+        reader = _Reader(view)
+        magic, version, flags = reader.unpack(_HEADER)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError('Файл не является снимком казино')
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f'Неизвестная версия снимка: {version}')
+        if engine is not None and not flags & FLAG_ENGINE:
+            raise ValueError('В снимке нет состояния движка')
+        (
+            string_count,
+            blob_size,
+            chip_count,
+            player_count,
+            goose_count,
+            war_count,
+            honk_count,
+            bankrupt_count,
+            action_count,
+        ) = reader.unpack(_COUNTS)
+
+        state = tuple(reader.column('q', _RNG_WORDS))
+        rng_version, has_gauss, gauss = reader.unpack(_RNG_TAIL)
+        with reader.raw(blob_size) as block:
+            strings = str(block, 'utf-8').split('\0') if string_count else []
+
+        chip_values = reader.column('q', chip_count)
+        weights = reader.column('d', chip_count) if flags & FLAG_WEIGHTS else None
+        player_balances = reader.column('q', player_count)
+        goose_kinds = reader.column('q', goose_count)
+        goose_volumes = reader.column('q', goose_count)
+        goose_balances = reader.column('q', goose_count)
+        war_order = reader.column('q', war_count)
+        honk_order = reader.column('q', honk_count)
+        if flags & FLAG_ENGINE:
+            step, goose_counter, winner, has_winner_name = reader.unpack(_ENGINE)
+            action_counts = reader.column('q', action_count)
+
+    chip_colours, player_names, goose_names, rest = _split(
+        strings, (chip_count, player_count, goose_count)
+    )
+    rng.setstate((rng_version, state, gauss if has_gauss else None))
+    chips = [
+        Chip(colour, value)
+        for colour, value in zip(chip_colours, chip_values, strict=True)
+    ]
+    casino.chip_collection.rebuild(chips)
+    casino.index_dict_chip.rebuild(chips)
+    casino.set_chip_theft_weights(
+        None
+        if weights is None
+        else {chip.colour: weight for chip, weight in zip(chips, weights, strict=True)}
+    )
+    _load_players(casino, player_names, player_balances)
+    _load_geese(
+        casino,
+        goose_names,
+        goose_kinds,
+        goose_volumes,
+        goose_balances,
+        war_order,
+        honk_order,
+    )
+
+    if engine is not None:
+        engine.rng = rng
+        engine.watcher.clear()
+        engine.step = step
+        engine.goose_counter = goose_counter
+        engine.winner = WINNERS[winner]
+        engine.winner_name = rest[-1] if has_winner_name else None
+        engine.bankrupt_players = rest[:bankrupt_count]
+        engine.action_counts = dict(
+            zip(
+                rest[bankrupt_count : bankrupt_count + action_count],
+                action_counts,
+                strict=True,
+            )
+        )
+
+
+def _split(strings: list[str], counts: Sequence[int]) -> list[list[str]]:
+    """
+    Разбиение таблицы строк на секции.
+
+    Args:
+        strings: Таблица строк
+        counts: Размеры секций по порядку
+
+    Returns:
+        Строки каждой секции и оставшиеся строки последним элементом
+    """
+    sections = []
+    start = 0
+    for count in counts:
+        sections.append(strings[start : start + count])
+        start += count
+    sections.append(strings[start:])
+    return sections
+
+
+def _gather(column: 'array[int]', order: 'array[int]') -> bytes:
+    """
+    Выборка значений столбца по идентификаторам в формате int64.
+
+    Args:
+        column: Столбец хранилища
+        order: Идентификаторы в нужном порядке
+
+    Returns:
+        Байты столбца int64
+    """
+    values = np.frombuffer(column, dtype=np.dtype(column.typecode))
+    ids = np.frombuffer(order, dtype=np.int64)
+    return values[ids].astype(np.int64).tobytes()
+
+
+def _player_columns(casino: Casino) -> tuple[list[str], bytes]:
+    """
+    Имена и балансы игроков в порядке коллекции.
+
+    Args:
+        casino: Казино
+
+    Returns:
+        Имена и байты столбца балансов
+    """
+    collection = casino.player_collection
+    if isinstance(collection, ColumnarCollection):
+        store = collection.items.store
+        order = collection.items.order
+        names = store.names
+        return [names[i] for i in order], _gather(store.balances, order)
+    players = list(collection.snapshot())
+    balances = array('q', [player.balance for player in players])
+    return [player.name for player in players], balances.tobytes()
+
+
+def _goose_columns(casino: Casino) -> tuple[list[str], list[bytes], bytes, bytes]:
+    """
+    Столбцы гусей в порядке коллекции и порядок гусей каждого типа.
+
+    Args:
+        casino: Казино
+
+    Returns:
+        Имена, байты столбцов (тип, громкость, баланс) и номера
+        боевых и гогочущих гусей в порядке индекса
+    """
+    collection = casino.goose_collection
+    index = casino.index_dict_goose
+    if isinstance(collection, ColumnarCollection) and isinstance(
+        index, ColumnarIndexDictGoose
+    ):
+        store = collection.items.store
+        order = collection.items.order
+        positions = collection.items.positions
+        names = store.names
+        return (
+            [names[i] for i in order],
+            [
+                _gather(store.kinds, order),
+                _gather(store.honk_volumes, order),
+                _gather(store.balances, order),
+            ],
+            _gather(positions, index.war_ids),
+            _gather(positions, index.honk_ids),
+        )
+    geese = list(collection.snapshot())
+    positions_by_name = {goose.name: i for i, goose in enumerate(geese)}
+    kinds = [
+        GOOSE_TAG_WAR if isinstance(goose, WarGoose) else GOOSE_TAG_HONK
+        for goose in geese
+    ]
+    war_order = [positions_by_name[goose.name] for goose in index.war_geese]
+    honk_order = [positions_by_name[goose.name] for goose in index.honk_geese]
+    return (
+        [goose.name for goose in geese],
+        [
+            array('q', kinds).tobytes(),
+            array('q', [goose.honk_volume for goose in geese]).tobytes(),
+            array('q', [goose.balance for goose in geese]).tobytes(),
+        ],
+        array('q', war_order).tobytes(),
+        array('q', honk_order).tobytes(),
+    )
+
+
+def _load_players(casino: Casino, names: list[str], balances: 'array[int]') -> None:
+    """
+    Загрузка игроков в коллекцию и индекс.
+
+    Args:
+        casino: Казино
+        names: Имена игроков в порядке коллекции
+        balances: Балансы игроков
+    """
+    collection = casino.player_collection
+    if isinstance(collection, ColumnarCollection):
+        collection.items.store.load(names, balances)
+        collection.rebuild_from_store()
+        return
+    players = [
+        Player(name, balance) for name, balance in zip(names, balances, strict=True)
+    ]
+    collection.rebuild(players)
+    casino.index_dict_player.rebuild(players)
+
+
+def _load_geese(
+    casino: Casino,
+    names: list[str],
+    kinds: Sequence[int],
+    volumes: 'array[int]',
+    balances: 'array[int]',
+    war_order: 'array[int]',
+    honk_order: 'array[int]',
+) -> None:
+    """
+    Загрузка гусей в коллекцию и индекс с порядком гусей по типам.
+
+    Args:
+        casino: Казино
+        names: Имена гусей в порядке коллекции
+        kinds: Метки типа GOOSE_TAG_WAR или GOOSE_TAG_HONK
+        volumes: Громкость гоготания
+        balances: Балансы гусей
+        war_order: Номера боевых гусей в порядке индекса
+        honk_order: Номера гогочущих гусей в порядке индекса
+    """
+    collection = casino.goose_collection
+    index = casino.index_dict_goose
+    if isinstance(collection, ColumnarCollection) and isinstance(
+        index, ColumnarIndexDictGoose
+    ):
+        store = collection.items.store
+        store.load(names, array('b', kinds), volumes, balances)
+        store.rng = casino.rng
+        collection.rebuild_from_store()
+        index.rebuild_ids(war_order, honk_order)
+        return
+    geese: list[Goose] = []
+    for name, kind, volume, balance in zip(
+        names, kinds, volumes, balances, strict=True
+    ):
+        goose_type = WarGoose if kind == GOOSE_TAG_WAR else HonkGoose
+        goose = goose_type(name, volume, casino.rng)
+        goose.balance = balance
+        geese.append(goose)
+    collection.rebuild(geese)
+    index.rebuild(
+        [geese[i] for i in war_order],  # type: ignore[misc]
+        [geese[i] for i in honk_order],  # type: ignore[misc]
+    )
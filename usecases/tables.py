@@ -0,0 +1,174 @@
+from typing import Any
+
+from domain.casino_entities import Goose, Player
+from domain.roulette import encode_bet, payout_multiplier
+from repository.casino_collections import BetBook
+from usecases.simulation import SimulationConfig, SimulationEngine
+
+ATTACK_KINDS = ('war', 'honk')
+
+
+class CasinoTable:
+    """
+    Стол казино, обрабатывающий запросы клиентов пакетами.
+
+    Все ставки пакета попадают в одну книгу ставок и разыгрываются
+    одним вращением колеса (Casino.play_round), нападения гусей
+    выполняются по порядку, а статус отражает состояние после пакета.
+    Банкроты снимаются со стола один раз в конце пакета.
+
+    Attributes:
+        engine: Движок, создавший и заполнивший казино стола
+        casino: Казино стола
+        bet_book: Книга ставок текущего пакета
+        rounds: Количество сыгранных раундов рулетки
+    """
+
+    def __init__(self, config: SimulationConfig, seed: int | None = None) -> None:
+        """
+        Создание стола по конфигурации симуляции.
+
+        Args:
+            config: Игроки и гуси стола
+            seed: Сид генератора стола
+        """
+        self.engine = SimulationEngine(config)
+        self.engine.reset(seed)
+        self.casino = self.engine.casino
+        self.bet_book = BetBook()
+        self.rounds = 0
+
+    def process(self, requests: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Обработка пакета запросов.
+
+        Запрос содержит поле op ('bet', 'attack' или 'status') и
+        параметры операции. Ошибка отдельного запроса не прерывает
+        пакет и возвращается в его ответе.
+
+        Args:
+            requests: Запросы в порядке поступления
+
+        Returns:
+            Ответы в том же порядке; у каждого есть поле ok, у неудачных
+            ещё поле error с причиной
+        """
+        responses: list[dict[str, Any]] = [{} for _ in requests]
+        bets: list[tuple[dict[str, Any], Player, int, int]] = []
+        statuses = []
+        for request, response in zip(requests, responses, strict=True):
+            op = request.get('op')
+            try:
+                if op == 'bet':
+                    bets.append((response, *self._place_bet(request)))
+                elif op == 'attack':
+                    response.update(self._attack(request))
+                elif op == 'status':
+                    statuses.append((request, response))
+                else:
+                    raise ValueError(f'Неизвестная операция: {op}')
+            except (ValueError, KeyError, TypeError) as error:
+                response.update(ok=False, error=str(error))
+
+        if bets:
+            number = self.casino.play_round(self.bet_book).number
+            self.rounds += 1
+            for response, player, bet_value, code in bets:
+                response.update(
+                    ok=True,
+                    number=number,
+                    payout=bet_value * payout_multiplier(code, number),
+                    balance=player.balance,
+                )
+        if self.engine.watcher:
+            self.engine.settle()
+        for request, response in statuses:
+            response.update(self._status(request))
+        return responses
+
+    def _place_bet(self, request: dict[str, Any]) -> tuple[Player, int, int]:
+        """
+        Размещение ставки в книге пакета.
+
+        Args:
+            request: Запрос с полями player, value и bet
+
+        Returns:
+            Игрок, размер ставки и код ставки
+
+        Raises:
+            ValueError: Если ставка некорректна или игрок не найден
+            KeyError: Если в запросе нет нужного поля
+        """
+        name = request['player']
+        bet_value = int(request['value'])
+        if bet_value <= 0:
+            raise ValueError('Ставка должна быть положительной')
+        self.casino.place_bet(self.bet_book, name, bet_value, request['bet'])
+        player = self.casino.search_player(name)
+        return player, bet_value, encode_bet(request['bet'])
+
+    def _attack(self, request: dict[str, Any]) -> dict[str, Any]:
+        """
+        Нападение случайного гуся нужного типа на игрока.
+
+        Args:
+            request: Запрос с полем kind ('war' или 'honk') и
+                необязательным полем player; без него игрок случайный
+
+        Returns:
+            Ответ с именами участников, добычей гуся и балансом игрока
+
+        Raises:
+            ValueError: Если тип неизвестен, гусей или игроков нет,
+                игрок не найден или нападение не удалось
+        """
+        kind = request.get('kind', 'war')
+        if kind not in ATTACK_KINDS:
+            raise ValueError(f'Неизвестный тип гуся: {kind}')
+        casino = self.casino
+        name = request.get('player')
+        if name is None:
+            items = casino.player_collection.items
+            if not items:
+                raise ValueError('За столом нет игроков')
+            name = items[int(casino.rng.random() * len(items))].name
+        goose: Goose
+        if kind == 'war':
+            goose = casino.random_war_goose()
+            amount = casino.war_goose_steal_chip(goose.name, name).value
+        else:
+            goose = casino.random_honk_goose()
+            amount = casino.honk_goose_honk(goose.name, name)
+        return {
+            'ok': True,
+            'goose': goose.name,
+            'player': name,
+            'amount': amount,
+            'balance': casino.search_player_balance(name),
+        }
+
+    def _status(self, request: dict[str, Any]) -> dict[str, Any]:
+        """
+        Состояние стола или одного игрока.
+
+        Args:
+            request: Запрос с необязательным полем player
+
+        Returns:
+            Ответ с количеством игроков, гусей и раундов, а для
+            игрока ещё с его балансом или ошибкой, если игрока нет
+        """
+        status: dict[str, Any] = {
+            'ok': True,
+            'players': len(self.casino.player_collection),
+            'geese': len(self.casino.goose_collection),
+            'rounds': self.rounds,
+        }
+        name = request.get('player')
+        if name is not None:
+            try:
+                status['balance'] = self.casino.search_player_balance(name)
+            except ValueError as error:
+                return {'ok': False, 'error': str(error)}
+        return status
@@ -0,0 +1,310 @@
+import struct
+from bisect import bisect_right
+from typing import BinaryIO
+
+from domain.casino_entities import Goose, HonkGoose, Player, WarGoose
+from repository.columnar_storage import GOOSE_TAG_HONK, GOOSE_TAG_WAR
+from usecases.casino import Casino
+from usecases.events import ACTION_CODES, EventSink, SimulationEvent
+
+TAPE_MAGIC = b'CTAP'
+TAPE_VERSION = 1
+
+TAPE_ADD_PLAYER = 100
+TAPE_ADD_GOOSE = 101
+TAPE_NAME = 255
+NO_NAME = -1
+
+_WAR = ACTION_CODES['war_goose_attack']
+_HONK = ACTION_CODES['honk_goose_do_honk']
+_RECREATE = ACTION_CODES['recreate_goose']
+_BET = ACTION_CODES['player_bet']
+_BANKRUPT = ACTION_CODES['bankrupt']
+
+_HEADER = struct.Struct('<4sH2x')
+_RECORD = struct.Struct('<qBBBxiiiiq4x')
+
+
+def _padding(size: int) -> int:
+    """
+    Дополнение до границы 8 байт.
+
+    Args:
+        size: Размер данных
+
+    Returns:
+        Количество байтов дополнения
+    """
+    return -size % 8
+
+
+class TapeSink(EventSink):
+    """
+    Запись хода симуляции на ленту для детерминированного повтора.
+
+    Лента только дописывается и состоит из записей фиксированного
+    размера: шаг, код действия, успех, тип и громкость нового гуся,
+    номера имён и сумма. Сумма уже содержит исход всех случайных
+    выборов (украденный номинал, крик, выигрыш ставки), поэтому повтор
+    не вызывает генератор. Имя записывается один раз, при первом
+    появлении, отдельной записью TAPE_NAME, дальше используется номер.
+    В начало ленты попадает состав казино на момент создания приёмника.
+
+    Attributes:
+        file: Файл ленты, открытый с буфером buffer_size байт
+        casino: Казино, за которым ведётся запись
+        names: Номер имени по самому имени
+    """
+
+    def __init__(self, path: str, casino: Casino, buffer_size: int = 1 << 16) -> None:
+        """
+        Открытие ленты и запись текущего состава казино.
+
+        Args:
+            path: Путь к файлу ленты
+            casino: Казино, за которым ведётся запись
+            buffer_size: Размер буфера записи в байтах
+        """
+        self.file: BinaryIO = open(path, 'wb', buffering=buffer_size)
+        self.casino = casino
+        self.names: dict[str, int] = {}
+        self.file.write(_HEADER.pack(TAPE_MAGIC, TAPE_VERSION))
+        for player in casino.iter_player():
+            self._write(0, TAPE_ADD_PLAYER, player=player.name, amount=player.balance)
+        for goose in casino.iter_goose():
+            self._write(
+                0,
+                TAPE_ADD_GOOSE,
+                new_goose=goose,
+                amount=goose.balance,
+            )
+
+    def _name_id(self, name: str | None) -> int:
+        """
+        Номер имени с записью нового имени на ленту.
+
+        Args:
+            name: Имя или None
+
+        Returns:
+            Номер имени или NO_NAME
+        """
+        if name is None:
+            return NO_NAME
+        name_id = self.names.get(name)
+        if name_id is None:
+            name_id = self.names[name] = len(self.names)
+            encoded = name.encode()
+            self.file.write(
+                _RECORD.pack(0, TAPE_NAME, 0, 0, name_id, 0, 0, 0, len(encoded))
+            )
+            self.file.write(encoded + b'\0' * _padding(len(encoded)))
+        return name_id
+
+    def _write(
+        self,
+        step: int,
+        code: int,
+        ok: bool = True,
+        goose: str | None = None,
+        player: str | None = None,
+        new_goose: Goose | None = None,
+        amount: int = 0,
+    ) -> None:
+        """
+        Запись одной записи ленты.
+
+        Args:
+            step: Номер шага
+            code: Код действия
+            ok: Удалось ли действие
+            goose: Имя гуся
+            player: Имя игрока
+            new_goose: Новый гусь (тип и громкость пишутся в запись)
+            amount: Сумма действия или начальный баланс
+        """
+        kind = volume = 0
+        new_name = None
+        if new_goose is not None:
+            kind = GOOSE_TAG_WAR if isinstance(new_goose, WarGoose) else GOOSE_TAG_HONK
+            volume = new_goose.honk_volume
+            new_name = new_goose.name
+        self.file.write(
+            _RECORD.pack(
+                step,
+                code,
+                ok,
+                kind,
+                self._name_id(goose),
+                self._name_id(player),
+                self._name_id(new_name),
+                volume,
+                amount,
+            )
+        )
+
+    def emit(self, event: SimulationEvent) -> None:
+        """
+        Запись события.
+
+        Args:
+            event: Событие симуляции
+        """
+        new_goose = None
+        if event.new_goose is not None:
+            new_goose = self.casino.index_dict_goose.search_goose(event.new_goose)
+        self._write(
+            event.step,
+            ACTION_CODES[event.action],
+            event.ok,
+            event.goose,
+            event.player,
+            new_goose,
+            event.amount,
+        )
+
+    def flush(self) -> None:
+        """Сброс буфера в файл."""
+        self.file.flush()
+
+    def close(self) -> None:
+        """Закрытие файла."""
+        self.file.close()
+
+
+class TapeReplayer:
+    """
+    Повтор ленты на казино без генератора и вывода.
+
+    Лента читается целиком, записи применяются к казино как готовые
+    изменения балансов и состава. Неудачные действия ничего не меняют
+    и при чтении отбрасываются. Перемотка вперёд применяет только
+    недостающие записи, назад очищает казино и применяет ленту с начала.
+
+    Attributes:
+        casino: Казино, на котором повторяется лента
+        names: Имена по номеру
+        records: Записи ленты, меняющие казино
+        steps: Шаги записей для поиска места перемотки
+        last_step: Последний шаг на ленте
+        position: Номер следующей записи
+        step: Шаг, до которого лента применена
+    """
+
+    def __init__(self, path: str, casino: Casino) -> None:
+        """
+        Чтение ленты и применение начального состава.
+
+        Args:
+            path: Путь к файлу ленты
+            casino: Казино для повтора; его игроки и гуси будут заменены
+
+        Raises:
+            ValueError: Если файл не является лентой или версия неизвестна
+        """
+        with open(path, 'rb') as file:
+            data = file.read()
+        if len(data) < _HEADER.size:
+            raise ValueError('Файл не является лентой симуляции')
+        magic, version = _HEADER.unpack_from(data)
+        if magic != TAPE_MAGIC:
+            raise ValueError('Файл не является лентой симуляции')
+        if version != TAPE_VERSION:
+            raise ValueError(f'Неизвестная версия ленты: {version}')
+        self.casino = casino
+        self.names: list[str] = []
+        self.records: list[tuple[int, ...]] = []
+        self.last_step = 0
+        offset = _HEADER.size
+        while offset < len(data):
+            record = _RECORD.unpack_from(data, offset)
+            offset += _RECORD.size
+            if record[1] == TAPE_NAME:
+                length = record[8]
+                self.names.append(data[offset : offset + length].decode())
+                offset += length + _padding(length)
+            elif record[2] or record[1] == _RECREATE:
+                self.records.append(record)
+            else:
+                self.last_step = record[0]
+        if self.records:
+            self.last_step = max(self.last_step, self.records[-1][0])
+        self.steps = [record[0] for record in self.records]
+        self.rewind()
+
+    def rewind(self) -> None:
+        """Возврат казино к составу из начала ленты."""
+        self.casino.clear()
+        self.position = 0
+        self.step = -1
+        self.seek(0)
+
+    def seek(self, step: int) -> None:
+        """
+        Перемотка к состоянию после шага step.
+
+        Args:
+            step: Номер шага
+        """
+        if step < self.step:
+            self.rewind()
+        end = bisect_right(self.steps, step)
+        apply = self._apply
+        for record in self.records[self.position : end]:
+            apply(record)
+        self.position = end
+        self.step = step
+
+    def run(self) -> None:
+        """Применение всей ленты."""
+        self.seek(self.last_step)
+
+    def _apply(self, record: tuple[int, ...]) -> None:
+        """
+        Применение одной записи к казино.
+
+        Args:
+            record: Запись ленты
+        """
+        _, code, ok, kind, goose_id, player_id, new_id, volume, amount = record
+        casino = self.casino
+        names = self.names
+        if code == _WAR or code == _HONK:
+            if ok:
+                player = casino.index_dict_player.search_player(names[player_id])
+                goose = casino.index_dict_goose.search_goose(names[goose_id])
+                player.balance -= amount
+                goose.balance += amount
+        elif code == _BET:
+            if ok:
+                player = casino.index_dict_player.search_player(names[player_id])
+                player.balance += amount
+        elif code == _RECREATE:
+            old_goose = casino.index_dict_goose.search_goose(names[goose_id])
+            casino.recreate_goose(old_goose, self._goose(kind, names[new_id], volume))
+        elif code == _BANKRUPT:
+            casino.remove_player(
+                casino.index_dict_player.search_player(names[player_id])
+            )
+        elif code == TAPE_ADD_PLAYER:
+            casino.add_player(Player(names[player_id], amount))
+        elif code == TAPE_ADD_GOOSE:
+            goose = self._goose(kind, names[new_id], volume)
+            goose.balance = amount
+            casino.add_goose(goose)
+
+    def _goose(self, kind: int, name: str, volume: int) -> Goose:
+        """
+        Создание гуся по записи ленты.
+
+        Args:
+            kind: GOOSE_TAG_WAR или GOOSE_TAG_HONK
+            name: Имя гуся
+            volume: Громкость гоготания
+
+        Returns:
+            Новый гусь
+        """
+        if kind == GOOSE_TAG_WAR:
+            return WarGoose(name, volume, self.casino.rng)
+        return HonkGoose(name, volume, self.casino.rng)
@@ -0,0 +1,91 @@
+from typing import Iterable
+
+from domain.casino_entities import Player
+
+
+class ThresholdWatcher:
+    """
+    Отслеживание игроков, пересёкших пороги баланса.
+
+    Подписывается на изменения балансов в казино и запоминает только
+    тех игроков, чей баланс изменился и вышел за порог, поэтому
+    проверка окончания игры стоит O(изменившихся), а не O(игроков).
+
+    Attributes:
+        low: Баланс, при котором и ниже которого игрок банкрот
+        high: Баланс, при котором и выше которого игрок побеждает
+        bankrupt: Обанкротившиеся игроки по имени в порядке банкротства
+        winners: Достигшие баланса победы игроки по имени
+    """
+
+    def __init__(self, low: int = 0, high: int = 5000) -> None:
+        """
+        Инициализация наблюдателя.
+
+        Args:
+            low: Порог банкротства
+            high: Порог победы
+        """
+        self.low = low
+        self.high = high
+        self.bankrupt: dict[str, Player] = {}
+        self.winners: dict[str, Player] = {}
+
+    def __bool__(self) -> bool:
+        """
+        Есть ли игроки, пересёкшие пороги.
+
+        Returns:
+            True, если есть банкроты или победители
+        """
+        return bool(self.bankrupt or self.winners)
+
+    def on_balance_change(self, player: Player) -> None:
+        """
+        Обработка изменения баланса игрока.
+
+        Args:
+            player: Игрок, баланс которого изменился
+        """
+        balance = player.balance
+        if balance <= self.low:
+            self.bankrupt[player.name] = player
+            if self.winners:
+                self.winners.pop(player.name, None)
+        elif balance >= self.high:
+            self.winners[player.name] = player
+            if self.bankrupt:
+                self.bankrupt.pop(player.name, None)
+        elif self.bankrupt or self.winners:
+            self.bankrupt.pop(player.name, None)
+            self.winners.pop(player.name, None)
+
+    def scan(self, players: Iterable[Player]) -> None:
+        """
+        Проверка всех игроков заново.
+
+        Нужна после загрузки игроков в обход казино, например из снимка:
+        накопленное ранее сбрасывается.
+
+        Args:
+            players: Игроки казино
+        """
+        self.clear()
+        for player in players:
+            self.on_balance_change(player)
+
+    def drain_bankrupt(self) -> list[Player]:
+        """
+        Получение и сброс накопленных банкротов.
+
+        Returns:
+            Игроки в порядке банкротства
+        """
+        players = list(self.bankrupt.values())
+        self.bankrupt.clear()
+        return players
+
+    def clear(self) -> None:
+        """Сброс накопленных банкротов и победителей."""
+        self.bankrupt.clear()
+        self.winners.clear()